@@ -0,0 +1,111 @@
+"""
+Compares `search_str` lookups of the previous full scan, the current scan and the trigram search index
+on synthetic binlogs.
+
+Usage: python benchmark.py [--binlogs 4] [--rows 200000] [--search "doc-ab"]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import duckdb
+from mariadb_binlog_indexer import Indexer
+from mariadb_binlog_indexer.indexer import search_index
+
+TABLES = ["tabSales Invoice", "tabItem", "tabGL Entry", "tabStock Ledger Entry", "tabVersion", "tabComment"]
+
+
+def generate(base_path: str, db_name: str, binlogs: int, rows: int) -> list[str]:
+	db = duckdb.connect(os.path.join(base_path, db_name))
+	db.execute(
+		"CREATE TABLE query (binlog VARCHAR, db_name VARCHAR, table_name VARCHAR, timestamp INTEGER,"
+		" type VARCHAR, row_id INTEGER, event_size INTEGER)"
+	)
+	tables = ", ".join(f"'{table}'" for table in TABLES)
+	names = []
+	for b in range(binlogs):
+		binlog = f"mysql-bin.{b:06d}"
+		db.execute(
+			"CREATE OR REPLACE TEMP TABLE queries AS"
+			f" SELECT i::INTEGER AS id, [{tables}][1 + (hash(i, {b}) % {len(TABLES)})::INTEGER] AS table_name,"
+			f" format('{{:x}}', hash({b}, i)) AS value FROM range({rows}) t(i)"
+		)
+		queries_path = os.path.join(base_path, f"queries_{binlog}.parquet")
+		db.execute(
+			"COPY (SELECT id, format('UPDATE `{}` SET `modified` = ''{}'' WHERE `name` = ''DOC-{}''',"
+			f" table_name, value, value) AS query FROM queries) TO '{queries_path}' (FORMAT PARQUET)"
+		)
+		db.execute(
+			"INSERT INTO query SELECT ?, 'db', table_name, 1000 + id, 'UPDATE', id, 200 FROM queries",
+			[binlog],
+		)
+		names.append(binlog)
+	db.close()
+	return names
+
+
+def previous_search(indexer: Indexer, search_str: str) -> dict[str, list[int]]:
+	"""`get_row_ids` before the search index: sequential, IN list of ids and the string interpolated in SQL"""
+	result = indexer.get_row_ids(0, 2**31 - 1)
+	for binlog, row_ids in result.items():
+		parquet_file_path = os.path.join(indexer.base_path, f"queries_{binlog}.parquet")
+		result[binlog] = [
+			i[0]
+			for i in indexer._execute_query(
+				"parquet",
+				f"SELECT id FROM '{parquet_file_path}' WHERE id IN ? AND query ILIKE '%{search_str}%'",
+				[row_ids],
+			)
+		]
+	return result
+
+
+def timed(label: str, function):
+	start = time.perf_counter()
+	result = function()
+	print(f"{label:<32} {(time.perf_counter() - start) * 1000:>10.1f}ms")
+	return result
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument("--binlogs", type=int, default=4)
+	parser.add_argument("--rows", type=int, default=200000)
+	parser.add_argument("--search", default="doc-ab")
+	parser.add_argument("--skip-previous", action="store_true", help="Previous search is slow on many rows")
+	args = parser.parse_args()
+
+	base_path = tempfile.mkdtemp()
+	try:
+		binlogs = generate(base_path, "metadata.db", args.binlogs, args.rows)
+		indexer = Indexer(base_path, "metadata.db")
+
+		def search():
+			return indexer.get_row_ids(0, 2**31 - 1, search_str=args.search)
+
+		if not args.skip_previous:
+			previous = timed("previous full scan", lambda: previous_search(indexer, args.search))
+		scanned = timed("full scan", search)
+		for binlog in binlogs:
+			timed(f"build index {binlog}", lambda binlog=binlog: indexer._build_search_index(binlog))
+		indexed = timed("indexed (cold)", search)
+		timed("indexed (cached)", search)
+		search_index.cache_clear()
+
+		assert scanned == indexed, "Indexed search returned different rows"
+		if not args.skip_previous:
+			assert {binlog: sorted(ids) for binlog, ids in previous.items()} == {
+				binlog: sorted(ids) for binlog, ids in indexed.items()
+			}, "Previous search returned different rows"
+		print(f"{sum(len(ids) for ids in indexed.values())} matching rows")
+	finally:
+		shutil.rmtree(base_path)
+
+
+if __name__ == "__main__":
+	main()
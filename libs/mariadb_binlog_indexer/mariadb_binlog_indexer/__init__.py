@@ -0,0 +1,3 @@
+from .indexer import Indexer
+
+__all__ = ["Indexer"]
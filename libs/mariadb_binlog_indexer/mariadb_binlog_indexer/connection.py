@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import duckdb
+
+# Pooled metadata connections are closed after this many idle seconds, `add` and `remove` wait at most this long
+IDLE_TIMEOUT = 5
+LOCK_TIMEOUT = 5
+# A writer waiting for the exclusive lock creates this file next to the lock file. Readers then release their
+# shared locks as soon as they are idle and don't take new ones, so a steady stream of queries can't starve it.
+WRITER_MARKER_SUFFIX = ".writer"
+# Markers older than this were left behind by a crashed writer
+WRITER_MARKER_TIMEOUT = 60
+
+
+class PooledDatabase:
+	def __init__(self, database_path: str, lock_file_path: str):
+		self.database_path = database_path
+		self.lock_file_path = lock_file_path
+		# DuckDB doesn't allow a writer while any process has the database open, even read only.
+		# A shared lock on the indexer lock file is held for the lifetime of the connection,
+		# `add` and `remove` take it exclusively, see WRITER_MARKER_SUFFIX for how they get ahead of readers.
+		self.lock_fd = os.open(lock_file_path, os.O_RDWR | os.O_CREAT, 0o644)
+		try:
+			acquire_shared_lock(self.lock_fd, lock_file_path, LOCK_TIMEOUT)
+			self.connection = duckdb.connect(database=database_path, read_only=True)
+		except Exception:
+			os.close(self.lock_fd)
+			raise
+		self.in_use = 0
+		self.last_used = time.monotonic()
+
+	def close(self):
+		with contextlib.suppress(Exception):
+			self.connection.close()
+		with contextlib.suppress(Exception):
+			fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
+		os.close(self.lock_fd)
+
+
+class ConnectionPool:
+	"""One in memory connection for parquet files and one read only connection per metadata database.
+
+	Queries run on cursors of these connections, so threads can share them.
+	"""
+
+	def __init__(self, idle_timeout: float = IDLE_TIMEOUT):
+		self.idle_timeout = idle_timeout
+		self._lock = threading.Lock()
+		self._memory: duckdb.DuckDBPyConnection | None = None
+		self._databases: dict[str, PooledDatabase] = {}
+		self._reaper: threading.Timer | None = None
+
+	@contextlib.contextmanager
+	def cursor(self, database_path: str | None = None, lock_file_path: str | None = None):
+		"""Yields a cursor of the metadata database at `database_path`, or of the in memory connection."""
+		if database_path is None:
+			with self._lock:
+				if self._memory is None:
+					self._memory = duckdb.connect()
+				cursor = self._memory.cursor()
+			try:
+				yield cursor
+			finally:
+				cursor.close()
+			return
+
+		with self._lock:
+			database = self._databases.get(database_path)
+			if database is None:
+				database = self._databases[database_path] = PooledDatabase(database_path, lock_file_path)
+				self._schedule_reaper()
+			database.in_use += 1
+			cursor = database.connection.cursor()
+		try:
+			yield cursor
+		finally:
+			cursor.close()
+			with self._lock:
+				database.in_use -= 1
+				database.last_used = time.monotonic()
+				if not database.in_use and is_writer_waiting(database.lock_file_path):
+					self._discard(database_path, database)
+
+	def close(self, database_path: str):
+		"""Closes the pooled connection of the database, so this process can write to it."""
+		with self._lock:
+			database = self._databases.get(database_path)
+			if database and not database.in_use:
+				self._databases.pop(database_path).close()
+
+	def _discard(self, database_path: str, database: PooledDatabase):
+		if self._databases.get(database_path) is database:
+			self._databases.pop(database_path)
+		database.close()
+
+	def _schedule_reaper(self):
+		if self._reaper is None:
+			self._reaper = threading.Timer(self.idle_timeout, self._reap)
+			self._reaper.daemon = True
+			self._reaper.start()
+
+	def _reap(self):
+		with self._lock:
+			self._reaper = None
+			now = time.monotonic()
+			for path, database in list(self._databases.items()):
+				idle = now - database.last_used >= self.idle_timeout
+				if not database.in_use and (idle or is_writer_waiting(database.lock_file_path)):
+					self._databases.pop(path).close()
+			if self._databases:
+				self._schedule_reaper()
+
+
+class LRUCache:
+	def __init__(self, maxsize: int):
+		self.maxsize = maxsize
+		self._lock = threading.Lock()
+		self._data: OrderedDict = OrderedDict()
+
+	def get(self, key):
+		with self._lock:
+			if key not in self._data:
+				return None
+			self._data.move_to_end(key)
+			return self._data[key]
+
+	def set(self, key, value):
+		with self._lock:
+			self._data[key] = value
+			self._data.move_to_end(key)
+			while len(self._data) > self.maxsize:
+				self._data.popitem(last=False)
+
+	def clear(self):
+		with self._lock:
+			self._data.clear()
+
+
+def acquire_shared_lock(fd: int, lock_file_path: str, timeout: float):
+	deadline = time.monotonic() + timeout
+	while True:
+		if not is_writer_waiting(lock_file_path):
+			try:
+				fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+				return
+			except BlockingIOError:
+				pass
+		if time.monotonic() >= deadline:
+			raise TimeoutError("Timed out waiting for the indexer lock")
+		time.sleep(0.05)
+
+
+@contextlib.contextmanager
+def writer_waiting(lock_file_path: str):
+	"""Marks a writer as waiting for the exclusive lock on `lock_file_path` for the duration of the block."""
+	marker = f"{lock_file_path}{WRITER_MARKER_SUFFIX}"
+	with open(marker, "w"):
+		pass
+	try:
+		yield
+	finally:
+		with contextlib.suppress(FileNotFoundError):
+			os.remove(marker)
+
+
+def is_writer_waiting(lock_file_path: str) -> bool:
+	try:
+		modified = os.stat(f"{lock_file_path}{WRITER_MARKER_SUFFIX}").st_mtime
+	except FileNotFoundError:
+		return False
+	return time.time() - modified < WRITER_MARKER_TIMEOUT
+
+
+def get_database_version(database_path: str) -> tuple:
+	"""Changes whenever `add` or `remove` writes to the database."""
+	version = []
+	for path in (database_path, f"{database_path}.wal"):
+		try:
+			stat = os.stat(path)
+			version.append((stat.st_mtime_ns, stat.st_size))
+		except FileNotFoundError:
+			version.append(None)
+	return tuple(version)
+
+
+pool = ConnectionPool()
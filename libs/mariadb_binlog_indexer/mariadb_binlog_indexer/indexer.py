@@ -0,0 +1,607 @@
+# type: ignore
+from __future__ import annotations
+
+import contextlib
+import functools
+import math
+import os
+import subprocess
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
+
+import duckdb
+import filelock
+
+from .connection import LRUCache, get_database_version, pool, writer_waiting
+
+QUERY_TYPES = Literal["SELECT", "INSERT", "UPDATE", "DELETE", "OTHER"]
+
+# Only the head of a query goes into the search index, longer queries are always verified against parquet
+SEARCH_INDEX_MAX_QUERY_LENGTH = 4096
+# Trigram of queries longer than SEARCH_INDEX_MAX_QUERY_LENGTH
+UNINDEXED_TRIGRAM = ""
+SEARCH_WORKERS = 4
+
+timeline_cache = LRUCache(maxsize=64)
+
+
+class Indexer:
+	def __init__(
+		self,
+		base_path: str,
+		db_name: str,
+	):
+		self.indexer_lib = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib", "indexer")
+		self.base_path = base_path
+		self.db_name = db_name
+		self.logging = False
+		self._lock_file_path = os.path.join(self.base_path, "indexer.lock")
+		self._database_path = os.path.join(self.base_path, self.db_name)
+
+	def add(
+		self,
+		binlog_path: str,
+		mode: Literal["low-memory", "balanced", "high-compression"] = "balanced",
+		cpu_quota_percentage: int = 0,
+		memory_hard_limit: int = 0,
+		build_search_index: bool = False,
+	):
+		"""
+		NOTE: It's mandatory to enable linger for the user running this process for systemd-run to work properly.
+		You can enable it by running: loginctl enable-linger $USER
+
+		build_search_index: Also build a trigram index of the queries, used by `get_row_ids` for `search_str`
+		"""
+		with self._write_lock():
+			command = [
+				self.indexer_lib,
+				"add",
+				self.base_path,
+				binlog_path,
+				self.db_name,
+				mode,
+			]
+			if cpu_quota_percentage > 0 or memory_hard_limit > 0:
+				systemd_command = ["systemd-run", "--scope", "--user"]
+
+				if cpu_quota_percentage > 0:
+					systemd_command.extend(
+						[
+							"-p",
+							f"CPUQuota={cpu_quota_percentage}%",
+						]
+					)
+				if memory_hard_limit > 0:
+					systemd_command.extend(
+						[
+							"-p",
+							f"MemoryMax={memory_hard_limit}M",
+						]
+					)
+
+				command = [*systemd_command, *command]
+
+			env = os.environ.copy()
+			uid = os.getuid()
+			xdg_runtime = f"/run/user/{uid}"
+
+			env["XDG_RUNTIME_DIR"] = xdg_runtime
+			env["DBUS_SESSION_BUS_ADDRESS"] = f"unix:path={xdg_runtime}/bus"
+
+			result = subprocess.run(command, text=True, capture_output=True, check=False, env=env)
+			if result.returncode != 0:
+				raise Exception(
+					f"Failed to index binlog:\n\nStdout: {result.stdout}\nStderr: {result.stderr}"
+				)
+
+			binlog = os.path.basename(binlog_path)
+			if build_search_index:
+				self._build_search_index(binlog)
+			else:
+				# Stale index of a previous run of this binlog
+				with contextlib.suppress(FileNotFoundError):
+					os.remove(self._get_search_index_path(binlog))
+
+	def remove(self, binlog_path: str):
+		with self._write_lock():
+			result = subprocess.run(
+				[self.indexer_lib, "remove", self.base_path, binlog_path, self.db_name],
+				text=True,
+				capture_output=True,
+				check=False,
+			)
+			if result.returncode != 0:
+				raise Exception(
+					f"Failed to remove binlog from indexer:\n\nStdout: {result.stdout}\nStderr: {result.stderr}"
+				)
+			with contextlib.suppress(FileNotFoundError):
+				os.remove(self._get_search_index_path(os.path.basename(binlog_path)))
+
+	@contextlib.contextmanager
+	def _write_lock(self):
+		"""Holds the indexer lock exclusively, readers of other processes release it while we wait."""
+		pool.close(self._database_path)
+		lock = filelock.FileLock(self._lock_file_path)
+		with writer_waiting(self._lock_file_path):
+			lock.acquire()
+		try:
+			yield
+		finally:
+			lock.release()
+
+	def get_timeline(  # noqa: C901
+		self,
+		start_timestamp: int,
+		end_timestamp: int,
+		type: QUERY_TYPES | None = None,
+		database: str | None = None,
+		table: str | None = None,
+		event_size_comparator: Literal["gt", "lt"] | None = None,
+		event_size: int | None = None,
+	):
+		"""
+		Args:
+			start_timestamp: The start timestamp in seconds UTC
+			end_timestamp: The end timestamp in seconds UTC
+			type: The query type to filter (SELECT, INSERT, UPDATE, DELETE, OTHER)
+			database: The database name to filter (Optional)
+
+			Note:
+				start_timestamp and end_timestamp will be rounded to the nearest minute
+				In case of start_timestamp, it's the floor of the rounded value
+				In case of end_timestamp, it's the ceil of the rounded value
+
+				Also, difference between end_timestamp and start_timestamp should be at least 1 minute
+
+		Returns:
+			A dictionary of timeline information
+			Example:
+				{
+					"start_timestamp": 1677721600, // start timestamp in seconds UTC
+					"end_timestamp": 1677721660, // end timestamp in seconds UTC
+					"interval": 60, // interval in seconds
+					"results": {
+						"1677721600:1677721660": {
+							"SELECT": 100, // events count
+							"INSERT": 100, // events count
+							"UPDATE": 100, // events count
+							"DELETE": 100, // events count
+						}
+					},
+					"tables": ["test_table"], // list of tables appeared during the time range
+				}
+		"""
+
+		# Timestamp are in seconds
+		# Move start_timestamp to nearest minute
+		start_timestamp = math.floor(start_timestamp / 60) * 60
+		# Move end_timestamp to next nearest minute
+		end_timestamp = math.ceil(end_timestamp / 60) * 60
+
+		# If the time range is less than 1 minute, set it to 1 minute
+		if end_timestamp - start_timestamp < 60:
+			end_timestamp = start_timestamp + 60
+
+		# Split the time range in 30 slices
+		interval = math.ceil(((end_timestamp - start_timestamp) // 30) / 60) * 60
+		where_clause = ""
+		parameters = [interval, start_timestamp, end_timestamp, interval]
+
+		if type is not None:
+			where_clause += " AND q.type = ? "
+			parameters.append(type)
+
+		if database is not None:
+			where_clause += " AND q.db_name = ? "
+			parameters.append(database)
+
+		if table is not None:
+			# Check if it's a like search or exact match
+			if table.startswith("%") or table.endswith("%"):
+				where_clause += " AND q.table_name LIKE ? "
+			else:
+				where_clause += " AND q.table_name = ? "
+			parameters.append(table)
+
+		if event_size_comparator is not None and event_size is not None:
+			if event_size_comparator == "gt":
+				where_clause += " AND q.event_size >= ? "
+			elif event_size_comparator == "lt":
+				where_clause += " AND q.event_size <= ? "
+
+			if event_size_comparator in ["gt", "lt"]:
+				parameters.append(event_size)
+
+		# Zooming in and out of the dashboard asks for the same ranges again
+		cache_key = (
+			self._database_path,
+			get_database_version(self._database_path),
+			start_timestamp,
+			end_timestamp,
+			type,
+			database,
+			table,
+			event_size_comparator,
+			event_size,
+		)
+		if (timeline := timeline_cache.get(cache_key)) is not None:
+			return timeline
+
+		try:
+			query_result = self._execute_query(
+				"db",
+				f"""WITH time_intervals AS (
+					SELECT
+						generate_series AS start_ts,
+						generate_series + ? AS end_ts
+					FROM GENERATE_SERIES(?, ?, ?)
+				)
+				SELECT
+					t.start_ts,
+					t.end_ts,
+					q.type,
+					COUNT(q.type) AS events_count
+				FROM time_intervals t
+				JOIN query q
+					ON q.timestamp >= t.start_ts
+					AND q.timestamp < t.end_ts
+					{where_clause}
+				GROUP BY t.start_ts, t.end_ts, q.type
+				ORDER BY t.start_ts, q.type;""",
+				parameters,
+				raise_errors=True,
+			)
+			tables = self._get_tables(database, start_timestamp, end_timestamp, raise_errors=True)
+		except Exception:
+			# Empty for this request only, a cached failure would hide the data until the next write
+			query_result, tables, cacheable = [], [], False
+		else:
+			cacheable = True
+
+		result_map = {}
+		for row in query_result:
+			key = f"{row[0]}:{row[1]}"
+			if key not in result_map:
+				result_map[key] = {}
+
+			result_map[key][row[2]] = row[3]
+
+		timeline = {
+			"start_timestamp": start_timestamp,
+			"end_timestamp": end_timestamp,
+			"interval": interval,
+			"results": result_map,
+			"tables": tables,
+		}
+		if cacheable:
+			timeline_cache.set(cache_key, timeline)
+		return timeline
+
+	def get_row_ids(  # noqa: C901
+		self,
+		start_timestamp: int,
+		end_timestamp: int,
+		type: QUERY_TYPES | None = None,
+		database: str | None = None,
+		table: str | None = None,
+		search_str: str | None = None,
+		event_size_comparator: Literal["gt", "lt"] | None = None,
+		event_size: int | None = None,
+	) -> dict[str, list[int]]:
+		"""
+		Args:
+			start_timestamp: The start timestamp in seconds UTC
+			end_timestamp: The end timestamp in seconds UTC
+			type: The query type to filter (SELECT, INSERT, UPDATE, DELETE, OTHER)
+			database: The database name to filter (Optional)
+			table: The table name to filter (Optional)
+			search_str: The full text search string (Optional)
+
+		Returns:
+			A dictionary of binlog name and a list of row ids
+			Example:
+				{
+					"binlog_1": [101, 102, 103],
+					"binlog_2": [104, 105, 106],
+				}
+		"""
+		# First fetch all the row ids
+		where_clause = ""
+		parameters = [start_timestamp, end_timestamp]
+		if type is not None:
+			where_clause += " AND type = ? "
+			parameters.append(type)
+		if database is not None:
+			where_clause += " AND db_name = ? "
+			parameters.append(database)
+		if table is not None:
+			# Check if it's a like search or exact match
+			if table.startswith("%") or table.endswith("%"):
+				where_clause += " AND table_name LIKE ? "
+			else:
+				where_clause += " AND table_name = ? "
+			parameters.append(table)
+
+		if event_size_comparator is not None and event_size is not None:
+			if event_size_comparator == "gt":
+				where_clause += " AND event_size >= ? "
+			elif event_size_comparator == "lt":
+				where_clause += " AND event_size <= ? "
+
+			if event_size_comparator in ["gt", "lt"]:
+				parameters.append(event_size)
+
+		row_ids = [
+			i
+			for i in self._execute_query(
+				"db",
+				f"""
+				SELECT
+					row_id, binlog
+				FROM
+					query
+				WHERE
+					timestamp >= ?
+					AND timestamp < ?
+					{where_clause}
+				""",
+				parameters,
+			)
+		]
+
+		result = {}
+		for row_id, binlog in row_ids:
+			if binlog not in result:
+				result[binlog] = []
+
+			result[binlog].append(row_id)
+
+		# Now do full text search on parquet files
+		if search_str:
+			with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+				searches = {
+					binlog: executor.submit(self._search, binlog, ids, search_str)
+					for binlog, ids in result.items()
+				}
+				result = {binlog: search.result() for binlog, search in searches.items()}
+
+		return result
+
+	def _search(self, binlog: str, row_ids: list[int], search_str: str) -> list[int]:
+		"""Returns `row_ids` of the binlog whose query contains `search_str`, case insensitive."""
+		queries_path = self._get_queries_path(binlog)
+		if not os.path.exists(queries_path):
+			return row_ids
+
+		needle = search_str.lower()
+		index_path = self._get_search_index_path(binlog)
+		if len(needle) >= 3 and os.path.exists(index_path):
+			matches = search_index(index_path, queries_path, os.path.getmtime(index_path), needle)
+			return [row_id for row_id in row_ids if row_id in matches]
+
+		# A range filter is far cheaper for duckdb than a long IN list, exact ids are matched below
+		matches = {
+			i[0]
+			for i in self._execute_query(
+				"parquet",
+				"SELECT id FROM read_parquet(?) WHERE id BETWEEN ? AND ? AND contains(lower(query), ?)",
+				[queries_path, min(row_ids), max(row_ids), needle],
+			)
+		}
+		return [row_id for row_id in row_ids if row_id in matches]
+
+	def _build_search_index(self, binlog: str):
+		"""Writes (trigram, id) pairs of lowercased queries, sorted by trigram so lookups skip row groups."""
+		index_path = self._get_search_index_path(binlog)
+		temporary_path = f"{index_path}.tmp"
+		db = duckdb.connect()
+		try:
+			db.execute(
+				f"""
+				COPY (
+					WITH queries AS (
+						SELECT
+							id,
+							lower(left(query, {SEARCH_INDEX_MAX_QUERY_LENGTH})) AS text,
+							length(query) > {SEARCH_INDEX_MAX_QUERY_LENGTH} AS truncated
+						FROM read_parquet(?)
+					),
+					positions AS (
+						SELECT id, text, unnest(range(1, length(text) - 1)) AS position FROM queries
+					)
+					SELECT DISTINCT substr(text, position, 3) AS trigram, id FROM positions
+					UNION ALL
+					SELECT '{UNINDEXED_TRIGRAM}' AS trigram, id FROM queries WHERE truncated
+					ORDER BY trigram, id
+				) TO '{_quote(temporary_path)}' (FORMAT PARQUET, COMPRESSION ZSTD)
+				""",
+				[self._get_queries_path(binlog)],
+			)
+			os.replace(temporary_path, index_path)
+		finally:
+			with contextlib.suppress(Exception):
+				db.close()
+
+	def _get_queries_path(self, binlog: str) -> str:
+		return os.path.join(self.base_path, f"queries_{binlog}.parquet")
+
+	def _get_search_index_path(self, binlog: str) -> str:
+		return os.path.join(self.base_path, f"trigrams_{binlog}.parquet")
+
+	def get_queries(
+		self,
+		row_ids: dict[str, list[int]],
+		database: str | None = None,
+	) -> dict[dict[int, str]]:
+		"""
+		Args:
+			row_ids: A dictionary of binlog name and a list of row ids
+					{
+						"binlog_1": [101, 102, 103],
+						"binlog_2": [104, 105, 106],
+					}
+			database: The database name to filter the row ids
+
+		Returns:
+			A dictionary of binlog name and a dictionary of row id and query information
+			Example:
+				{
+					"binlog_1": {
+						101: [
+							"INSERT INTO `test`.`test_table` VALUES (1, 'test')", // query
+							"INSERT", // type
+							6788, // event_size
+							"test_db", // db_name
+							"test_table", // table_name
+							1677721600, // timestamp
+						]
+					}
+				}
+
+		"""
+		if database is not None:
+			filtered_row_ids = {}
+			# Filter out the row_ids that doesn't belong to the database
+			for binlog, selected_row_ids in row_ids.items():
+				filtered_row_ids[binlog] = [
+					i[0]
+					for i in self._execute_query(
+						"db",
+						"SELECT row_id FROM query WHERE binlog = ? AND db_name = ? AND row_id in ? order by timestamp",
+						[binlog, database, selected_row_ids],
+					)
+				]
+			row_ids = filtered_row_ids
+
+		# Fetch the query info
+		results = {}
+		for binlog, selected_row_ids in row_ids.items():
+			parquet_file_path = self._get_queries_path(binlog)
+			if not os.path.exists(parquet_file_path):
+				results[binlog] = {}
+				continue
+
+			# Fetch query from parquet file
+			results[binlog] = {
+				int(i[0]): [i[1]]
+				for i in self._execute_query(
+					"parquet",
+					f"SELECT id, query FROM '{parquet_file_path}' where id in ? limit 500",
+					[selected_row_ids],
+				)
+			}
+
+			# Fetch other info from db
+			data = self._execute_query(
+				"db",
+				"""
+				SELECT
+					row_id,
+					type,
+					event_size,
+					db_name,
+					table_name,
+					timestamp
+				FROM
+					query
+				WHERE
+					binlog = ?
+					AND row_id IN ?
+				""",
+				[binlog, selected_row_ids],
+			)
+
+			for row in data:
+				if row[0] not in results[binlog]:
+					continue
+				results[binlog][row[0]].extend([row[1], row[2], row[3], row[4], row[5]])
+		return results
+
+	def _get_tables(
+		self, database: str, start_timestamp: int, end_timestamp: int, raise_errors: bool = False
+	):
+		return [
+			x[0]
+			for x in self._execute_query(
+				"db",
+				"SELECT distinct table_name FROM query WHERE timestamp >= ? AND timestamp <= ? AND db_name = ?",
+				[start_timestamp, end_timestamp, database],
+				raise_errors,
+			)
+			if x[0] is not None and x[0] != ""
+		]
+
+	def _execute_query(
+		self,
+		source: Literal["db", "parquet"],
+		query: str,
+		params: list[str] | None = None,
+		raise_errors: bool = False,
+	):
+		if params is None:
+			params = []
+		result = []
+		try:
+			if source == "db":
+				cursor = pool.cursor(self._database_path, self._lock_file_path)
+			else:
+				cursor = pool.cursor()
+			with cursor as db:
+				result = db.execute(query, parameters=params).fetchall()
+		except Exception as e:
+			if self.logging:
+				print("Error executing query: ")
+				print("Query: ", query)
+				print("Parameters: ", str(params))
+				print("Error: ", e)
+				traceback.print_exc()
+			if raise_errors:
+				raise
+		return result
+
+
+@functools.lru_cache(maxsize=256)
+def search_index(index_path: str, queries_path: str, index_mtime: float, needle: str) -> frozenset[int]:
+	"""Ids of all queries in the binlog containing `needle`, `index_mtime` invalidates results of a rebuilt index."""
+	trigrams = list({needle[i : i + 3] for i in range(len(needle) - 2)})
+	with pool.cursor() as db:
+		counts = dict(
+			db.execute(
+				"SELECT trigram, count(*) FROM read_parquet(?) WHERE trigram IN ? GROUP BY trigram",
+				[index_path, trigrams],
+			).fetchall()
+		)
+		if len(counts) < len(trigrams):
+			# Some trigram is in no indexed query, only the unindexed tails can match
+			candidates = "SELECT id FROM read_parquet($index) WHERE trigram = $unindexed"
+			rarest = []
+		else:
+			# Intersecting the two rarest trigrams narrows enough, the rest is checked against the query itself
+			rarest = sorted(trigrams, key=counts.get)[:2]
+			candidates = " INTERSECT ".join(
+				f"SELECT id FROM read_parquet($index) WHERE trigram = $trigram_{i}"
+				for i in range(len(rarest))
+			)
+			candidates = (
+				f"({candidates}) UNION SELECT id FROM read_parquet($index) WHERE trigram = $unindexed"
+			)
+
+		rows = db.execute(
+			f"""
+			SELECT id FROM read_parquet($queries)
+			WHERE id IN ({candidates}) AND contains(lower(query), $needle)
+			""",
+			{
+				"index": index_path,
+				"queries": queries_path,
+				"unindexed": UNINDEXED_TRIGRAM,
+				"needle": needle,
+				**{f"trigram_{i}": trigram for i, trigram in enumerate(rarest)},
+			},
+		).fetchall()
+	return frozenset(row[0] for row in rows)
+
+
+def _quote(path: str) -> str:
+	return path.replace("'", "''")
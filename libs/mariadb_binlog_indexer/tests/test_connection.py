@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import duckdb
+from mariadb_binlog_indexer.connection import ConnectionPool, writer_waiting
+
+
+class TestConnectionPool(unittest.TestCase):
+	def setUp(self):
+		base_path = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, base_path)
+		self.database_path = os.path.join(base_path, "metadata.db")
+		self.lock_file_path = os.path.join(base_path, "indexer.lock")
+		duckdb.connect(self.database_path).close()
+		self.pool = ConnectionPool(idle_timeout=60)
+
+	def query(self):
+		with self.pool.cursor(self.database_path, self.lock_file_path) as db:
+			return db.execute("SELECT 1").fetchall()
+
+	def can_lock_exclusively(self) -> bool:
+		fd = os.open(self.lock_file_path, os.O_RDWR)
+		try:
+			fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+		except BlockingIOError:
+			return False
+		finally:
+			os.close(fd)
+		return True
+
+	def test_idle_connection_is_pooled_without_waiting_writer(self):
+		self.query()
+		self.assertIn(self.database_path, self.pool._databases)
+		self.assertFalse(self.can_lock_exclusively())
+		self.pool.close(self.database_path)
+
+	def test_waiting_writer_gets_the_lock_once_running_queries_finish(self):
+		with contextlib.ExitStack() as writer:
+			with self.pool.cursor(self.database_path, self.lock_file_path) as db:
+				writer.enter_context(writer_waiting(self.lock_file_path))
+				db.execute("SELECT 1").fetchall()
+				self.assertFalse(self.can_lock_exclusively())
+			self.assertNotIn(self.database_path, self.pool._databases)
+			self.assertTrue(self.can_lock_exclusively())
+
+	def test_readers_wait_while_writer_is_waiting(self):
+		with (
+			writer_waiting(self.lock_file_path),
+			patch("mariadb_binlog_indexer.connection.LOCK_TIMEOUT", 0.2),
+		):
+			self.assertRaises(TimeoutError, self.query)
+		self.assertEqual(self.query(), [(1,)])
+		self.pool.close(self.database_path)
+
+
+if __name__ == "__main__":
+	unittest.main()
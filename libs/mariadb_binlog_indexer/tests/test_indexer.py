@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import duckdb
+from mariadb_binlog_indexer.indexer import (
+	SEARCH_INDEX_MAX_QUERY_LENGTH,
+	Indexer,
+	search_index,
+	timeline_cache,
+)
+
+BINLOG = "mysql-bin.000001"
+
+
+class TestSearchIndex(unittest.TestCase):
+	def setUp(self):
+		self.base_path = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.base_path)
+		self.indexer = Indexer(self.base_path, "metadata.db")
+		search_index.cache_clear()
+
+	def write_queries(self, queries: list[str]):
+		db = duckdb.connect()
+		try:
+			db.execute("CREATE TABLE queries (id INTEGER, query VARCHAR)")
+			db.executemany("INSERT INTO queries VALUES (?, ?)", list(enumerate(queries, start=1)))
+			db.execute(f"COPY queries TO '{self.indexer._get_queries_path(BINLOG)}' (FORMAT PARQUET)")
+		finally:
+			db.close()
+
+	def search(self, search_str: str, row_ids: list[int]) -> list[int]:
+		return self.indexer._search(BINLOG, row_ids, search_str)
+
+	def test_index_matches_scan(self):
+		queries = [
+			"SELECT * FROM `tabUser` WHERE name = 'Administrator'",
+			"UPDATE `tabSingles` SET value = 'x' WHERE doctype = 'System Settings'",
+			"INSERT INTO `tabError Log` (name, method) VALUES ('a', 'b')",
+			"select name from tabuser",
+			"DELETE FROM `tabSessions` WHERE user = 'Guest'",
+		]
+		self.write_queries(queries)
+		row_ids = list(range(1, len(queries) + 1))
+		needles = ["tabuser", "Settings", "value = 'x'", "DELETE FROM", "no such query", "ab"]
+		scanned = {needle: self.search(needle, row_ids) for needle in needles}
+
+		self.indexer._build_search_index(BINLOG)
+
+		for needle in needles:
+			self.assertEqual(self.search(needle, row_ids), scanned[needle], needle)
+		self.assertEqual(scanned["tabuser"], [1, 4])
+
+	def test_queries_longer_than_index_limit_are_verified_against_parquet(self):
+		tail = "WHERE name = 'needle_past_the_limit'"
+		self.write_queries(["SELECT 1", "SELECT " + "x" * SEARCH_INDEX_MAX_QUERY_LENGTH + tail])
+		self.indexer._build_search_index(BINLOG)
+
+		self.assertEqual(self.search("needle_past_the_limit", [1, 2]), [2])
+		self.assertEqual(self.search("select", [1, 2]), [1, 2])
+
+	def test_rebuilt_index_invalidates_cached_results(self):
+		self.write_queries(["SELECT * FROM `tabUser`", "SELECT * FROM `tabRole`"])
+		self.indexer._build_search_index(BINLOG)
+		self.assertEqual(self.search("tabrole", [1, 2]), [2])
+		self.assertEqual(self.search("tabrole", [1, 2]), [2])
+		self.assertEqual(search_index.cache_info().hits, 1)
+
+		self.write_queries(["SELECT * FROM `tabRole`", "SELECT * FROM `tabUser`"])
+		self.indexer._build_search_index(BINLOG)
+		index_path = self.indexer._get_search_index_path(BINLOG)
+		mtime = os.path.getmtime(index_path) + 1
+		os.utime(index_path, (mtime, mtime))
+
+		self.assertEqual(self.search("tabrole", [1, 2]), [1])
+
+
+class TestTimeline(unittest.TestCase):
+	def setUp(self):
+		self.base_path = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.base_path)
+		self.indexer = Indexer(self.base_path, "metadata.db")
+		timeline_cache.clear()
+
+		db = duckdb.connect(self.indexer._database_path)
+		try:
+			db.execute(
+				"CREATE TABLE query (timestamp BIGINT, type VARCHAR, db_name VARCHAR, table_name VARCHAR, "
+				"event_size BIGINT)"
+			)
+			db.execute("INSERT INTO query VALUES (90, 'SELECT', 'site_db', 'tabUser', 100)")
+		finally:
+			db.close()
+
+	def test_failed_query_is_not_cached(self):
+		with patch("mariadb_binlog_indexer.indexer.pool.cursor", side_effect=duckdb.IOException("locked")):
+			failed = self.indexer.get_timeline(0, 600, database="site_db")
+		self.assertEqual(failed["results"], {})
+		self.assertEqual(failed["tables"], [])
+
+		timeline = self.indexer.get_timeline(0, 600, database="site_db")
+		self.assertEqual(timeline["results"], {"60:120": {"SELECT": 1}})
+		self.assertEqual(timeline["tables"], ["tabUser"])
+
+
+if __name__ == "__main__":
+	unittest.main()
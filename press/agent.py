@@ -17,11 +17,11 @@ import requests
 from frappe.utils.password import get_decrypted_password
 from requests.exceptions import HTTPError
 
+from press.agent_transport import get_request_context, get_session
 from press.utils import (
 	get_mariadb_root_password,
 	log_error,
 	sanitize_config,
-	servers_using_alternative_port_for_communication,
 )
 
 if TYPE_CHECKING:
@@ -53,8 +53,6 @@ class Agent:
 	def __init__(self, server, server_type="Server"):
 		self.server_type = server_type
 		self.server = server
-		self.__servers_using_alt_ports = servers_using_alternative_port_for_communication()
-		self.port = 443 if self.server not in self.__servers_using_alt_ports else 8443
 
 	def new_bench(self, bench: "Bench"):
 		settings = frappe.db.get_value(
@@ -936,18 +934,10 @@ class Agent:
 		return self.request("DELETE", path, data, raises=raises)
 
 	def _make_req(self, method, path, data, files, agent_job_id):
-		url = self._get_request_url(path)
-		password = get_decrypted_password(self.server_type, self.server, "agent_password")
-		headers = {"Authorization": f"bearer {password}", "X-Agent-Job-Id": agent_job_id}
-
-		verify = True
-		if frappe.conf.developer_mode and (
-			intermediate_ca := frappe.db.get_value(
-				"Press Settings", "Press Settings", "backbone_intermediate_ca"
-			)
-		):
-			root_ca = frappe.db.get_value("Certificate Authority", intermediate_ca, "parent_authority")
-			verify = frappe.get_doc("Certificate Authority", root_ca).certificate_file
+		context = get_request_context(self.server_type, self.server)
+		url = context["base_url"] + path
+		headers = {"Authorization": f"bearer {context['password']}", "X-Agent-Job-Id": agent_job_id}
+		session = get_session(self.server)
 
 		if files:
 			file_objects = {
@@ -957,8 +947,10 @@ class Agent:
 				for key, value in files.items()
 			}
 			file_objects["json"] = json.dumps(data).encode()
-			return requests.request(method, url, headers=headers, files=file_objects, verify=verify)
-		return requests.request(method, url, headers=headers, json=data, verify=verify, timeout=(10, 30))
+			return session.request(method, url, headers=headers, files=file_objects, verify=context["verify"])
+		return session.request(
+			method, url, headers=headers, json=data, verify=context["verify"], timeout=(10, 30)
+		)
 
 	def request(self, method, path, data=None, files=None, agent_job=None, raises=True):
 		self.raise_if_past_requests_have_failed()
@@ -1039,37 +1031,19 @@ class Agent:
 			frappe.new_doc("Agent Request Failure", **fields).insert(ignore_permissions=True)
 
 	def raw_request(self, method, path, data=None, raises=True, timeout=None):
-		url = self._get_request_url(path)
-		password = get_decrypted_password(self.server_type, self.server, "agent_password")
-		headers = {"Authorization": f"bearer {password}"}
+		context = get_request_context(self.server_type, self.server)
+		headers = {"Authorization": f"bearer {context['password']}"}
 		timeout = timeout or (10, 30)
-		response = requests.request(method, url, headers=headers, json=data, timeout=timeout)
+		response = get_session(self.server).request(
+			method, context["base_url"] + path, headers=headers, json=data, timeout=timeout
+		)
 		json_response = response.json()
 		if raises:
 			response.raise_for_status()
 		return json_response
 
 	def _get_request_url(self, path):
-		if self.server_type in ("Server", "Database Server"):
-			proxy = None
-			server_ip, server_private_ip, server_cluster = frappe.db.get_value(
-				self.server_type, self.server, ("ip", "private_ip", "cluster")
-			)
-			if not server_ip and server_private_ip and not frappe.flags.in_test:
-				proxy = frappe.db.get_value(
-					"Proxy Server",
-					{
-						"status": "Active",
-						"cluster": server_cluster,
-						"use_as_proxy_for_agent_and_metrics": 1,
-					},
-				)
-
-			if proxy:
-				proxy_port = 443 if proxy not in self.__servers_using_alt_ports else 8443
-				return f"https://{proxy}:{proxy_port}/{self.server}:{self.port}/agent/{path}"
-
-		return f"https://{self.server}:{self.port}/agent/{path}"
+		return get_request_context(self.server_type, self.server)["base_url"] + path
 
 	def should_skip_requests(self):
 		if self.server_type in ("Server", "Database Server", "Proxy Server") and frappe.db.get_value(
@@ -0,0 +1,135 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+"""Process-wide keep-alive HTTP sessions and request context for Agent calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import frappe
+import requests
+from frappe.utils.password import get_decrypted_password
+from requests.adapters import HTTPAdapter
+
+from press.utils import servers_using_alternative_port_for_communication
+
+if TYPE_CHECKING:
+	from frappe.model.document import Document
+
+CONTEXT_VERSION_KEY = "agent_request_context_version"
+POOL_SIZE = 4
+CONTEXT_FIELDS = ("ip", "private_ip", "cluster", "agent_password")
+# Changes made with `frappe.db.set_value` skip the hooks that invalidate contexts, this bounds how long
+# such a change can go unnoticed
+CONTEXT_TTL = 5 * 60
+
+_lock = threading.Lock()
+_sessions: dict[str, requests.Session] = {}
+_contexts: dict[tuple[str, str, str], tuple[dict, float]] = {}
+_context_version: str | None = None
+_stats = {"pool_hits": 0, "pool_misses": 0, "context_hits": 0, "context_misses": 0}
+
+
+def get_session(server: str) -> requests.Session:
+	"""Returns the pooled session for `server`, creating it on first use."""
+	with _lock:
+		session = _sessions.get(server)
+		if session:
+			_stats["pool_hits"] += 1
+			return session
+
+		_stats["pool_misses"] += 1
+		session = requests.Session()
+		adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+		session.mount("https://", adapter)
+		_sessions[server] = session
+		return session
+
+
+def get_request_context(server_type: str, server: str) -> dict:
+	"""Returns the cached agent password, base url and TLS verify setting for `server`."""
+	_drop_stale_contexts()
+	key = (frappe.local.site, server_type, server)
+	context, expires_at = _contexts.get(key, (None, 0))
+	if context and expires_at > time.monotonic():
+		_stats["context_hits"] += 1
+		return context
+
+	_stats["context_misses"] += 1
+	context = {
+		"password": get_decrypted_password(server_type, server, "agent_password"),
+		"base_url": _get_base_url(server_type, server),
+		"verify": _get_verify(),
+	}
+	_contexts[key] = (context, time.monotonic() + CONTEXT_TTL)
+	return context
+
+
+def _get_base_url(server_type: str, server: str) -> str:
+	alternative_port_servers = servers_using_alternative_port_for_communication()
+	port = 443 if server not in alternative_port_servers else 8443
+	if server_type in ("Server", "Database Server"):
+		proxy = _get_agent_proxy(server_type, server)
+		if proxy:
+			proxy_port = 443 if proxy not in alternative_port_servers else 8443
+			return f"https://{proxy}:{proxy_port}/{server}:{port}/agent/"
+
+	return f"https://{server}:{port}/agent/"
+
+
+def _get_agent_proxy(server_type: str, server: str) -> str | None:
+	server_ip, server_private_ip, server_cluster = frappe.db.get_value(
+		server_type, server, ("ip", "private_ip", "cluster")
+	)
+	if server_ip or not server_private_ip or frappe.flags.in_test:
+		return None
+
+	return frappe.db.get_value(
+		"Proxy Server",
+		{
+			"status": "Active",
+			"cluster": server_cluster,
+			"use_as_proxy_for_agent_and_metrics": 1,
+		},
+	)
+
+
+def _get_verify() -> bool | str:
+	if not frappe.conf.developer_mode:
+		return True
+
+	intermediate_ca = frappe.db.get_value("Press Settings", "Press Settings", "backbone_intermediate_ca")
+	if not intermediate_ca:
+		return True
+
+	root_ca = frappe.db.get_value("Certificate Authority", intermediate_ca, "parent_authority")
+	return frappe.get_doc("Certificate Authority", root_ca).certificate_file
+
+
+def _drop_stale_contexts():
+	"""Clears local contexts when another process has invalidated them."""
+	global _context_version
+	version = frappe.cache.get_value(CONTEXT_VERSION_KEY)
+	if version != _context_version:
+		_contexts.clear()
+		_context_version = version
+
+
+def clear_request_context(doc: Document | None = None, method: str | None = None):
+	"""Invalidates cached request context in every process. Hooked on server and proxy changes."""
+	if doc and method == "on_update" and not _affects_request_context(doc):
+		return
+	_contexts.clear()
+	frappe.cache.set_value(CONTEXT_VERSION_KEY, frappe.generate_hash(length=8))
+
+
+def _affects_request_context(doc: Document) -> bool:
+	if doc.doctype in ("Proxy Server", "Press Settings"):
+		return True
+	return any(doc.has_value_changed(field) for field in CONTEXT_FIELDS)
+
+
+def get_pool_stats() -> dict:
+	return {**_stats, "sessions": len(_sessions), "contexts": len(_contexts)}
@@ -3,7 +3,10 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import math
+import time
 from contextlib import suppress
 from datetime import datetime, timedelta
 from enum import Enum
@@ -17,6 +20,7 @@ from elasticsearch import Elasticsearch
 from elasticsearch_dsl import A, Search
 from frappe import auth
 from frappe.utils import (
+	cint,
 	convert_utc_to_timezone,
 	flt,
 	get_datetime,
@@ -36,6 +40,7 @@ from press.press.report.mariadb_slow_queries.mariadb_slow_queries import (
 	execute,
 	normalize_query,
 )
+from press.utils.prometheus import get_client as get_prometheus_client
 
 if TYPE_CHECKING:
 	from collections.abc import Callable
@@ -123,6 +128,12 @@ TIMESPAN_TIMEGRAIN_MAP: Final[dict[str, tuple[int, int]]] = {
 	"15d": (15 * 24 * 60 * 60, 3 * 60 * 60),
 }
 
+CHART_CACHE_KEY: Final[str] = "request_log_chart"
+CHART_CACHE_TTL: Final[int] = 24 * 60 * 60
+# Logs reach the log server a little after they are written, so recent buckets are re-read
+LOG_INGESTION_LAG: Final[int] = 5 * 60
+OPEN_BUCKET_TTL: Final[int] = 60
+
 MAX_NO_OF_PATHS: Final[int] = 10
 MAX_QUERIES: Final[int] = 25
 MAX_MAX_NO_OF_PATHS: Final[int] = 50
@@ -338,13 +349,16 @@ class StackedGroupByChart:
 			)
 		return path_data
 
-	def get_stacked_histogram_chart(self):
+	def get_stacked_histogram_chart(self, paths: list[str] | None = None, other: bool = False):
+		"""Returns datasets against UTC labels.
+
+		With `paths`, only those paths are aggregated and the rest is counted as Other if `other` is set.
+		"""
+		if paths is not None:
+			self.search.aggs["method_path"]._params["include"] = paths
 		aggs: AggResponse = self.search.execute().aggregations
 
-		timegrain_delta = timedelta(seconds=self.timegrain)
-		labels = [
-			self.start + i * timegrain_delta for i in range((self.end - self.start) // timegrain_delta + 1)
-		]
+		labels = self.get_labels()
 		# method_path has buckets of timestamps with method(eg: avg) of that duration
 		datasets = []
 
@@ -352,30 +366,163 @@ class StackedGroupByChart:
 		for path_bucket in aggs.method_path.buckets:
 			datasets.append(self.get_histogram_chart(path_bucket, labels))
 
-		if len(datasets) >= self.max_no_of_paths:
-			datasets.append(self.get_other_bucket(datasets, labels))
+		if paths is None:
+			other = len(datasets) >= self.max_no_of_paths
+		if other:
+			top_datasets = datasets if paths is None else [{"path": path} for path in paths]
+			datasets.append(self.get_other_bucket(top_datasets, labels))
 
 		if self.normalize_slow_logs:
 			datasets = normalize_datasets(datasets)
 
-		labels = [convert_utc_to_timezone(label, self.timezone).replace(tzinfo=None) for label in labels]
 		return {
 			"datasets": datasets,
 			"labels": labels,
 			"allow_drill_down": self.allow_drill_down,
 		}
 
+	def get_labels(self) -> list[datetime]:
+		timegrain_delta = timedelta(seconds=self.timegrain)
+		return [
+			self.start + i * timegrain_delta for i in range((self.end - self.start) // timegrain_delta + 1)
+		]
+
 	@property
 	def allow_drill_down(self):
 		if self.max_no_of_paths >= MAX_MAX_NO_OF_PATHS:
 			return False
 		return True
 
+	@property
+	def cache_key(self) -> str:
+		"""Buckets of the same chart are shared across sliding windows, users and timezones"""
+		params = [
+			type(self).__name__,
+			self.name,
+			AggType(self.agg_type).value,
+			ResourceType(self.resource_type).value,
+			self.timespan,
+			self.timegrain,
+			self.max_no_of_paths,
+		]
+		return f"{CHART_CACHE_KEY}:{hashlib.sha1(json.dumps(params).encode()).hexdigest()}"
+
+	def get_chart(self) -> dict:
+		"""Returns the chart from cached buckets, aggregating only the buckets that are missing or open.
+
+		The top paths are picked by a full aggregation of a window, and kept while the requested
+		window is that one or has slid forward from it by at most a tenth of its span. Until then
+		buckets are aggregated for those paths alone.
+		"""
+		# Normalizing merges queries after aggregation, so buckets can't be aggregated per query
+		if self.normalize_slow_logs:
+			return self.get_stacked_histogram_chart()
+
+		series = frappe.cache.get_value(self.cache_key)
+		if not series or not series["paths"] or not self.is_ranked_for_window(series):
+			record_chart_cache_outcome("miss")
+			chart = self.get_stacked_histogram_chart()
+			series = {
+				"paths": [dataset["path"] for dataset in chart["datasets"] if dataset["path"] != "Other"],
+				"other": any(dataset["path"] == "Other" for dataset in chart["datasets"]),
+				"allow_drill_down": chart["allow_drill_down"],
+				"ranked_start": self.start,
+				"ranked_end": self.end,
+				"buckets": {},
+			}
+		else:
+			stale = [label for label in self.get_labels() if not self.is_fresh(series["buckets"], label)]
+			if not stale:
+				record_chart_cache_outcome("hit")
+				return self.get_chart_from_buckets(series)
+			record_chart_cache_outcome("partial")
+			chart = self.get_stacked_histogram_chart_since(stale[0], series["paths"], series["other"])
+
+		self.store_buckets(series, chart)
+		return self.get_chart_from_buckets(series)
+
+	def is_ranked_for_window(self, series: dict) -> bool:
+		"""Top paths of another range, like a custom or historical one, don't apply to this one"""
+		slid_by = (self.end - series["ranked_end"]).total_seconds()
+		return (
+			self.end - self.start == series["ranked_end"] - series["ranked_start"]
+			and 0 <= slid_by <= self.timespan / 10
+		)
+
+	def is_fresh(self, buckets: dict, label: datetime) -> bool:
+		"""Buckets stay open to late logs until a while after they end, open ones are reused briefly"""
+		bucket = buckets.get(label)
+		if not bucket:
+			return False
+		closed_at = label.timestamp() + self.timegrain + LOG_INGESTION_LAG
+		return bucket["refreshed_at"] >= closed_at or time.time() - bucket["refreshed_at"] <= OPEN_BUCKET_TTL
+
+	def get_stacked_histogram_chart_since(self, start: datetime, paths: list[str], other: bool) -> dict:
+		"""Aggregates the buckets from `start` to the end of the window for the given top paths"""
+		window_start = self.start
+		self.start = start
+		try:
+			self.setup_search_filters()
+			self.setup_search_aggs()
+			return self.get_stacked_histogram_chart(paths, other)
+		finally:
+			self.start = window_start
+
+	def store_buckets(self, series: dict, chart: dict):
+		refreshed_at = time.time()
+		for index, label in enumerate(chart["labels"]):
+			series["buckets"][label] = {
+				"values": {dataset["path"]: dataset["values"][index] for dataset in chart["datasets"]},
+				"refreshed_at": refreshed_at,
+			}
+		# Keep one span behind the window for slightly older windows
+		oldest = self.start - timedelta(seconds=self.timespan)
+		series["buckets"] = {label: bucket for label, bucket in series["buckets"].items() if label >= oldest}
+		frappe.cache.set_value(self.cache_key, series, expires_in_sec=CHART_CACHE_TTL)
+
+	def get_chart_from_buckets(self, series: dict) -> dict:
+		labels = self.get_labels()
+		paths = series["paths"] + (["Other"] if series["other"] else [])
+		datasets: list[Dataset] = [
+			{
+				"path": path,
+				"values": [series["buckets"][label]["values"].get(path) for label in labels],
+				"stack": "path",
+			}
+			for path in paths
+		]
+		return {"datasets": datasets, "labels": labels, "allow_drill_down": series["allow_drill_down"]}
+
 	def run(self):
 		log_server = frappe.db.get_single_value("Press Settings", "log_server")
 		if not log_server:
 			return {"datasets": [], "labels": []}
-		return self.get_stacked_histogram_chart()
+
+		chart = self.get_chart()
+		chart["labels"] = [
+			convert_utc_to_timezone(label, self.timezone).replace(tzinfo=None) for label in chart["labels"]
+		]
+		return chart
+
+
+def record_chart_cache_outcome(outcome: str):
+	frappe.cache.incr(frappe.cache.make_key(f"{CHART_CACHE_KEY}_stats:{outcome}"))
+
+
+@frappe.whitelist()
+def chart_cache_stats() -> dict[str, float]:
+	frappe.only_for("System Manager")
+	return get_chart_cache_stats()
+
+
+def get_chart_cache_stats() -> dict[str, float]:
+	"""Hit rate of the request log chart cache, a partial hit refreshes only the trailing buckets"""
+	stats = {
+		outcome: cint(frappe.cache.get(frappe.cache.make_key(f"{CHART_CACHE_KEY}_stats:{outcome}")))
+		for outcome in ("hit", "partial", "miss")
+	}
+	total = sum(stats.values())
+	return {**stats, "hit_rate": (stats["hit"] + stats["partial"]) / total if total else 0}
 
 
 class RequestGroupByChart(StackedGroupByChart):
@@ -552,12 +699,12 @@ class SlowLogGroupByChart(StackedGroupByChart):
 
 
 def _query_prometheus(
-	query: dict[str, str | float],
-) -> PrometheusResponse:
-	monitor_server = frappe.db.get_single_value("Press Settings", "monitor_server")
-	url = f"https://{monitor_server}/prometheus/api/v1/query_range"
-	password = get_decrypted_password("Monitor Server", monitor_server, "grafana_password")
-	return cast("PrometheusResponse", requests.get(url, params=query, auth=("frappe", password)).json())
+	query: str, start: datetime, end: datetime, timegrain: int
+) -> PrometheusResponse | None:
+	client = get_prometheus_client()
+	if not client:
+		return None
+	return cast("PrometheusResponse", client.query_range(query, start, end, timegrain))
 
 
 def _parse_datetime_in_metrics(timestamp: float, timezone: str) -> str:
@@ -570,15 +717,11 @@ def _get_cadvisor_data(promql_query: str, timezone: str, timespan: int, timegrai
 	datasets = []
 	labels = []
 
-	query: dict[str, str | float] = {
-		"query": promql_query,
-		"start": start.timestamp(),
-		"end": end.timestamp(),
-		"step": f"{timegrain}s",
-	}
-
-	result = _query_prometheus(query)["data"]["result"]
+	response = _query_prometheus(promql_query, start, end, timegrain)
+	if not response:
+		return None
 
+	result = response["data"]["result"]
 	if not result:
 		return None
 
@@ -1014,12 +1157,12 @@ def get_rounded_boundary(dt: datetime, timegrain: int = 60):
 
 
 def get_uptime(site: str, timezone: str, start: datetime, end: datetime, timegrain: int):
-	monitor_server = frappe.db.get_single_value("Press Settings", "monitor_server")
-	if not monitor_server:
+	client = get_prometheus_client()
+	if not client:
 		return []
 
-	url = f"https://{monitor_server}/prometheus/api/v1/query_range"
-	password = get_decrypted_password("Monitor Server", monitor_server, "grafana_password")
+	# Daily buckets are aligned to the local day below, not to the epoch
+	align = (end - start).days < 30
 
 	# if the difference is more than 30 day, set timegrain to 1 day
 	if (end - start).days >= 30:
@@ -1048,16 +1191,8 @@ def get_uptime(site: str, timezone: str, start: datetime, end: datetime, timegra
 		local_start = local_end.replace(minute=minutes, second=0, microsecond=0)
 		start = local_start
 
-	query: dict[str, str | float] = {
-		"query": (
-			f'avg_over_time(probe_success{{job="site", instance="{site}"}}[{timegrain}s]) or on() vector(0)'
-		),
-		"start": start.timestamp(),
-		"end": end.timestamp(),
-		"step": f"{timegrain}s",
-	}
-
-	response = requests.get(url, params=query, auth=("frappe", password)).json()
+	query = f'avg_over_time(probe_success{{job="site", instance="{site}"}}[{timegrain}s]) or on() vector(0)'
+	response = client.query_range(query, start, end, timegrain, align=align)
 
 	buckets = []
 	if not response["data"]["result"]:
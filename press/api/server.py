@@ -24,8 +24,11 @@ from press.press.doctype.server_plan_type.server_plan_type import get_server_pla
 from press.press.doctype.site_plan.plan import Plan, filter_by_roles
 from press.press.doctype.team.team import get_child_team_members
 from press.utils import docs, get_current_team
+from press.utils.prometheus import get_client as get_prometheus_client
 
 if TYPE_CHECKING:
+	from collections.abc import Callable
+
 	from press.press.doctype.auto_scale_record.auto_scale_record import AutoScaleRecord
 	from press.press.doctype.cluster.cluster import Cluster
 	from press.press.doctype.database_server.database_server import DatabaseServer
@@ -370,10 +373,9 @@ def usage(name):
 	}
 
 	result = {}
-	for usage_type, query in query_map.items():
-		response = prometheus_query(query[0], query[1], "Asia/Kolkata", 120, 120)["datasets"]
-		if response:
-			result[usage_type] = response[0]["values"][-1]
+	for usage_type, response in prometheus_query_many(query_map, "Asia/Kolkata", 120, 120).items():
+		if response["datasets"]:
+			result[usage_type] = response["datasets"][0]["values"][-1]
 
 	result["vcpu"] = get_cpu_and_memory_usage(name)["vcpu"]
 	return result
@@ -398,10 +400,9 @@ def total_resource(name):
 	}
 
 	result = {}
-	for usage_type, query in query_map.items():
-		response = prometheus_query(query[0], query[1], "Asia/Kolkata", 120, 120)["datasets"]
-		if response:
-			result[usage_type] = response[0]["values"][-1]
+	for usage_type, response in prometheus_query_many(query_map, "Asia/Kolkata", 120, 120).items():
+		if response["datasets"]:
+			result[usage_type] = response["datasets"][0]["values"][-1]
 	return result
 
 
@@ -433,10 +434,9 @@ def calculate_swap(name):
 	}
 
 	result = {}
-	for usage_type, query in query_map.items():
-		response = prometheus_query(query[0], query[1], "Asia/Kolkata", 120, 120)["datasets"]
-		if response:
-			result[usage_type] = response[0]["values"][-1]
+	for usage_type, response in prometheus_query_many(query_map, "Asia/Kolkata", 120, 120).items():
+		if response["datasets"]:
+			result[usage_type] = response["datasets"][0]["values"][-1]
 	return result
 
 
@@ -575,14 +575,12 @@ def prometheus_instant_value(query: str) -> float | None:
 
 	Instant, unlike ``prometheus_query``, whose range samples can be a timegrain stale.
 	"""
-	monitor_server = frappe.db.get_single_value("Press Settings", "monitor_server")
-	if not monitor_server:
+	client = get_prometheus_client()
+	if not client:
 		return None
 
-	url = f"https://{monitor_server}/prometheus/api/v1/query"
-	password = get_decrypted_password("Monitor Server", monitor_server, "grafana_password")
 	try:
-		response = requests.get(url, params={"query": query}, auth=("frappe", str(password))).json()
+		response = client.query(query)
 	except requests.exceptions.RequestException:
 		frappe.throw("Unable to connect to monitor server", MonitorServerDown)
 
@@ -601,12 +599,24 @@ def prometheus_query(
 	start: datetime | None = None,
 	end: datetime | None = None,
 ):
-	monitor_server = frappe.db.get_single_value("Press Settings", "monitor_server")
-	if not monitor_server:
-		return {"datasets": [], "labels": []}
+	return prometheus_query_many(
+		{"result": (query, function)}, timezone, timespan, timegrain, use_timestamps, start, end
+	)["result"]
 
-	url = f"https://{monitor_server}/prometheus/api/v1/query_range"
-	password = get_decrypted_password("Monitor Server", monitor_server, "grafana_password")
+
+def prometheus_query_many(
+	query_map: dict[str, tuple[str, Callable]],
+	timezone: str,
+	timespan: int,
+	timegrain: int,
+	use_timestamps: bool = False,
+	start: datetime | None = None,
+	end: datetime | None = None,
+) -> dict[str, dict]:
+	"""Runs the range queries of one view concurrently over the same window"""
+	client = get_prometheus_client()
+	if not client:
+		return {key: {"datasets": [], "labels": []} for key in query_map}
 
 	if use_timestamps and isinstance(start, datetime) and isinstance(end, datetime):
 		start = get_rounded_boundary(start, timegrain)
@@ -617,18 +627,22 @@ def prometheus_query(
 			timegrain,
 		)  # timezone not passed as only utc time allowed in promql
 
-	query = {
-		"query": query,
-		"start": start.timestamp(),
-		"end": end.timestamp(),
-		"step": f"{timegrain}s",
-	}
-
 	try:
-		response = requests.get(url, params=query, auth=("frappe", str(password))).json()
+		responses = client.query_range_many(
+			{key: (query, start, end, timegrain) for key, (query, _) in query_map.items()}
+		)
 	except requests.exceptions.RequestException:
 		frappe.throw("Unable to connect to monitor server", MonitorServerDown)
 
+	return {
+		key: _parse_prometheus_response(responses[key], function, timezone, timegrain, start, end)
+		for key, (_, function) in query_map.items()
+	}
+
+
+def _parse_prometheus_response(
+	response: dict, function: Callable, timezone: str, timegrain: int, start: datetime, end: datetime
+) -> dict:
 	datasets: list[dict] = []
 	labels: list[float] = []
 
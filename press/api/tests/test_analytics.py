@@ -0,0 +1,112 @@
+# Copyright (c) 2026, Frappe and Contributors
+# See license.txt
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from press.api.analytics import (
+	CHART_CACHE_KEY,
+	LOG_INGESTION_LAG,
+	AggType,
+	RequestGroupByChart,
+	ResourceType,
+	StackedGroupByChart,
+	get_chart_cache_stats,
+)
+
+
+@patch("press.api.analytics.get_decrypted_password", new=Mock(return_value="password"))
+class TestRequestLogChartCache(FrappeTestCase):
+	def setUp(self):
+		frappe.db.set_single_value("Press Settings", "log_server", "log.example.com")
+		frappe.cache.delete_keys(CHART_CACHE_KEY)
+		# Windows ending now still have open buckets
+		now = datetime.now(timezone.utc).timestamp()
+		self.end = datetime.fromtimestamp(now - now % 600, tz=timezone.utc)
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def _chart(self, start: datetime, end: datetime, timezone_name: str = "UTC"):
+		return RequestGroupByChart(
+			"site.example.com",
+			AggType.COUNT,
+			timezone_name,
+			start,
+			end,
+			int((end - start).total_seconds()),
+			600,
+			ResourceType.SITE,
+		)
+
+	def _result(self, chart: StackedGroupByChart, values: list[list]):
+		labels = chart.get_labels()[-len(values[0]) :]
+		datasets = [{"path": f"/path/{i}", "values": v, "stack": "path"} for i, v in enumerate(values)]
+		return {"datasets": datasets, "labels": labels, "allow_drill_down": True}
+
+	def test_same_aligned_window_is_served_from_cache_across_timezones(self):
+		start = self.end - timedelta(hours=1)
+		chart = self._chart(start, self.end)
+		result = self._result(chart, [[1] * 7])
+
+		with patch.object(StackedGroupByChart, "get_stacked_histogram_chart", return_value=result) as compute:
+			chart.run()
+			# A few seconds later, from another user in another timezone
+			self._chart(start + timedelta(seconds=20), self.end + timedelta(seconds=20), "Asia/Kolkata").run()
+
+		compute.assert_called_once()
+		self.assertEqual(get_chart_cache_stats()["hit"], 1)
+
+	def test_sliding_window_reuses_closed_buckets_and_refreshes_open_ones(self):
+		start = self.end - timedelta(hours=1)
+		chart = self._chart(start, self.end)
+		with patch.object(
+			StackedGroupByChart, "get_stacked_histogram_chart", return_value=self._result(chart, [[1] * 7])
+		):
+			chart.run()
+
+		# Every bucket but the last closed before it was cached, the last was cached two minutes ago
+		series = frappe.cache.get_value(chart.cache_key)
+		for label, bucket in series["buckets"].items():
+			bucket["refreshed_at"] = label.timestamp() + 600 + LOG_INGESTION_LAG
+		series["buckets"][self.end]["refreshed_at"] = time.time() - 120
+		frappe.cache.set_value(chart.cache_key, series)
+
+		# The window slid by one bucket
+		grain = timedelta(seconds=600)
+		chart = self._chart(start + grain, self.end + grain)
+		trailing = self._result(chart, [[5, 6]])
+		with patch.object(
+			StackedGroupByChart, "get_stacked_histogram_chart", return_value=trailing
+		) as compute:
+			result = chart.run()
+
+		self.assertEqual(compute.call_args.args, (["/path/0"], False))
+		self.assertEqual(result["datasets"][0]["values"], [1, 1, 1, 1, 1, 5, 6])
+		self.assertEqual(get_chart_cache_stats()["partial"], 1)
+
+	def test_window_of_the_same_length_elsewhere_is_ranked_again(self):
+		start = self.end - timedelta(hours=1)
+		chart = self._chart(start, self.end)
+		with patch.object(
+			StackedGroupByChart, "get_stacked_histogram_chart", return_value=self._result(chart, [[1] * 7])
+		):
+			chart.run()
+
+		# Same span a day earlier, its top paths can be entirely different
+		day = timedelta(days=1)
+		chart = self._chart(start - day, self.end - day)
+		with patch.object(
+			StackedGroupByChart, "get_stacked_histogram_chart", return_value=self._result(chart, [[2] * 7])
+		) as compute:
+			result = chart.run()
+
+		self.assertEqual(compute.call_args.args, ())
+		self.assertEqual(result["datasets"][0]["values"], [2] * 7)
+		self.assertEqual(get_chart_cache_stats()["miss"], 2)
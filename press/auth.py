@@ -2,63 +2,69 @@
 # For license information, please see license.txt
 
 import json
-import os
+import re
 import traceback
 
 import frappe
 
+from press.utils.log_buffer import LogBuffer
+
 PRESS_AUTH_KEY = "press-auth-logs"
 PRESS_AUTH_MAX_ENTRIES = 1000000
 
-
-ALLOWED_PATHS = [
-	"/api/method/create-site-migration",
-	"/api/method/create-version-upgrade",
-	"/api/method/migrate-to-private-bench",
-	"/api/method/find-my-sites",
-	"/api/method/frappe.core.doctype.communication.email.mark_email_as_seen",
-	"/api/method/frappe.realtime.get_user_info",
-	"/api/method/frappe.realtime.can_subscribe_doc",
-	"/api/method/frappe.realtime.can_subscribe_doctype",
-	"/api/method/frappe.realtime.has_permission",
-	"/api/method/frappe.www.login.login_via_frappe",
-	"/api/method/frappe.integrations.oauth2.authorize",
-	"/api/method/frappe.integrations.oauth2.approve",
-	"/api/method/frappe.integrations.oauth2.get_token",
-	"/api/method/frappe.integrations.oauth2.openid_profile",
-	"/api/method/frappe.integrations.oauth2_logins.login_via_frappe",
-	"/api/method/frappe.website.doctype.web_page_view.web_page_view.make_view_log",
-	"/api/method/frappe.desk.form.utils.add_comment",
-	"/api/method/get-user-sites-list-for-new-ticket",
-	"/api/method/ping",
-	"/api/method/login",
-	"/api/method/logout",
-	"/api/method/press.press.doctype.razorpay_webhook_log.razorpay_webhook_log.razorpay_webhook_handler",
-	"/api/method/press.press.doctype.razorpay_webhook_log.razorpay_webhook_log.razorpay_authorized_payment_handler",
-	"/api/method/press.press.doctype.razorpay_webhook_log.razorpay_webhook_log.razorpay_emandate_webhook_handler",
-	"/api/method/press.press.doctype.stripe_webhook_log.stripe_webhook_log.stripe_webhook_handler",
-	"/api/method/press.press.doctype.drip_email.drip_email.unsubscribe",
-	"/api/method/press.press.doctype.user_2fa.user_2fa.unsubscribe_from_recovery_code_reminders",
-	"/api/method/upload_file",
-	"/api/method/frappe.search.web_search",
-	"/api/method/frappe.email.queue.unsubscribe",
-	"/api/method/press.utils.telemetry.capture_read_event",
-	"/api/method/validate_plan_change",
-	"/api/method/marketplace-apps",
-	"/api/method/press.www.dashboard.get_context_for_dev",
-	"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.get_certificate_link_status",
-	"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.get_mrr_status",
-	"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.get_partner_onboarding",
-	"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.resend_certificate_link_request",
-	"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.save_partner_onboarding",
-	"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.send_certificate_link_request",
-	"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.submit_for_approval",
-	"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.unregister",
-	"/api/method/frappe.website.doctype.web_form.web_form.accept",
-	"/api/method/frappe.core.doctype.user.user.test_password_strength",
-	"/api/method/frappe.core.doctype.user.user.update_password",
-	"/api/method/get_central_migration_data",
-]
+auth_log_buffer = LogBuffer(PRESS_AUTH_KEY, "press.auth.json.log", max_entries=PRESS_AUTH_MAX_ENTRIES)
+
+
+ALLOWED_PATHS = frozenset(
+	[
+		"/api/method/create-site-migration",
+		"/api/method/create-version-upgrade",
+		"/api/method/migrate-to-private-bench",
+		"/api/method/find-my-sites",
+		"/api/method/frappe.core.doctype.communication.email.mark_email_as_seen",
+		"/api/method/frappe.realtime.get_user_info",
+		"/api/method/frappe.realtime.can_subscribe_doc",
+		"/api/method/frappe.realtime.can_subscribe_doctype",
+		"/api/method/frappe.realtime.has_permission",
+		"/api/method/frappe.www.login.login_via_frappe",
+		"/api/method/frappe.integrations.oauth2.authorize",
+		"/api/method/frappe.integrations.oauth2.approve",
+		"/api/method/frappe.integrations.oauth2.get_token",
+		"/api/method/frappe.integrations.oauth2.openid_profile",
+		"/api/method/frappe.integrations.oauth2_logins.login_via_frappe",
+		"/api/method/frappe.website.doctype.web_page_view.web_page_view.make_view_log",
+		"/api/method/frappe.desk.form.utils.add_comment",
+		"/api/method/get-user-sites-list-for-new-ticket",
+		"/api/method/ping",
+		"/api/method/login",
+		"/api/method/logout",
+		"/api/method/press.press.doctype.razorpay_webhook_log.razorpay_webhook_log.razorpay_webhook_handler",
+		"/api/method/press.press.doctype.razorpay_webhook_log.razorpay_webhook_log.razorpay_authorized_payment_handler",
+		"/api/method/press.press.doctype.razorpay_webhook_log.razorpay_webhook_log.razorpay_emandate_webhook_handler",
+		"/api/method/press.press.doctype.stripe_webhook_log.stripe_webhook_log.stripe_webhook_handler",
+		"/api/method/press.press.doctype.drip_email.drip_email.unsubscribe",
+		"/api/method/press.press.doctype.user_2fa.user_2fa.unsubscribe_from_recovery_code_reminders",
+		"/api/method/upload_file",
+		"/api/method/frappe.search.web_search",
+		"/api/method/frappe.email.queue.unsubscribe",
+		"/api/method/press.utils.telemetry.capture_read_event",
+		"/api/method/validate_plan_change",
+		"/api/method/marketplace-apps",
+		"/api/method/press.www.dashboard.get_context_for_dev",
+		"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.get_certificate_link_status",
+		"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.get_mrr_status",
+		"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.get_partner_onboarding",
+		"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.resend_certificate_link_request",
+		"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.save_partner_onboarding",
+		"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.send_certificate_link_request",
+		"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.submit_for_approval",
+		"/api/method/press.partner.doctype.partner_onboarding.partner_onboarding.unregister",
+		"/api/method/frappe.website.doctype.web_form.web_form.accept",
+		"/api/method/frappe.core.doctype.user.user.test_password_strength",
+		"/api/method/frappe.core.doctype.user.user.update_password",
+		"/api/method/get_central_migration_data",
+	]
+)
 
 ALLOWED_WILDCARD_PATHS = [
 	"/api/method/press.api.",
@@ -68,11 +74,13 @@ ALLOWED_WILDCARD_PATHS = [
 	"/api/method/press.www.marketplace.index.",
 ]
 
-DENIED_PATHS = [
-	# Added from frappe/wwww/..
-	"/printview",
-	"/printpreview",
-]
+DENIED_PATHS = frozenset(
+	[
+		# Added from frappe/wwww/..
+		"/printview",
+		"/printpreview",
+	]
+)
 
 
 DENIED_WILDCARD_PATHS = [
@@ -84,7 +92,15 @@ ALLOWED_OPTIONS_ENDPOINTS = [
 ]
 
 
-def hook():  # noqa: C901
+def compile_prefixes(prefixes: list[str]) -> re.Pattern:
+	return re.compile("|".join(map(re.escape, prefixes)))
+
+
+ALLOWED_WILDCARD_PATTERN = compile_prefixes(ALLOWED_WILDCARD_PATHS)
+DENIED_WILDCARD_PATTERN = compile_prefixes(DENIED_WILDCARD_PATHS)
+
+
+def hook():
 	if frappe.form_dict.cmd:
 		path = f"/api/method/{frappe.form_dict.cmd}"
 	else:
@@ -95,28 +111,33 @@ def hook():  # noqa: C901
 	if frappe.request.method == "OPTIONS" and path in ALLOWED_OPTIONS_ENDPOINTS:
 		return
 
-	user_type = frappe.get_cached_value("User", frappe.session.user, "user_type")
+	user_type = get_user_type()
 
 	# Allow unchecked access to System Users
 	if user_type == "System User":
 		return
 
-	if path in DENIED_PATHS:
+	if is_denied(path):
 		log(path, user_type)
 		frappe.throw("Access not allowed for this URL", frappe.AuthenticationError)
 
-	for denied in DENIED_WILDCARD_PATHS:
-		if path.startswith(denied):
-			for allowed in ALLOWED_WILDCARD_PATHS:
-				if path.startswith(allowed):
-					return
-			if path in ALLOWED_PATHS:
-				return
 
-			log(path, user_type)
-			frappe.throw("Access not allowed for this URL", frappe.AuthenticationError)
+def is_denied(path: str) -> bool:
+	if path in DENIED_PATHS:
+		return True
+	if not DENIED_WILDCARD_PATTERN.match(path):
+		return False
+	return not (path in ALLOWED_PATHS or ALLOWED_WILDCARD_PATTERN.match(path))
+
 
-	return
+def get_user_type() -> str:
+	"""Memoized for the request, keyed on user since login changes the session user."""
+	user = frappe.session.user
+	cached = getattr(frappe.local, "press_auth_user_type", None)
+	if not cached or cached[0] != user:
+		cached = (user, frappe.get_cached_value("User", user, "user_type"))
+		frappe.local.press_auth_user_type = cached
+	return cached[1]
 
 
 def log(path, user_type):
@@ -129,23 +150,12 @@ def log(path, user_type):
 		"referer": frappe.request.headers.get("Referer", ""),
 	}
 
-	if frappe.cache().llen(PRESS_AUTH_KEY) > PRESS_AUTH_MAX_ENTRIES:
-		frappe.cache().ltrim(PRESS_AUTH_KEY, 1, -1)
 	serialized = json.dumps(data, sort_keys=True, default=str)
-	frappe.cache().rpush(PRESS_AUTH_KEY, serialized)
+	auth_log_buffer.push(serialized)
 
 
 def flush():
-	log_file = os.path.join(frappe.utils.get_bench_path(), "logs", "press.auth.json.log")
 	try:
-		# Fetch all entries without removing from cache
-		logs = frappe.cache().lrange(PRESS_AUTH_KEY, 0, -1)
-		if logs:
-			logs = list(map(frappe.safe_decode, logs))
-			with open(log_file, "a", os.O_NONBLOCK) as f:
-				f.write("\n".join(logs))
-				f.write("\n")
-			# Remove fetched entries from cache
-			frappe.cache().ltrim(PRESS_AUTH_KEY, len(logs) - 1, -1)
+		auth_log_buffer.flush()
 	except Exception:
 		traceback.print_exc()
@@ -7,10 +7,8 @@ from typing import Any, Literal
 import frappe
 from frappe import _
 from frappe.model.document import Document
-from frappe.query_builder.functions import Count
-from frappe.query_builder.terms import QueryBuilder
 
-from press.utils import get_current_team, is_admin_user, is_team_owner
+from press.utils import get_current_team, is_team_owner
 from press.utils import user as utils_user
 
 from .action import action_key
@@ -19,6 +17,7 @@ from .document import check as document_check
 from .marketplace import check as marketplace_check
 from .server_snapshot import check as server_snapshot_check
 from .site_backup import check as site_backup_check
+from .snapshot import get_snapshot
 from .webhook import check as webhook_check
 
 
@@ -34,22 +33,7 @@ def api(scope: Literal["billing", "partner"]):
 			team = get_current_team()
 			if is_team_owner(team) or is_admin_user(team):
 				return fn(*args, **kwargs)
-			PressRole = frappe.qb.DocType("Press Role")
-			PressRoleUser = frappe.qb.DocType("Press Role User")
-			has_permission = (
-				frappe.qb.from_(PressRole)
-				.inner_join(PressRoleUser)
-				.on(PressRoleUser.parent == PressRole.name)
-				.select(Count(PressRole.name).as_("count"))
-				.where(PressRole.team == team)
-				.where(PressRole[key] == 1)
-				.where(PressRoleUser.user == frappe.session.user)
-				.run(as_dict=True)
-				.pop()
-				.get("count")
-				> 0
-			)
-			if not has_permission:
+			if key not in get_snapshot(team).flags:
 				error_message = _("You do not have permission to perform the action.")
 				frappe.throw(error_message, frappe.PermissionError)
 			return fn(*args, **kwargs)
@@ -71,22 +55,7 @@ def action():
 			team = get_current_team()
 			if is_team_owner(team) or is_admin_user(team):
 				return fn(self, *args, **kwargs)
-			PressRole = frappe.qb.DocType("Press Role")
-			PressRoleUser = frappe.qb.DocType("Press Role User")
-			has_permission = (
-				frappe.qb.from_(PressRole)
-				.inner_join(PressRoleUser)
-				.on(PressRoleUser.parent == PressRole.name)
-				.select(Count(PressRole.name).as_("count"))
-				.where(PressRole.team == team)
-				.where(PressRole[key] == 1)
-				.where(PressRoleUser.user == frappe.session.user)
-				.run(as_dict=True)
-				.pop()
-				.get("count")
-				> 0
-			)
-			if not has_permission:
+			if key not in get_snapshot(team).flags:
 				error_message = _("You do not have permission to perform the action.")
 				frappe.throw(error_message, frappe.PermissionError)
 			return fn(self, *args, **kwargs)
@@ -112,9 +81,11 @@ def document(
 	"""
 
 	def wrapper(fn):
+		signature = inspect.signature(fn)
+
 		@functools.wraps(fn)
 		def inner(*args, **kwargs):
-			bound_args = inspect.signature(fn).bind(*args, **kwargs)
+			bound_args = signature.bind(*args, **kwargs)
 			bound_args.apply_defaults()
 			t = document_type(bound_args.arguments)
 			n = document_name(bound_args.arguments)
@@ -131,22 +102,6 @@ def document(
 	return wrapper
 
 
-def base_query() -> QueryBuilder:
-	"""
-	Get a base query for Press Role documents based on the current team context.
-	"""
-	PressRole = frappe.qb.DocType("Press Role")
-	PressRoleUser = frappe.qb.DocType("Press Role User")
-	return (
-		frappe.qb.from_(PressRole)
-		.select(PressRole.name)
-		.left_join(PressRoleUser)
-		.on(PressRoleUser.parent == PressRole.name)
-		.where(PressRole.team == get_current_team())
-		.where(PressRoleUser.user == frappe.session.user)
-	)
-
-
 def check(document_type: str, document_name: str) -> bool | list[str]:  # noqa: C901
 	"""
 	Check if the user has permission to access a specific document type and name.
@@ -154,30 +109,38 @@ def check(document_type: str, document_name: str) -> bool | list[str]:  # noqa:
 	team = get_current_team()
 	if is_team_owner(team) or is_admin_user(team):
 		return True
-	query = base_query()
+	snapshot = get_snapshot(team)
 	match document_type:
 		case "Marketplace App":
-			return marketplace_check(query)
+			return marketplace_check(snapshot)
 		case "Press Webhook":
-			return webhook_check(query)
+			return webhook_check(snapshot)
 		case "Press Webhook Attempt":
-			return webhook_check(query)
+			return webhook_check(snapshot)
 		case "Press Webhook Log":
-			return webhook_check(query)
+			return webhook_check(snapshot)
 		case "Release Group":
-			return document_check(query, document_type, document_name)
+			return document_check(snapshot, document_type, document_name)
 		case "Server":
-			return document_check(query, document_type, document_name)
+			return document_check(snapshot, document_type, document_name)
 		case "Server Snapshot":
-			return server_snapshot_check(query, document_name)
+			return server_snapshot_check(snapshot, document_name)
 		case "Site":
-			return document_check(query, document_type, document_name)
+			return document_check(snapshot, document_type, document_name)
 		case "Site Backup":
-			return site_backup_check(query, document_name)
+			return site_backup_check(snapshot, document_name)
 		case _:
 			return True
 
 
+def is_admin_user(team: str) -> bool:
+	"""
+	Check if the current user has admin access in the team through any of
+	their roles.
+	"""
+	return "admin_access" in get_snapshot(team).flags
+
+
 def is_restricted() -> bool:
 	team = get_current_team()
 	return (
@@ -189,7 +152,7 @@ def is_restricted() -> bool:
 
 
 def permitted_documents(document_type: str) -> list[str]:
-	return document_check(base_query(), document_type)
+	return document_check(get_snapshot(get_current_team()), document_type)
 
 
 def roles_enabled() -> bool:
@@ -197,14 +160,7 @@ def roles_enabled() -> bool:
 	Check if role-based access control is enabled for the current team. This is
 	done by checking if any roles exist for the team.
 	"""
-	return bool(
-		frappe.db.exists(
-			{
-				"doctype": "Press Role",
-				"team": get_current_team(),
-			}
-		)
-	)
+	return get_snapshot(get_current_team()).roles_enabled
 
 
 def is_relaxed_mode() -> bool:
@@ -221,17 +177,4 @@ def skip_roles() -> bool:
 	"""
 	if not is_relaxed_mode():
 		return False
-	PressRole = frappe.qb.DocType("Press Role")
-	PressRoleUser = frappe.qb.DocType("Press Role User")
-	return (
-		frappe.qb.from_(PressRole)
-		.inner_join(PressRoleUser)
-		.on(PressRoleUser.parent == PressRole.name)
-		.select(Count(PressRole.name).as_("roles_count"))
-		.where(PressRole.team == get_current_team())
-		.where(PressRoleUser.user == frappe.session.user)
-		.run(as_dict=True)
-		.pop()
-		.get("roles_count")
-		== 0
-	)
+	return not get_snapshot(get_current_team()).has_roles
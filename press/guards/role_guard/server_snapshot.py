@@ -1,22 +1,6 @@
 import frappe
-from frappe.query_builder.functions import Count
-from frappe.query_builder.terms import QueryBuilder
 
 
-def check(base_query: QueryBuilder, document_name: str) -> bool:
-	PressRole = frappe.qb.DocType("Press Role")
-	PressRoleResource = frappe.qb.DocType("Press Role Resource")
-	ServerSnapshot = frappe.qb.DocType("Server Snapshot")
-	return (
-		base_query.left_join(PressRoleResource)
-		.on(PressRoleResource.parent == PressRole.name)
-		.left_join(ServerSnapshot)
-		.on(ServerSnapshot.name == document_name)
-		.select(Count(PressRole.name).as_("count"))
-		.where(PressRoleResource.document_type == "Server")
-		.where(PressRoleResource.document_name == ServerSnapshot.app_server)
-		.run(as_dict=True)
-		.pop()
-		.get("count")
-		> 0
-	)
+def check(snapshot: frappe._dict, document_name: str) -> bool:
+	app_server = frappe.db.get_value("Server Snapshot", document_name, "app_server")
+	return bool(app_server) and app_server in snapshot.resources.get("Server", ())
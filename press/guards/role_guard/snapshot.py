@@ -0,0 +1,61 @@
+from functools import partial
+
+import frappe
+
+SNAPSHOT_KEY = "role_guard_snapshot"
+# Invalidated on every Press Role change, expiry bounds how long a snapshot missed by that can be served
+SNAPSHOT_TTL = 10 * 60
+
+
+def get_snapshot(team: str, user: str | None = None) -> frappe._dict:
+	"""
+	Get the compiled permissions of a user in a team: the flags set on any of
+	their roles and the documents those roles grant, by document type.
+	"""
+	user = user or frappe.session.user
+	key = f"{SNAPSHOT_KEY}:{team}:{user}"
+	snapshot = frappe.cache.get_value(key)
+	if snapshot is None:
+		snapshot = build_snapshot(team, user)
+		frappe.cache.set_value(key, snapshot, expires_in_sec=SNAPSHOT_TTL)
+	return snapshot
+
+
+def build_snapshot(team: str, user: str) -> frappe._dict:
+	flag_fields = [df.fieldname for df in frappe.get_meta("Press Role").fields if df.fieldtype == "Check"]
+	roles = frappe.get_all(
+		"Press Role",
+		filters=[["Press Role", "team", "=", team], ["Press Role User", "user", "=", user]],
+		fields=["name", *flag_fields],
+		distinct=True,
+	)
+
+	resources = {}
+	if roles:
+		for resource in frappe.get_all(
+			"Press Role Resource",
+			filters={
+				"parenttype": "Press Role",
+				"parent": ("in", [role.name for role in roles]),
+				"document_name": ("is", "set"),
+			},
+			fields=["document_type", "document_name"],
+		):
+			resources.setdefault(resource.document_type, set()).add(resource.document_name)
+
+	return frappe._dict(
+		roles_enabled=bool(roles) or bool(frappe.db.exists("Press Role", {"team": team})),
+		has_roles=bool(roles),
+		flags=frozenset(field for field in flag_fields if any(role.get(field) for role in roles)),
+		resources={document_type: frozenset(names) for document_type, names in resources.items()},
+	)
+
+
+def clear_snapshots(team: str):
+	"""
+	Clear the snapshots of a team now and again after commit, a request running
+	in between would cache a snapshot built from the roles before this change.
+	"""
+	clear = partial(frappe.cache.delete_keys, f"{SNAPSHOT_KEY}:{team}:")
+	clear()
+	frappe.db.after_commit.add(clear)
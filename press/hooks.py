@@ -203,6 +203,26 @@ doc_events = {
 	},
 }
 
+# Agent requests cache the server's password and base url, see press.agent_transport. Telemetry tools
+# cache the monitor and log server credentials, see press.mcp.tools.telemetry.clients
+for _doctype in (
+	"Server",
+	"Database Server",
+	"Proxy Server",
+	"Log Server",
+	"Monitor Server",
+	"Registry Server",
+	"NAT Server",
+	"NFS Server",
+	"Trace Server",
+	"Analytics Server",
+	"Press Settings",
+):
+	_handlers = ["press.agent_transport.clear_request_context"]
+	if _doctype in ("Log Server", "Monitor Server", "Press Settings"):
+		_handlers.append("press.mcp.tools.telemetry.clients.clear_credentials")
+	doc_events.setdefault(_doctype, {}).update({"on_update": _handlers, "on_trash": _handlers})
+
 # Scheduled Tasks
 # ---------------
 
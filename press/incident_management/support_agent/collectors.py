@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 import frappe
 from frappe.utils import get_system_timezone
 
+from press.incident_management.support_agent.graph import Collector, run_collectors
 from press.utils import convert_user_timezone_to_utc
 
 if TYPE_CHECKING:
@@ -68,45 +69,76 @@ class TimeWindow:
 def collect_site_context(site_name: str, centre: datetime | str | None = None) -> dict[str, Any]:
 	window = TimeWindow(centre)
 	site = _get_site(site_name)
-	bench = get_bench_health(site.get("bench"))
-	db_server = bench.get("database_server") if bench else None
-
-	app_server_metrics = get_server_metrics(site.get("server"), window)
-	db_server_metrics = get_server_metrics(db_server, window, is_db_server=True)
-
-	server_advanced_analytics = (
-		get_server_advanced_analytics(site.get("server"), site_name)
-		if _any_spike(app_server_metrics, db_server_metrics)
-		else None
-	)
+	results, timings = run_collectors(_site_collectors(site, site_name, window))
 
 	return {
 		"window": {"centre": window.centre, "start": window.start, "end": window.end},
 		"site": get_site_health(site),
-		"bench": bench,
-		"apps": get_app_versions(site.get("bench")),
-		"deployments": get_deployment_timeline(site_name),
-		"background_jobs": get_background_job_summary(site_name, window),
-		"backups": get_backup_status(site_name),
-		"domains": get_domain_status(site_name),
-		"incidents": get_platform_incidents(site),
-		"errors": get_redacted_error_summary(site_name, window),
-		"app_server_metrics": app_server_metrics,
-		"db_server_metrics": db_server_metrics,
-		"server_advanced_analytics": server_advanced_analytics,
-		"bench_processes": get_bench_process_status(site.get("bench")),
-		"site_uptime": get_site_uptime(site_name),
-		"site_performance": get_site_performance_summary(site_name, site.get("bench"), window),
-		"slow_queries": get_slow_queries(site_name, window),
-		"database_processes": get_database_processes(site_name, window, db_server_metrics),
-		"database_slow_query_share": get_database_tenant_share(
-			db_server, site_name, window, db_server_metrics
+		**results,
+		"collectors": timings,
+	}
+
+
+def _site_collectors(site: frappe._dict, site_name: str, window: TimeWindow) -> list[Collector]:
+	"""
+	Every source of the site context, keyed by its place in the payload.
+
+	Most only need the site. The ones that read server metrics are collected only
+	when those metrics show a spike, so they wait for the metrics collectors.
+	"""
+
+	def db_server(results: dict[str, Any]) -> str | None:
+		return (results["bench"] or {}).get("database_server")
+
+	return [
+		Collector("bench", lambda _: get_bench_health(site.get("bench"))),
+		Collector("apps", lambda _: get_app_versions(site.get("bench"))),
+		Collector("deployments", lambda _: get_deployment_timeline(site_name)),
+		Collector("background_jobs", lambda _: get_background_job_summary(site_name, window)),
+		Collector("backups", lambda _: get_backup_status(site_name)),
+		Collector("domains", lambda _: get_domain_status(site_name)),
+		Collector("incidents", lambda _: get_platform_incidents(site)),
+		Collector("errors", lambda _: get_redacted_error_summary(site_name, window)),
+		Collector("app_server_metrics", lambda _: get_server_metrics(site.get("server"), window)),
+		Collector(
+			"db_server_metrics",
+			lambda results: get_server_metrics(db_server(results), window, is_db_server=True),
+			depends_on=("bench",),
 		),
-		"app_server_request_share": get_app_server_tenant_share(
-			site.get("server"), site_name, site.get("bench"), window, app_server_metrics
+		Collector(
+			"server_advanced_analytics",
+			lambda results: get_server_advanced_analytics(site.get("server"), site_name)
+			if _any_spike(results["app_server_metrics"], results["db_server_metrics"])
+			else None,
+			depends_on=("app_server_metrics", "db_server_metrics"),
 		),
-		"web_error_log": get_web_error_log(site.get("bench")),
-	}
+		Collector("bench_processes", lambda _: get_bench_process_status(site.get("bench"))),
+		Collector("site_uptime", lambda _: get_site_uptime(site_name)),
+		Collector(
+			"site_performance", lambda _: get_site_performance_summary(site_name, site.get("bench"), window)
+		),
+		Collector("slow_queries", lambda _: get_slow_queries(site_name, window)),
+		Collector(
+			"database_processes",
+			lambda results: get_database_processes(site_name, window, results["db_server_metrics"]),
+			depends_on=("db_server_metrics",),
+		),
+		Collector(
+			"database_slow_query_share",
+			lambda results: get_database_tenant_share(
+				db_server(results), site_name, window, results["db_server_metrics"]
+			),
+			depends_on=("bench", "db_server_metrics"),
+		),
+		Collector(
+			"app_server_request_share",
+			lambda results: get_app_server_tenant_share(
+				site.get("server"), site_name, site.get("bench"), window, results["app_server_metrics"]
+			),
+			depends_on=("app_server_metrics",),
+		),
+		Collector("web_error_log", lambda _: get_web_error_log(site.get("bench"))),
+	]
 
 
 def get_site_health(site: frappe._dict) -> dict[str, Any]:
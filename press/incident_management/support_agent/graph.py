@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import contextlib
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import frappe
+
+from press.utils import log_error
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+
+MAX_WORKERS = 6
+COLLECTOR_TIMEOUT = 30  # seconds a single collector may run before its result is dropped
+COLLECTION_TIMEOUT = 60  # seconds after which every unfinished collector is dropped
+_POLL_INTERVAL = 0.5  # queued collectors start without notice, so check for timeouts at least this often
+
+
+@dataclass
+class Collector:
+	"""
+	One source of investigation context.
+
+	`function` is called with the results of the collectors named in `depends_on`,
+	keyed by name. A dependency that failed or timed out is passed as None.
+	"""
+
+	key: str
+	function: Callable[[dict[str, Any]], Any]
+	depends_on: tuple[str, ...] = ()
+	timeout: float = COLLECTOR_TIMEOUT
+
+
+def run_collectors(
+	collectors: list[Collector],
+	max_workers: int = MAX_WORKERS,
+	timeout: float = COLLECTION_TIMEOUT,
+	concurrent: bool | None = None,
+) -> tuple[dict[str, Any], dict[str, dict]]:
+	"""
+	Runs collectors as soon as their dependencies finish, on a bounded thread pool.
+
+	Returns the results and, for every collector, its status and duration. A collector
+	that runs past its timeout is abandoned and reported as `timed_out`, so a slow
+	source leaves a gap in the context instead of holding up the whole investigation.
+	Tests run collectors in order on the calling thread, where timeouts can't apply.
+	"""
+	collectors = _sort(collectors)
+	if concurrent is None:
+		concurrent = not frappe.flags.in_test
+	if not concurrent:
+		return _run_in_order(collectors)
+	return _ConcurrentRun(collectors, timeout).run(max_workers)
+
+
+def _run_in_order(collectors: list[Collector]) -> tuple[dict[str, Any], dict[str, dict]]:
+	results, timings = {}, {}
+	for collector in collectors:
+		dependencies = {dependency: results.get(dependency) for dependency in collector.depends_on}
+		results[collector.key], timings[collector.key] = _call(collector, dependencies, {})
+	return results, timings
+
+
+class _ConcurrentRun:
+	def __init__(self, collectors: list[Collector], timeout: float):
+		self.results: dict[str, Any] = {}
+		self.timings: dict[str, dict] = {}
+		self.pending = {collector.key: collector for collector in collectors}
+		self.running: dict[Future, Collector] = {}
+		self.started: dict[str, float] = {}
+		self.deadline = time.monotonic() + timeout
+		self.context = (frappe.local.site, frappe.local.sites_path, frappe.session.user)
+
+	def run(self, max_workers: int) -> tuple[dict[str, Any], dict[str, dict]]:
+		executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="support-agent")
+		try:
+			while self.pending or self.running:
+				self.submit_ready(executor)
+				self.drop_timed_out()
+				if self.running:
+					self.wait_for_next()
+		finally:
+			# Abandoned collectors keep their thread until they return, don't wait for them
+			executor.shutdown(wait=False, cancel_futures=True)
+		return self.results, self.timings
+
+	def submit_ready(self, executor: ThreadPoolExecutor):
+		"""Starts every pending collector whose dependencies have finished."""
+		for key, collector in list(self.pending.items()):
+			if not all(dependency in self.timings for dependency in collector.depends_on):
+				continue
+			dependencies = {dependency: self.results.get(dependency) for dependency in collector.depends_on}
+			future = executor.submit(_call_in_site, self.context, collector, dependencies, self.started)
+			self.running[future] = collector
+			del self.pending[key]
+
+	def drop_timed_out(self):
+		now = time.monotonic()
+		for future, collector in list(self.running.items()):
+			start = self.started.get(collector.key)
+			if future.done() or not (now >= self.deadline or (start and now - start >= collector.timeout)):
+				continue
+			future.cancel()
+			del self.running[future]
+			self.results[collector.key] = None
+			self.timings[collector.key] = {
+				"status": "timed_out" if start else "skipped",
+				"duration_ms": _milliseconds(now - start) if start else 0,
+			}
+
+	def wait_for_next(self):
+		"""Waits until a collector finishes or the earliest timeout expires."""
+		expiries = [self.started[c.key] + c.timeout for c in self.running.values() if c.key in self.started]
+		wait_for = min([self.deadline, *expiries]) - time.monotonic()
+		done, _ = wait(
+			self.running, timeout=min(max(wait_for, 0), _POLL_INTERVAL), return_when=FIRST_COMPLETED
+		)
+		for future in done:
+			collector = self.running.pop(future)
+			self.results[collector.key], self.timings[collector.key] = future.result()
+
+
+def _call_in_site(
+	context: tuple[str, str, str], collector: Collector, dependencies: dict[str, Any], started: dict
+) -> tuple[Any, dict]:
+	"""Worker threads don't share the request's site context, each collector connects on its own."""
+	site, sites_path, user = context
+	try:
+		frappe.init(site=site, sites_path=sites_path)
+		frappe.connect()
+		frappe.set_user(user)
+		result = _call(collector, dependencies, started)
+		# Collectors only read, this keeps error logs and agent request logs they wrote
+		frappe.db.commit()
+		return result
+	except Exception as e:
+		# Setting up the site failed, the error log can only be written if the database is reachable
+		with contextlib.suppress(Exception):
+			log_error("Support Agent Collector Failed", collector=collector.key)
+		return None, {"status": "failed", "error": type(e).__name__, "duration_ms": 0}
+	finally:
+		frappe.destroy()
+
+
+def _call(collector: Collector, dependencies: dict[str, Any], started: dict) -> tuple[Any, dict]:
+	started[collector.key] = start = time.monotonic()
+	try:
+		result = collector.function(dependencies)
+	except Exception as e:
+		log_error("Support Agent Collector Failed", collector=collector.key)
+		return None, {
+			"status": "failed",
+			"error": type(e).__name__,
+			"duration_ms": _milliseconds(time.monotonic() - start),
+		}
+	return result, {"status": "ok", "duration_ms": _milliseconds(time.monotonic() - start)}
+
+
+def _sort(collectors: list[Collector]) -> list[Collector]:
+	"""Orders collectors so that each comes after its dependencies."""
+	by_key = {collector.key: collector for collector in collectors}
+	ordered, visiting, visited = [], set(), set()
+
+	def visit(collector: Collector):
+		if collector.key in visited:
+			return
+		if collector.key in visiting:
+			frappe.throw(f"Collector {collector.key} is part of a dependency cycle")
+		visiting.add(collector.key)
+		for dependency in collector.depends_on:
+			if dependency not in by_key:
+				frappe.throw(f"Collector {collector.key} depends on unknown collector {dependency}")
+			visit(by_key[dependency])
+		visiting.discard(collector.key)
+		visited.add(collector.key)
+		ordered.append(collector)
+
+	for collector in collectors:
+		visit(collector)
+	return ordered
+
+
+def _milliseconds(seconds: float) -> int:
+	return round(seconds * 1000)
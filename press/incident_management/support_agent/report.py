@@ -29,6 +29,7 @@ def generate_report(payload: dict[str, Any]) -> dict[str, Any]:
 	slow_query_share = payload.get("database_slow_query_share") or {}
 	request_share = payload.get("app_server_request_share") or {}
 	web_error_log = payload.get("web_error_log") or {}
+	collectors = payload.get("collectors") or {}
 
 	_add_site_evidence(site, evidence, causes, next_steps)
 	_add_bench_evidence(bench, evidence, causes, next_steps)
@@ -62,6 +63,7 @@ def generate_report(payload: dict[str, Any]) -> dict[str, Any]:
 		next_steps.append(
 			"Review customer-provided symptoms and rerun investigation after reproducing the issue."
 		)
+	_add_incomplete_collector_steps(collectors, next_steps)
 
 	return {
 		"summary": _summary(site, causes, evidence),
@@ -287,6 +289,15 @@ def _summary(site, causes, evidence):
 	return f"Investigation for {site.get('name')} found no obvious platform-side issue."
 
 
+def _add_incomplete_collector_steps(collectors, next_steps):
+	incomplete = [key for key, timing in collectors.items() if timing.get("status") != "ok"]
+	if incomplete:
+		next_steps.append(
+			f"Some checks did not complete ({', '.join(incomplete)}); rerun the investigation "
+			"before ruling out the causes they cover."
+		)
+
+
 def _has_blocking_signal(site, bench, deployments, incidents):
 	return bool(
 		site.get("status") != "Active"
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from press.incident_management.support_agent.graph import Collector, run_collectors
+
+
+class TestCollectorGraph(FrappeTestCase):
+	def test_collectors_receive_the_results_of_their_dependencies(self):
+		results, timings = run_collectors(
+			[
+				Collector("share", lambda results: results["metrics"]["cpu"] * 2, depends_on=("metrics",)),
+				Collector("metrics", lambda _: {"cpu": 21}),
+			]
+		)
+
+		self.assertEqual(results, {"metrics": {"cpu": 21}, "share": 42})
+		self.assertEqual(list(timings), ["metrics", "share"])
+		self.assertEqual({timing["status"] for timing in timings.values()}, {"ok"})
+
+	def test_dependency_cycles_are_rejected(self):
+		with self.assertRaises(frappe.ValidationError):
+			run_collectors(
+				[
+					Collector("a", lambda _: None, depends_on=("b",)),
+					Collector("b", lambda _: None, depends_on=("a",)),
+				]
+			)
+
+	def test_slow_collector_times_out_without_holding_up_the_rest(self):
+		def slow(_):
+			time.sleep(2)
+			return "late"
+
+		start = time.monotonic()
+		results, timings = run_collectors(
+			[
+				Collector("slow", slow, timeout=0.2),
+				Collector("fast", lambda _: "done"),
+				Collector("after_slow", lambda results: results["slow"], depends_on=("slow",)),
+			],
+			concurrent=True,
+		)
+
+		self.assertLess(time.monotonic() - start, 1.5)
+		self.assertEqual(results, {"slow": None, "fast": "done", "after_slow": None})
+		self.assertEqual(timings["slow"]["status"], "timed_out")
+		self.assertEqual(timings["fast"]["status"], "ok")
+		self.assertEqual(timings["after_slow"]["status"], "ok")
@@ -885,3 +885,17 @@ class TestSupportAgentReport(FrappeTestCase):
 		steps = report["recommended_next_steps"]
 		self.assertEqual(len(steps), len(set(steps)), steps)
 		self.assertIn("Another tenant", report["likely_cause"])
+
+	def test_incomplete_collectors_are_listed_in_next_steps(self):
+		report = generate_report(
+			{
+				"site": {"name": "test.frappe.cloud", "status": "Active", "usage_percent": {}},
+				"collectors": {
+					"bench": {"status": "ok", "duration_ms": 4},
+					"app_server_metrics": {"status": "timed_out", "duration_ms": 30000},
+				},
+			}
+		)
+
+		self.assertEqual(report["confidence"], "Low")
+		self.assertTrue(any("app_server_metrics" in step for step in report["recommended_next_steps"]))
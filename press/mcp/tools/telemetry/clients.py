@@ -1,60 +1,197 @@
 # Copyright (c) 2026, Frappe and contributors
 # For license information, please see license.txt
+"""Pooled Prometheus and Elasticsearch clients shared by the telemetry tools.
 
-from typing import Any
+Identical requests are fetched once: concurrent callers wait for the request in flight
+and later callers read the short-lived cached response.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
 import frappe
 import requests
 from frappe.utils.password import get_decrypted_password
 
+from press.agent_transport import get_session
 from press.mcp.guardrails.redaction import redact
 from press.mcp.tools.telemetry.config import DEFAULT_TIMEOUT
 
+if TYPE_CHECKING:
+	from frappe.model.document import Document
+
+CACHE_KEY_PREFIX = "telemetry_response"
+RESPONSE_TTL = 30
+# Instant query times and range bounds are floored to this, so near-identical queries share a response
+ALIGN_SECONDS = 30
+CREDENTIALS_TTL = 5 * 60
+CREDENTIALS_VERSION_KEY = "telemetry_credentials_version"
+MAX_CONCURRENT_REQUESTS = 4  # per backend and process
+QUEUE_TIMEOUT = 30
+
+_lock = threading.Lock()
+_credentials: dict[tuple[str, str], tuple[str, str, float]] = {}
+_credentials_version: str | None = None
+_in_flight: dict[tuple[str, str], InFlightRequest] = {}
+_semaphores = {
+	"prometheus": threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS),
+	"elasticsearch": threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS),
+}
+
+
+class InFlightRequest:
+	def __init__(self):
+		self.done = threading.Event()
+		self.response: dict | None = None
+		self.exception: Exception | None = None
+
 
 def prometheus_get(endpoint: str, params: dict[str, Any]) -> dict:
-	monitor_server = frappe.db.get_single_value("Press Settings", "monitor_server")
-	if not monitor_server:
+	def fetch():
+		monitor_server, password = get_credentials("Monitor Server", "monitor_server", "grafana_password")
+		url = f"https://{monitor_server}/prometheus/api/v1/{endpoint}"
+		try:
+			response = get_session(monitor_server).get(
+				url, params=params, auth=("frappe", password), timeout=DEFAULT_TIMEOUT
+			)
+			response.raise_for_status()
+		except requests.Timeout:
+			frappe.throw("Prometheus query timed out. Try a shorter range, larger step, or smaller limit.")
+		except requests.HTTPError:
+			frappe.throw(f"Prometheus request failed with HTTP {response.status_code}")
+		except requests.RequestException as e:
+			frappe.throw(f"Prometheus request failed: {type(e).__name__}")
+
+		data = response.json()
+		if data.get("status") != "success":
+			frappe.throw(data.get("error") or "Prometheus query failed")
+
+		return redact(data)
+
+	return fetch_once("prometheus", [endpoint, normalize_prometheus_params(params)], fetch)
+
+
+def elasticsearch_post(body: dict, *, should_redact: bool = True) -> dict:
+	def fetch():
+		log_server, password = get_credentials("Log Server", "log_server", "kibana_password")
+		url = f"https://{log_server}/elasticsearch/filebeat-*/_search"
+		try:
+			response = get_session(log_server).post(
+				url, json=body, auth=("frappe", password), timeout=DEFAULT_TIMEOUT
+			)
+			response.raise_for_status()
+		except requests.Timeout:
+			frappe.throw("Elasticsearch query timed out. Try a shorter time window or smaller limit.")
+		except requests.HTTPError:
+			frappe.throw(f"Elasticsearch request failed with HTTP {response.status_code}")
+		except requests.RequestException as e:
+			frappe.throw(f"Elasticsearch request failed: {type(e).__name__}")
+
+		data = response.json()
+		return redact(data) if should_redact else data
+
+	return fetch_once("elasticsearch", [body, should_redact], fetch)
+
+
+def fetch_once(backend: str, request: list, fetch) -> dict:
+	"""Returns the cached response of `request`, or joins or starts the fetch for it.
+
+	Callers get their own copy of the response, the tools trim responses in place.
+	"""
+	key = get_cache_key(backend, request)
+	cached = frappe.cache.get_value(key)
+	if cached:
+		return copy.deepcopy(cached)
+
+	# Redis keys are per site already, requests in flight are shared by every site of the process
+	in_flight_key = (frappe.local.site, key)
+	with _lock:
+		in_flight = _in_flight.get(in_flight_key)
+		is_leader = in_flight is None
+		if is_leader:
+			in_flight = _in_flight[in_flight_key] = InFlightRequest()
+
+	if not is_leader:
+		in_flight.done.wait()
+		if in_flight.exception:
+			raise in_flight.exception
+		return copy.deepcopy(in_flight.response)
+
+	try:
+		if not _semaphores[backend].acquire(timeout=QUEUE_TIMEOUT):
+			frappe.throw(f"Too many {backend} requests in progress. Please retry in a few seconds.")
+		try:
+			in_flight.response = fetch()
+		finally:
+			_semaphores[backend].release()
+		frappe.cache.set_value(key, in_flight.response, expires_in_sec=RESPONSE_TTL)
+	except Exception as e:
+		in_flight.exception = e
+		raise
+	finally:
+		with _lock:
+			_in_flight.pop(in_flight_key, None)
+		in_flight.done.set()
+
+	return copy.deepcopy(in_flight.response)
+
+
+def get_credentials(doctype: str, settings_field: str, password_field: str) -> tuple[str, str]:
+	_drop_stale_credentials()
+	key = (frappe.local.site, settings_field)
+	server, password, expires_at = _credentials.get(key, (None, None, 0))
+	if server and expires_at > time.monotonic():
+		return server, password
+
+	server = frappe.db.get_single_value("Press Settings", settings_field)
+	if not server:
+		_credentials.pop(key, None)
 		frappe.throw(
-			"Monitor server not configured in Press Settings. Please configure it under Press Settings."
+			f"{doctype.capitalize()} not configured in Press Settings. Please configure it under Press Settings."
 		)
 
-	password = get_decrypted_password("Monitor Server", monitor_server, "grafana_password")
-	url = f"https://{monitor_server}/prometheus/api/v1/{endpoint}"
+	password = str(get_decrypted_password(doctype, server, password_field))
+	_credentials[key] = (server, password, time.monotonic() + CREDENTIALS_TTL)
+	return server, password
 
-	try:
-		response = requests.get(url, params=params, auth=("frappe", str(password)), timeout=DEFAULT_TIMEOUT)
-		response.raise_for_status()
-	except requests.Timeout:
-		frappe.throw("Prometheus query timed out. Try a shorter range, larger step, or smaller limit.")
-	except requests.HTTPError:
-		frappe.throw(f"Prometheus request failed with HTTP {response.status_code}")
-	except requests.RequestException as e:
-		frappe.throw(f"Prometheus request failed: {type(e).__name__}")
 
-	data = response.json()
-	if data.get("status") != "success":
-		frappe.throw(data.get("error") or "Prometheus query failed")
+def clear_credentials(doc: Document | None = None, method: str | None = None):
+	"""Invalidates cached credentials in every process. Hooked on monitor server, log server and settings changes."""
+	_credentials.clear()
+	frappe.cache.set_value(CREDENTIALS_VERSION_KEY, frappe.generate_hash(length=8))
 
-	return redact(data)
 
+def _drop_stale_credentials():
+	"""Clears local credentials when another process has invalidated them."""
+	global _credentials_version
+	version = frappe.cache.get_value(CREDENTIALS_VERSION_KEY)
+	if version != _credentials_version:
+		_credentials.clear()
+		_credentials_version = version
 
-def elasticsearch_post(body: dict, *, should_redact: bool = True) -> dict:
-	log_server = frappe.db.get_single_value("Press Settings", "log_server")
-	if not log_server:
-		frappe.throw("Log server not configured in Press Settings. Please configure it under Press Settings.")
 
-	password = get_decrypted_password("Log Server", log_server, "kibana_password")
-	url = f"https://{log_server}/elasticsearch/filebeat-*/_search"
+def normalize_prometheus_params(params: dict[str, Any]) -> dict[str, Any]:
+	"""Params as they go into the cache key, only the original params are sent to Prometheus.
 
-	try:
-		response = requests.post(url, json=body, auth=("frappe", str(password)), timeout=DEFAULT_TIMEOUT)
-		response.raise_for_status()
-	except requests.Timeout:
-		frappe.throw("Elasticsearch query timed out. Try a shorter time window or smaller limit.")
-	except requests.HTTPError:
-		frappe.throw(f"Elasticsearch request failed with HTTP {response.status_code}")
-	except requests.RequestException as e:
-		frappe.throw(f"Elasticsearch request failed: {type(e).__name__}")
-
-	data = response.json()
-	return redact(data) if should_redact else data
+	Collapses whitespace in the query and floors timestamps, an unaligned `now` would never repeat.
+	"""
+	params = dict(params)
+	if isinstance(params.get("query"), str):
+		params["query"] = re.sub(r"\s+", " ", params["query"]).strip()
+	for field in ("time", "start", "end"):
+		value = params.get(field)
+		if isinstance(value, int | float) and not isinstance(value, bool):
+			params[field] = int(value) - int(value) % ALIGN_SECONDS
+	return params
+
+
+def get_cache_key(backend: str, request: list) -> str:
+	digest = hashlib.sha1(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+	return f"{CACHE_KEY_PREFIX}:{backend}:{digest}"
@@ -0,0 +1,144 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from press.mcp.tools.telemetry import clients
+
+
+class FakeCache:
+	"""Worker threads of these tests have no site, so they can't reach redis."""
+
+	def __init__(self):
+		self.values = {}
+
+	def get_value(self, key):
+		return self.values.get(key)
+
+	def set_value(self, key, value, expires_in_sec=None):
+		self.values[key] = value
+
+
+class TestTelemetryClients(FrappeTestCase):
+	def setUp(self):
+		self.cache = FakeCache()
+		patcher = patch("press.mcp.tools.telemetry.clients.frappe.cache", new=self.cache)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		self.request = ["query", {"query": "up", "time": frappe.generate_hash()}]
+		self.key = clients.get_cache_key("prometheus", self.request)
+		self.in_flight_key = (frappe.local.site, self.key)
+
+	def test_concurrent_identical_requests_are_fetched_once(self):
+		started, release = threading.Event(), threading.Event()
+		calls = []
+
+		def fetch():
+			calls.append(1)
+			started.set()
+			release.wait(5)
+			return {"data": [1]}
+
+		def lead(site):
+			frappe.local.site = site
+			clients.fetch_once("prometheus", self.request, fetch)
+
+		leader = threading.Thread(target=lead, args=(frappe.local.site,))
+		leader.start()
+		self.assertTrue(started.wait(5))
+		self.assertIn(self.in_flight_key, clients._in_flight)
+		threading.Timer(0.1, release.set).start()
+
+		self.assertEqual(clients.fetch_once("prometheus", self.request, fetch), {"data": [1]})
+		leader.join(5)
+		self.assertEqual(len(calls), 1)
+		self.assertNotIn(self.in_flight_key, clients._in_flight)
+
+	def test_waiting_callers_get_the_exception_of_the_leader(self):
+		in_flight = clients._in_flight[self.in_flight_key] = clients.InFlightRequest()
+		self.addCleanup(clients._in_flight.pop, self.in_flight_key, None)
+		in_flight.exception = frappe.ValidationError("Prometheus query timed out")
+		in_flight.done.set()
+
+		with self.assertRaises(frappe.ValidationError):
+			clients.fetch_once("prometheus", self.request, self.fail)
+
+	def test_leader_exception_is_raised_and_not_cached(self):
+		def fetch():
+			raise frappe.ValidationError("Prometheus request failed with HTTP 502")
+
+		with self.assertRaises(frappe.ValidationError):
+			clients.fetch_once("prometheus", self.request, fetch)
+		self.assertNotIn(self.key, self.cache.values)
+		self.assertNotIn(self.in_flight_key, clients._in_flight)
+
+	def test_request_waits_for_a_free_slot_until_queue_timeout(self):
+		semaphore = clients._semaphores["prometheus"]
+		acquired = 0
+		while semaphore.acquire(blocking=False):
+			acquired += 1
+		for _ in range(acquired):
+			self.addCleanup(semaphore.release)
+
+		with patch.object(clients, "QUEUE_TIMEOUT", 0.1), self.assertRaises(frappe.ValidationError):
+			clients.fetch_once("prometheus", self.request, self.fail)
+		self.assertNotIn(self.in_flight_key, clients._in_flight)
+
+	def test_requests_in_flight_are_not_shared_across_sites(self):
+		in_flight = clients._in_flight[("other.site", self.key)] = clients.InFlightRequest()
+		self.addCleanup(clients._in_flight.pop, ("other.site", self.key), None)
+		in_flight.response = {"data": "other site"}
+		in_flight.done.set()
+
+		self.assertEqual(
+			clients.fetch_once("prometheus", self.request, lambda: {"data": "this site"}),
+			{"data": "this site"},
+		)
+
+	def test_credentials_are_read_again_after_they_are_cleared(self):
+		self.addCleanup(clients._credentials.clear)
+
+		def get_password():
+			return clients.get_credentials("Monitor Server", "monitor_server", "grafana_password")[1]
+
+		with (
+			patch.object(clients.frappe.db, "get_single_value", return_value="monitor.example.com"),
+			patch.object(clients, "get_decrypted_password", side_effect=["old", "new", "newer"]),
+		):
+			self.assertEqual(get_password(), "old")
+			self.assertEqual(get_password(), "old")
+
+			clients.clear_credentials()
+			self.assertEqual(get_password(), "new")
+
+			# Cleared by another process
+			self.cache.values[clients.CREDENTIALS_VERSION_KEY] = frappe.generate_hash()
+			self.assertEqual(get_password(), "newer")
+
+	def test_callers_get_their_own_copy_of_the_response(self):
+		first = clients.fetch_once("prometheus", self.request, lambda: {"data": {"result": [1, 2]}})
+		first["data"]["result"].clear()
+
+		second = clients.fetch_once("prometheus", self.request, self.fail)
+		self.assertEqual(second, {"data": {"result": [1, 2]}})
+		self.assertEqual(self.cache.values[self.key], {"data": {"result": [1, 2]}})
+
+	def test_prometheus_gets_the_original_params(self):
+		params = {"query": "sum(rate(x[5m]))\n  by (job)", "time": 1_700_000_017.5}
+		with (
+			patch.object(clients, "get_credentials", return_value=("monitor.example.com", "password")),
+			patch.object(clients, "get_session") as get_session,
+		):
+			get = get_session.return_value.get
+			get.return_value.json.return_value = {"status": "success", "data": {"result": []}}
+			clients.prometheus_get("query", params)
+			clients.prometheus_get("query", {**params, "time": 1_700_000_019})
+
+		get.assert_called_once()
+		self.assertEqual(get.call_args.kwargs["params"], params)
@@ -31,6 +31,81 @@ class MetricsRenderer:
 		for row in rows:
 			c.labels(row[status_field]).set(row.count)
 
+	def get_log_buffer_stats(self):
+		from press.auth import auth_log_buffer
+		from press.press.doctype.agent_job.agent_job import agent_log_buffer
+
+		backlog = Gauge(
+			"press_log_buffer_backlog",
+			"Log entries waiting in the buffer to be flushed",
+			["buffer"],
+			registry=self.registry,
+		)
+		throughput = Gauge(
+			"press_log_buffer_flush_throughput",
+			"Entries written per second by the last buffer flush",
+			["buffer"],
+			registry=self.registry,
+		)
+		for buffer in (auth_log_buffer, agent_log_buffer):
+			stats = buffer.stats()
+			backlog.labels(buffer.key).set(stats["backlog"])
+			throughput.labels(buffer.key).set(stats.get("throughput", 0))
+
+	def get_chart_cache_stats(self):
+		from press.api.analytics import get_chart_cache_stats
+
+		requests = Gauge(
+			"press_request_log_chart_cache_requests",
+			"Request log chart lookups by cache outcome, a partial hit refreshes only the trailing buckets",
+			["outcome"],
+			registry=self.registry,
+		)
+		stats = get_chart_cache_stats()
+		for outcome in ("hit", "partial", "miss"):
+			requests.labels(outcome).set(stats[outcome])
+
+	def get_incident_tick_stats(self):
+		from press.press.doctype.incident.incident import get_incident_tick_stats
+
+		duration = Gauge(
+			"press_incident_tick_duration_seconds",
+			"Duration of the last incident validate or resolve run",
+			["tick"],
+			registry=self.registry,
+		)
+		incidents = Gauge(
+			"press_incident_tick_incidents",
+			"Incidents processed by the last validate or resolve run",
+			["tick"],
+			registry=self.registry,
+		)
+		for tick, stats in get_incident_tick_stats().items():
+			duration.labels(tick).set(stats.get("duration", 0))
+			incidents.labels(tick).set(stats.get("incidents", 0))
+
+	def get_workflow_object_stats(self):
+		from press.workflow_engine.doctype.press_workflow_object.press_workflow_object import (
+			get_object_size_stats,
+		)
+
+		objects = Gauge(
+			"press_workflow_objects",
+			"Objects passed to or returned by workflow tasks in the last day",
+			["method"],
+			registry=self.registry,
+		)
+		size = Gauge(
+			"press_workflow_object_bytes",
+			"Raw and stored size of workflow task objects in the last day",
+			["method", "kind"],
+			registry=self.registry,
+		)
+		for method, stats in get_object_size_stats().items():
+			objects.labels(method).set(stats["count"])
+			size.labels(method, "raw").set(stats["size"])
+			size.labels(method, "stored").set(stats["stored_size"])
+
 	def metrics(self):
 		suspended_builds = Gauge(
 			"press_builds_suspended", "Are docker builds suspended", registry=self.registry
@@ -67,6 +142,10 @@ class MetricsRenderer:
 		self.get_status(
 			"press_agent_job_total", "Agent Job", filters={"status": ("!=", "Success")}
 		)
+		self.get_log_buffer_stats()
+		self.get_chart_cache_stats()
+		self.get_workflow_object_stats()
+		self.get_incident_tick_stats()
 
 		return generate_latest(self.registry).decode("utf-8")
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import os
 import random
 import traceback
 from typing import TYPE_CHECKING
@@ -24,6 +23,13 @@ from frappe.utils import (
 from press.access.support_access import has_support_access
 from press.agent import Agent, AgentCallbackException, AgentRequestSkippedException
 from press.api.client import dashboard_whitelist, is_owned_by_team
+from press.press.doctype.agent_job.poll_scheduler import JobPollScheduler, should_poll_backup_jobs
+from press.press.doctype.agent_job.progress_updates import (
+	ProgressUpdateBatch,
+	get_step_output,
+	get_step_values,
+	is_progress_only,
+)
 from press.press.doctype.agent_job_type.agent_job_type import (
 	get_retryable_job_types_and_max_retry_count,
 )
@@ -34,8 +40,10 @@ from press.press.doctype.site_migration.site_migration import (
 )
 from press.press.doctype.telegram_message.telegram_message import TelegramMessage
 from press.utils import log_error, timer
+from press.utils.log_buffer import LogBuffer
 
 AGENT_LOG_KEY = "agent-jobs"
+agent_log_buffer = LogBuffer(AGENT_LOG_KEY, f"{AGENT_LOG_KEY}.json.log")
 AGENT_JOB_TIMEOUT_HOURS = 4
 
 BYPASS_AGENT_JOB_HALT = ["Change Bench Directory", "Remove Redis Localhost Bind"]
@@ -484,17 +492,26 @@ def publish_update(job):
 
 
 @timer
-def poll_random_jobs(agent, pending_ids):
-	random_pending_ids = random.sample(pending_ids, k=min(100, len(pending_ids)))
-	return agent.get_jobs_status(random_pending_ids)
+def poll_jobs(agent, scheduler: JobPollScheduler):
+	return agent.get_jobs_status(scheduler.next_batch())
 
 
 @timer
-def handle_polled_jobs(polled_jobs, pending_jobs):
-	for polled_job in polled_jobs:
-		if not polled_job:
-			continue
-		handle_polled_job(pending_jobs=pending_jobs, polled_job=polled_job)
+def handle_polled_jobs(polled_jobs, pending_jobs, scheduler: JobPollScheduler):
+	progress_only, with_callbacks = [], []
+	for polled_job in scheduler.changed(polled_jobs):
+		if is_progress_only(polled_job, scheduler.pending_jobs[polled_job["id"]]):
+			progress_only.append(polled_job)
+		else:
+			with_callbacks.append(polled_job)
+
+	for polled_job in ProgressUpdateBatch(progress_only, scheduler.pending_jobs).apply():
+		scheduler.mark_handled(polled_job)
+		publish_update(scheduler.pending_jobs[polled_job["id"]].name)
+
+	for polled_job in with_callbacks:
+		if handle_polled_job(pending_jobs=pending_jobs, polled_job=polled_job):
+			scheduler.mark_handled(polled_job)
 
 
 def add_timer_data_to_monitor(server):
@@ -514,7 +531,7 @@ def poll_pending_jobs_server(server):
 
 	pending_jobs = frappe.get_all(
 		"Agent Job",
-		fields=["name", "job_id", "status", "callback_failure_count"],
+		fields=["name", "job_id", "job_type", "status", "callback_failure_count"],
 		filters={
 			"status": ("in", ["Pending", "Running"]),
 			"job_id": ("!=", 0),
@@ -529,15 +546,12 @@ def poll_pending_jobs_server(server):
 		add_timer_data_to_monitor(server.server)
 		return
 
-	pending_ids = [j.job_id for j in pending_jobs]
-	polled_jobs = poll_random_jobs(agent, pending_ids)
+	scheduler = JobPollScheduler(server.server, pending_jobs)
+	polled_jobs = poll_jobs(agent, scheduler)
 
-	if not polled_jobs:
-		retry_undelivered_jobs(server)
-		add_timer_data_to_monitor(server.server)
-		return
-
-	handle_polled_jobs(polled_jobs, pending_jobs)
+	if polled_jobs:
+		handle_polled_jobs(polled_jobs, pending_jobs, scheduler)
+	scheduler.save()
 
 	retry_undelivered_jobs(server)
 	add_timer_data_to_monitor(server.server)
@@ -564,6 +578,7 @@ def handle_polled_job(polled_job, pending_jobs=None, job=None):
 
 		frappe.db.commit()
 		publish_update(job.name)
+		return True
 	except AgentCallbackException:
 		# Don't log error for AgentCallbackException
 		# it's already logged
@@ -576,6 +591,7 @@ def handle_polled_job(polled_job, pending_jobs=None, job=None):
 			job.callback_failure_count + 1,
 		)
 		frappe.db.commit()
+		return False
 	except Exception:
 		log_error(
 			"Agent Job Poll Exception",
@@ -585,6 +601,7 @@ def handle_polled_job(polled_job, pending_jobs=None, job=None):
 			reference_name=job.name,
 		)
 		frappe.db.rollback()
+		return False
 
 
 def populate_output_cache(polled_job, job):
@@ -598,12 +615,7 @@ def populate_output_cache(polled_job, job):
 	for step in steps:
 		polled_step = find(polled_job["steps"], lambda x: x["name"] == step.step_name)
 		if polled_step:
-			lines = []
-			for command in polled_step.get("commands", []):
-				output = command.get("output", "").strip()
-				if output:
-					lines.append(output)
-			frappe.cache.hset("agent_job_step_output", step.name, "\n".join(lines))
+			frappe.cache.hset("agent_job_step_output", step.name, get_step_output(polled_step))
 
 
 def filter_active_servers(servers):
@@ -637,10 +649,7 @@ def poll_pending_jobs():
 	Poll pending job fetches the status of Pending Jobs from all servers.
 	"""
 	filters = {"status": ("in", ["Pending", "Running", "Undelivered"])}
-	if random.random() > 0.1:
-		# Experimenting with fewer polls (only for backup jobs)
-		# Reduce poll frequency for Backup Site jobs
-		# TODO: Replace this with something deterministic
+	if not should_poll_backup_jobs():
 		filters["job_type"] = ("!=", "Backup Site")
 	servers = frappe.get_all(
 		"Agent Job",
@@ -787,27 +796,7 @@ def update_steps(job_name, job):
 
 
 def update_step(step_name, step):
-	step_data = json.dumps(step["data"], indent=4, sort_keys=True)
-
-	output = None
-	traceback = None
-	if isinstance(step["data"], dict):
-		traceback = to_str(step["data"].get("traceback", ""))
-		output = to_str(step["data"].get("output", ""))
-
-	frappe.db.set_value(
-		"Agent Job Step",
-		step_name,
-		{
-			"start": step["start"],
-			"end": step["end"],
-			"duration": step["duration"],
-			"status": step["status"],
-			"data": step_data,
-			"output": output,
-			"traceback": traceback,
-		},
-	)
+	frappe.db.set_value("Agent Job Step", step_name, get_step_values(step))
 
 
 def skip_pending_steps(job_name):
@@ -1244,7 +1233,7 @@ def log_update(job, start, exception=None):
 		if exception:
 			data["exception"] = exception
 		serialized = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
-		frappe.cache().rpush(AGENT_LOG_KEY, serialized)
+		agent_log_buffer.push(serialized)
 	except Exception:
 		traceback.print_exc()
 
@@ -1291,34 +1280,9 @@ def on_doctype_update():
 	frappe.db.add_index("Agent Job", ["creation"])
 
 
-def to_str(data) -> str:
-	if isinstance(data, str):
-		return data
-
-	try:
-		return json.dumps(data, default=str)
-	except Exception:
-		pass
-
-	try:
-		return str(data)
-	except Exception:
-		return ""
-
-
 def flush():
-	log_file = os.path.join(frappe.utils.get_bench_path(), "logs", f"{AGENT_LOG_KEY}.json.log")
 	try:
-		# Fetch all entries without removing from cache
-		logs = frappe.cache().lrange(AGENT_LOG_KEY, 0, -1)
-		print("LOGS", logs)
-		if logs:
-			logs = list(map(frappe.safe_decode, logs))
-			with open(log_file, "a", os.O_NONBLOCK) as f:
-				f.write("\n".join(logs))
-				f.write("\n")
-			# Remove fetched entries from cache
-			frappe.cache().ltrim(AGENT_LOG_KEY, len(logs) - 1, -1)
+		agent_log_buffer.flush()
 	except Exception:
 		traceback.print_exc()
 
@@ -0,0 +1,79 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+
+import frappe
+
+POLL_BATCH_SIZE = 100
+POLL_STATE_KEY = "agent_job_poll_state"
+POLL_CYCLE_KEY = "agent_job_poll_cycle"
+BACKUP_POLL_EVERY_N_CYCLES = 10
+
+
+class JobPollScheduler:
+	"""Polls the least recently polled jobs of a server first.
+
+	Every pending job is polled within ceil(pending / POLL_BATCH_SIZE) cycles.
+	Polled jobs that haven't changed since the last handled poll are skipped.
+	"""
+
+	def __init__(self, server: str, pending_jobs: list):
+		self.server = server
+		self.pending_jobs = {job.job_id: job for job in pending_jobs}
+		state = frappe.cache.get_value(self.key) or {}
+		self.polled_at: dict[int, float] = state.get("polled_at", {})
+		self.fingerprints: dict[int, str] = state.get("fingerprints", {})
+
+	@property
+	def key(self) -> str:
+		return f"{POLL_STATE_KEY}:{self.server}"
+
+	def next_batch(self) -> list[int]:
+		ids = sorted(self.pending_jobs, key=lambda job_id: self.polled_at.get(job_id, 0))
+		ids = ids[:POLL_BATCH_SIZE]
+		now = time.time()
+		for job_id in ids:
+			self.polled_at[job_id] = now
+		return ids
+
+	def changed(self, polled_jobs: list[dict]) -> list[dict]:
+		return [polled_job for polled_job in polled_jobs if polled_job and self.has_changed(polled_job)]
+
+	def has_changed(self, polled_job: dict) -> bool:
+		job = self.pending_jobs.get(polled_job["id"])
+		if not job:
+			return False
+		if job.status != polled_job["status"]:
+			return True
+		if polled_job["status"] not in ("Pending", "Running"):
+			# Terminal jobs still pending here had their callback fail, retry them
+			return True
+		return self.fingerprints.get(polled_job["id"]) != get_fingerprint(polled_job)
+
+	def mark_handled(self, polled_job: dict):
+		self.fingerprints[polled_job["id"]] = get_fingerprint(polled_job)
+
+	def save(self):
+		state = {
+			"polled_at": self._only_pending(self.polled_at),
+			"fingerprints": self._only_pending(self.fingerprints),
+		}
+		frappe.cache.set_value(self.key, state, expires_in_sec=60 * 60)
+
+	def _only_pending(self, values: dict) -> dict:
+		return {job_id: value for job_id, value in values.items() if job_id in self.pending_jobs}
+
+
+def get_fingerprint(polled_job: dict) -> str:
+	serialized = json.dumps(polled_job, sort_keys=True, default=str)
+	return hashlib.sha1(serialized.encode(), usedforsecurity=False).hexdigest()
+
+
+def should_poll_backup_jobs() -> bool:
+	"""Backup jobs are long running, poll them every few cycles instead of every cycle."""
+	cycle = frappe.cache.incr(frappe.cache.make_key(POLL_CYCLE_KEY))
+	return cycle % BACKUP_POLL_EVERY_N_CYCLES == 0
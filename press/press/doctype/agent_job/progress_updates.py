@@ -0,0 +1,128 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import frappe
+from frappe.utils import cint
+
+from press.utils import log_error
+
+if TYPE_CHECKING:
+	from collections.abc import Iterable
+
+# Callbacks of these job types consume step progress, poll them one at a time
+PROGRESS_CALLBACK_JOB_TYPES = ("Run Remote Builder", "Run Patch Build")
+
+
+def is_progress_only(polled_job: dict, job) -> bool:
+	"""Job is still pending or running and only its steps moved, so no callback needs to run."""
+	from press.press.doctype.agent_job.agent_job import get_pair_jobs
+
+	return (
+		job.status == polled_job["status"]
+		and job.status in ("Pending", "Running")
+		and job.job_type not in PROGRESS_CALLBACK_JOB_TYPES
+		and job.job_type not in get_pair_jobs()
+	)
+
+
+class ProgressUpdateBatch:
+	"""Applies step progress of a batch of polled jobs with one read and a few multi-row updates."""
+
+	def __init__(self, polled_jobs: list[dict], jobs: dict):
+		self.polled_jobs = polled_jobs
+		self.polled_by_job = {jobs[polled_job["id"]].name: polled_job for polled_job in polled_jobs}
+
+	def apply(self) -> list[dict]:
+		"""Returns the polled jobs that were applied, none if the batch was rolled back."""
+		if not self.polled_jobs:
+			return []
+		try:
+			steps = self.get_steps()
+			updates = self.get_step_updates(steps)
+			frappe.db.bulk_update("Agent Job Step", updates)
+			self.populate_output_cache(steps, updates)
+			frappe.db.commit()
+		except Exception:
+			log_error("Agent Job Bulk Poll Exception", polled=self.polled_jobs)
+			frappe.db.rollback()
+			return []
+		return self.polled_jobs
+
+	def get_steps(self) -> list:
+		return frappe.get_all(
+			"Agent Job Step",
+			fields=["name", "agent_job", "step_name", "status"],
+			filters={
+				"agent_job": ("in", list(self.polled_by_job)),
+				"status": ("in", ["Pending", "Running"]),
+			},
+		)
+
+	def get_step_updates(self, steps: Iterable) -> dict[str, dict]:
+		updates = {}
+		for step in steps:
+			polled_step = self.get_polled_step(step)
+			if polled_step and polled_step["status"] != step.status:
+				updates[step.name] = get_step_values(polled_step)
+		return updates
+
+	def get_polled_step(self, step) -> dict | None:
+		for polled_step in self.polled_by_job[step.agent_job]["steps"]:
+			if polled_step["name"] == step.step_name:
+				return polled_step
+		return None
+
+	def populate_output_cache(self, steps: Iterable, updates: dict[str, dict]):
+		if not cint(frappe.get_cached_value("Press Settings", None, "realtime_job_updates")):
+			return
+		for step in steps:
+			status = updates.get(step.name, step).get("status")
+			polled_step = self.get_polled_step(step)
+			if status == "Running" and polled_step:
+				frappe.cache.hset("agent_job_step_output", step.name, get_step_output(polled_step))
+
+
+def get_step_values(step: dict) -> dict:
+	output = None
+	traceback = None
+	if isinstance(step["data"], dict):
+		traceback = to_str(step["data"].get("traceback", ""))
+		output = to_str(step["data"].get("output", ""))
+
+	return {
+		"start": step["start"],
+		"end": step["end"],
+		"duration": step["duration"],
+		"status": step["status"],
+		"data": json.dumps(step["data"], indent=4, sort_keys=True),
+		"output": output,
+		"traceback": traceback,
+	}
+
+
+def get_step_output(polled_step: dict) -> str:
+	lines = []
+	for command in polled_step.get("commands", []):
+		output = command.get("output", "").strip()
+		if output:
+			lines.append(output)
+	return "\n".join(lines)
+
+
+def to_str(data) -> str:
+	if isinstance(data, str):
+		return data
+
+	try:
+		return json.dumps(data, default=str)
+	except Exception:
+		pass
+
+	try:
+		return str(data)
+	except Exception:
+		return ""
@@ -17,6 +17,8 @@ from frappe.utils import add_days
 from press.agent import Agent
 from press.press.doctype.agent_job.agent_job import AgentJob, fail_old_jobs, lock_doc_updated_by_job
 from press.press.doctype.agent_job.agent_job_notifications import DOC_URLS, JobErr, get_details
+from press.press.doctype.agent_job.poll_scheduler import POLL_STATE_KEY, JobPollScheduler
+from press.press.doctype.agent_job.progress_updates import ProgressUpdateBatch, is_progress_only
 from press.press.doctype.app.test_app import create_test_app
 from press.press.doctype.app_release.test_app_release import create_test_app_release
 from press.press.doctype.app_source.test_app_source import create_test_app_source
@@ -351,6 +353,75 @@ class TestAgentJob(FrappeTestCase):
 		frappe.db.set_single_value("Press Settings", "disable_agent_job_deduplication", True)
 
 
+class TestJobPollScheduler(FrappeTestCase):
+	def tearDown(self):
+		frappe.cache.delete_value(f"{POLL_STATE_KEY}:test-poll-server")
+
+	def _pending_jobs(self, count: int, status: str = "Running"):
+		return [frappe._dict(name=f"job-{i}", job_id=i, status=status) for i in range(1, count + 1)]
+
+	def test_every_pending_job_is_polled_within_bounded_number_of_cycles(self):
+		pending_jobs = self._pending_jobs(250)
+		polled = set()
+		for _ in range(3):
+			scheduler = JobPollScheduler("test-poll-server", pending_jobs)
+			polled.update(scheduler.next_batch())
+			scheduler.save()
+
+		self.assertEqual(polled, {job.job_id for job in pending_jobs})
+
+	def test_unchanged_running_job_is_skipped_after_it_was_handled(self):
+		pending_jobs = self._pending_jobs(1)
+		polled_job = {"id": 1, "status": "Running", "steps": [{"name": "Step", "status": "Running"}]}
+
+		scheduler = JobPollScheduler("test-poll-server", pending_jobs)
+		self.assertEqual(scheduler.changed([polled_job]), [polled_job])
+		scheduler.mark_handled(polled_job)
+		scheduler.save()
+
+		scheduler = JobPollScheduler("test-poll-server", pending_jobs)
+		self.assertEqual(scheduler.changed([polled_job]), [])
+
+		polled_job["steps"][0]["status"] = "Success"
+		self.assertEqual(scheduler.changed([polled_job]), [polled_job])
+
+	def test_finished_job_whose_callback_failed_is_polled_again(self):
+		pending_jobs = self._pending_jobs(1)
+		polled_job = {"id": 1, "status": "Success", "steps": []}
+
+		scheduler = JobPollScheduler("test-poll-server", pending_jobs)
+		scheduler.mark_handled(polled_job)
+
+		self.assertEqual(scheduler.changed([polled_job]), [polled_job])
+
+
+@patch.object(AgentJob, "enqueue_http_request", new=Mock())
+class TestProgressUpdateBatch(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def _polled(self, job: AgentJob, step_status: str) -> dict:
+		step = {"name": "Force Remove Zombie Benches", "status": step_status, "data": {}}
+		step.update({"start": None, "end": None, "duration": None})
+		return {"id": job.job_id, "status": "Running", "steps": [step]}
+
+	def test_running_job_step_progress_is_written_without_callbacks(self):
+		job = create_test_agent_job(status="Running", job_id=7)
+		jobs = {7: frappe._dict(name=job.name, job_id=7, job_type=job.job_type, status="Running")}
+		polled_job = self._polled(job, "Success")
+
+		self.assertTrue(is_progress_only(polled_job, jobs[7]))
+		with patch("press.press.doctype.agent_job.progress_updates.frappe.db.commit"):
+			applied = ProgressUpdateBatch([polled_job], jobs).apply()
+
+		self.assertEqual(applied, [polled_job])
+		self.assertEqual(frappe.db.get_value("Agent Job Step", {"agent_job": job.name}, "status"), "Success")
+
+	def test_job_changing_status_is_not_progress_only(self):
+		job = frappe._dict(name="job", job_id=7, job_type="Force Remove Zombie Benches", status="Pending")
+		self.assertFalse(is_progress_only({"id": 7, "status": "Running", "steps": []}, job))
+
+
 @patch.object(AgentJob, "enqueue_http_request", new=Mock())
 class TestCancelJob(FrappeTestCase):
 	def tearDown(self):
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import math
+import time
 from functools import cached_property
 from typing import TYPE_CHECKING
 
@@ -31,6 +32,9 @@ if TYPE_CHECKING:
 		PrometheusAlertRule,
 	)
 
+ALERT_INSTANCES_KEY = "alert_instances"
+TRACKING_MARKER = "tracked_since"
+
 TELEGRAM_NOTIFICATION_TEMPLATE = """
 *{{ status }}* - *{{ severity }}*: {{ rule.name }} on {{ combined_alerts }} instances
 
@@ -109,6 +113,7 @@ class AlertmanagerWebhookLog(Document):
 
 	def after_insert(self):
 		if self.alert == INCIDENT_ALERT:
+			self.track_instances()
 			enqueue_doc(
 				self.doctype,
 				self.name,
@@ -169,28 +174,103 @@ class AlertmanagerWebhookLog(Document):
 			return alert["labels"]
 		return {}
 
-	def past_alert_instances(self, status: DF.Literal["Firing", "Resolved"]) -> set[str]:
+	@property
+	def instances_key(self) -> str:
+		return frappe.cache.make_key(
+			f"{ALERT_INSTANCES_KEY}:{self.alert}:{self.severity}:{self.incident_scope}"
+		)
+
+	def track_instances(self):
+		"""Records when each instance of this log was last seen with this status.
+
+		Both statuses share one sorted set per alert and scope, along with a marker of when tracking
+		began. So the marker expires, or is evicted, together with what it vouches for.
+		"""
+		instances = self.get_instances_from_alerts_payload(self.payload)
+		if not (instances and self.incident_scope):
+			return
+
+		now, window = time.time(), self.get_repeat_interval() * 60 * 60
+		key = self.instances_key
+		pipeline = frappe.cache.pipeline(transaction=False)
+		pipeline.zadd(key, {f"{self.status}:{instance}": now for instance in instances})
+		pipeline.zremrangebyscore(key, "-inf", now - window)
+		pipeline.expire(key, window)
+		pipeline.zrangebyscore(key, "+inf", "+inf")
+		markers = [marker.decode() for marker in pipeline.execute()[-1]]
+
+		# Tracking started now, or restarts for a changed repeat interval
+		if not any(parse_tracking_marker(marker)[0] == window for marker in markers):
+			self.mark_tracked_since(now, markers)
+
+	def mark_tracked_since(self, since: float, stale_markers: list[str] | None = None):
+		window = self.get_repeat_interval() * 60 * 60
+		pipeline = frappe.cache.pipeline(transaction=False)
+		if stale_markers:
+			pipeline.zrem(self.instances_key, *stale_markers)
+		pipeline.zadd(self.instances_key, {f"{TRACKING_MARKER}:{window}:{since}": math.inf})
+		pipeline.expire(self.instances_key, window)
+		pipeline.execute()
+
+	def get_tracked_instances(self) -> dict[str, dict[str, float]] | None:
+		"""When each instance was last seen by status in the repeat interval, None if tracking
+		doesn't cover all of it."""
+		now, window = time.time(), self.get_repeat_interval() * 60 * 60
+		entries = frappe.cache.zrangebyscore(self.instances_key, now - window, "+inf", withscores=True)
+
+		last_seen = {"Firing": {}, "Resolved": {}}
+		covered = False
+		for member, seen in entries:
+			status, _, instance = member.decode().partition(":")
+			if status == TRACKING_MARKER:
+				marker_window, since = parse_tracking_marker(member.decode())
+				covered = covered or (marker_window == window and since <= now - window)
+			elif status in last_seen:
+				last_seen[status][instance] = seen
+
+		# Tracking started recently or redis lost it, older logs are only in the database
+		return last_seen if covered else None
+
+	def get_last_seen_instances(self) -> dict[str, dict[str, float]]:
+		"""When each instance was last seen by status in the repeat interval"""
+		tracked = self.get_tracked_instances()
+		if tracked is not None:
+			return tracked
+
 		past_alerts = frappe.get_all(
 			self.doctype,
-			fields=["payload"],
+			fields=["payload", "status", "modified"],
 			filters={
 				"alert": self.alert,
 				"severity": self.severity,
-				"status": status,
+				"status": ("in", ("Firing", "Resolved")),
 				"group_key": ("like", f"%{self.incident_scope}%"),
 				"modified": [
 					">",
 					add_to_date(frappe.utils.now(), hours=-self.get_repeat_interval()),
 				],
 			},
-			group_by="group_key",
+			order_by="modified asc",
 			ignore_ifnull=True,
-		)  # get site down alerts grouped by benches
+		)  # get site down alerts of the scope
 
-		instances = []
+		last_seen = {"Firing": {}, "Resolved": {}}
 		for alert in past_alerts:
-			instances.extend(self.get_instances_from_alerts_payload(alert["payload"]))
-		return set(instances)
+			seen = alert["modified"].timestamp()
+			for instance in self.get_instances_from_alerts_payload(alert["payload"]):
+				last_seen[alert["status"]][instance] = seen
+		return last_seen
+
+	def past_alert_instances(self, status: DF.Literal["Firing", "Resolved"]) -> set[str]:
+		return set(self.get_last_seen_instances()[status])
+
+	def get_firing_instances(self) -> set[str]:
+		"""Instances that fired after they last resolved, if they did in the repeat interval"""
+		last_seen = self.get_last_seen_instances()
+		resolved = last_seen["Resolved"]
+		return {
+			instance for instance, fired in last_seen["Firing"].items() if fired > resolved.get(instance, 0)
+		}
 
 	@property
 	def total_instances(self) -> int:
@@ -202,9 +282,7 @@ class AlertmanagerWebhookLog(Document):
 	@property
 	def is_enough_firing(self):
 		if self.status == "Resolved":
-			firing_instances = len(
-				self.past_alert_instances("Firing") - self.past_alert_instances("Resolved")
-			)
+			firing_instances = len(self.get_firing_instances())
 		else:
 			firing_instances = len(self.past_alert_instances("Firing"))
 
@@ -225,7 +303,7 @@ class AlertmanagerWebhookLog(Document):
 			self.create_incident()
 
 	def get_repeat_interval(self):
-		repeat_interval = str(frappe.db.get_value("Prometheus Alert Rule", self.alert, "repeat_interval"))
+		repeat_interval = str(frappe.get_cached_value("Prometheus Alert Rule", self.alert, "repeat_interval"))
 		assert repeat_interval.endswith("h"), f"Repeat interval not in hours: {repeat_interval}"
 		hours = repeat_interval.split("h")[0]  # only handles hours
 		return int(hours)
@@ -329,3 +407,9 @@ class AlertmanagerWebhookLog(Document):
 				frappe.db.commit()  # commit inside filelock to avoid deadlock when inserting in gap
 		except Exception:
 			log_error("Incident creation failed")
+
+
+def parse_tracking_marker(marker: str) -> tuple[int, float]:
+	"""Repeat interval in seconds and start of the tracking the marker records."""
+	_, window, since = marker.split(":")
+	return int(window), float(since)
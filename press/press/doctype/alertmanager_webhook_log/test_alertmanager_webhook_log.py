@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import json
+import time
 import typing
+from unittest.mock import Mock, patch
 
 import frappe
 from frappe.tests.utils import FrappeTestCase
 
+from press.press.doctype.alertmanager_webhook_log.alertmanager_webhook_log import (
+	ALERT_INSTANCES_KEY,
+	AlertmanagerWebhookLog,
+)
 from press.press.doctype.prometheus_alert_rule.test_prometheus_alert_rule import (
 	create_test_prometheus_alert_rule,
 )
@@ -16,7 +22,6 @@ from press.press.doctype.site.test_site import create_test_site
 if typing.TYPE_CHECKING:
 	from datetime import datetime
 
-	from press.press.doctype.alertmanager_webhook_log.alertmanager_webhook_log import AlertmanagerWebhookLog
 	from press.press.doctype.prometheus_alert_rule.prometheus_alert_rule import (
 		PrometheusAlertRule,
 	)
@@ -89,5 +94,63 @@ def create_test_alertmanager_webhook_log(
 	).insert()
 
 
+@patch(
+	"press.press.doctype.alertmanager_webhook_log.alertmanager_webhook_log.enqueue_doc",
+	new=Mock(),
+)
 class TestAlertmanagerWebhookLog(FrappeTestCase):
-	pass
+	def setUp(self):
+		super().setUp()
+		frappe.cache.delete_keys(ALERT_INSTANCES_KEY)
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def _track_since(self, log: AlertmanagerWebhookLog, hours: int):
+		markers = frappe.cache.zrangebyscore(log.instances_key, "+inf", "+inf")
+		log.mark_tracked_since(time.time() - hours * 60 * 60, [marker.decode() for marker in markers])
+
+	def test_past_instances_are_served_from_tracker_once_it_covers_the_repeat_interval(self):
+		site = create_test_site()
+		site2 = create_test_site(server=site.server)
+		create_test_alertmanager_webhook_log(site=site)
+		create_test_alertmanager_webhook_log(site=site2)
+		log = create_test_alertmanager_webhook_log(site=site2, status="resolved")
+		self._track_since(log, hours=2)
+
+		with patch.object(frappe, "get_all", wraps=frappe.get_all) as get_all:
+			self.assertEqual(log.past_alert_instances("Firing"), {site.name, site2.name})
+			self.assertEqual(log.past_alert_instances("Resolved"), {site2.name})
+			self.assertEqual(log.get_firing_instances(), {site.name})
+
+		get_all.assert_not_called()
+
+	def test_instance_that_fired_again_after_resolving_is_firing(self):
+		site = create_test_site()
+		create_test_alertmanager_webhook_log(site=site)
+		log = create_test_alertmanager_webhook_log(site=site, status="resolved")
+		create_test_alertmanager_webhook_log(site=site)
+
+		# From the logs, then from the tracker
+		self.assertEqual(log.get_firing_instances(), {site.name})
+		self._track_since(log, hours=2)
+		self.assertIsNotNone(log.get_tracked_instances())
+		self.assertEqual(log.get_firing_instances(), {site.name})
+
+	def test_past_instances_are_read_from_logs_while_tracking_is_recent(self):
+		site = create_test_site()
+		log = create_test_alertmanager_webhook_log(site=site)
+
+		self.assertIsNone(log.get_tracked_instances())
+		self.assertEqual(log.past_alert_instances("Firing"), {site.name})
+
+	def test_tracking_restarts_when_repeat_interval_changes(self):
+		site = create_test_site()
+		log = create_test_alertmanager_webhook_log(site=site)
+		self._track_since(log, hours=2)
+		self.assertIsNotNone(log.get_tracked_instances())
+
+		with patch.object(AlertmanagerWebhookLog, "get_repeat_interval", return_value=4):
+			self.assertIsNone(log.get_tracked_instances())
+			log.track_instances()
+			self.assertIsNone(log.get_tracked_instances())
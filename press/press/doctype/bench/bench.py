@@ -26,6 +26,8 @@ from press.press.doctype.bench_shell_log.bench_shell_log import (
 	create_bench_shell_log,
 )
 from press.press.doctype.site.site import Site
+from press.press.doctype.site.site_info_sync import sync_sites_info
+from press.press.doctype.site_analytics.site_analytics import create_sites_analytics
 from press.runner import Ansible
 from press.utils import (
 	SupervisorProcess,
@@ -548,24 +550,7 @@ class Bench(Document):
 			return
 		data = agent.get_sites_info(self, since=last_synced_time)
 		if data:
-			for site, info in data.items():
-				if not frappe.db.exists("Site", site):
-					continue
-				try:
-					frappe.get_doc("Site", site, for_update=True).sync_info(info)
-					frappe.db.commit()
-				except frappe.DoesNotExistError:
-					# Ignore: Site got renamed or deleted
-					pass
-				except Exception:
-					log_error(
-						"Site Sync Error",
-						site=site,
-						info=info,
-						reference_doctype="Bench",
-						reference_name=self.name,
-					)
-					frappe.db.rollback()
+			sync_sites_info(self.name, data)
 
 	@frappe.whitelist()
 	def sync_analytics(self):
@@ -575,9 +560,17 @@ class Bench(Document):
 		data = agent.get_sites_analytics(self)
 		if not data:
 			return
+		sites = frappe.get_all("Site", filters={"name": ("in", list(data))}, pluck="name")
+		data = {site: data[site] for site in sites}
+		try:
+			create_sites_analytics(data)
+			frappe.db.commit()
+			return
+		except Exception:
+			# Fall back to inserting one site at a time, so one bad payload doesn't drop the rest
+			frappe.db.rollback()
+
 		for site, analytics in data.items():
-			if not frappe.db.exists("Site", site):
-				return
 			try:
 				frappe.get_doc("Site", site).sync_analytics(analytics)
 				frappe.db.commit()
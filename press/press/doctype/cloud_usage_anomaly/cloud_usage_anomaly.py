@@ -9,8 +9,8 @@ from press.press.doctype.cloud_cost_daily.adapters import ACCRUED
 from press.press.doctype.cloud_usage_anomaly.contributors import get_contributors
 from press.press.doctype.cloud_usage_anomaly.detectors import (
 	change_percent,
-	detect_level_shift,
-	detect_spike,
+	detect_level_shifts,
+	detect_spikes,
 	mean,
 )
 from press.press.doctype.cloud_usage_driver.cloud_usage_driver import (
@@ -188,15 +188,19 @@ def split_mean_change(points, changed_on):
 	return {"baseline": mean(before), "current": mean(after)}
 
 
-def get_dismissed_dates(account, key):
-	"""Days an operator has already called a false alarm. Left in the baseline, a
-	one-off migration keeps the median wrong for a month."""
+def get_dismissed_dates(since):
+	"""Days since `since` an operator has already called a false alarm, by account and series.
+	Left in the baseline, a one-off migration keeps the median wrong for a month."""
 	rows = frappe.get_all(
 		"Cloud Usage Anomaly",
-		{"account": account, "series_key": key, "detector": "Spike", "status": "False Positive"},
-		pluck="changed_on",
+		{"detector": "Spike", "status": "False Positive", "changed_on": (">=", since)},
+		["account", "series_key", "changed_on"],
 	)
-	return {getdate(date) for date in rows if date}
+	dismissed = {}
+	for row in rows:
+		if row.changed_on:
+			dismissed.setdefault((row.account, row.series_key), set()).add(getdate(row.changed_on))
+	return dismissed
 
 
 def choose_metric(rows):
@@ -208,9 +212,9 @@ def choose_metric(rows):
 	return "Cost", "USD"
 
 
-def build_anomaly(account, key, rows, settings, drivers, start, end):
+def prepare_series(account, key, rows, settings, dismissed, start, end):
+	"""The days a series is judged on, or None for a series too small to matter."""
 	metric, unit = choose_metric(rows)
-	dismissed = get_dismissed_dates(account, key)
 
 	value_field = "usage_quantity" if metric == "Usage" else "amortized_cost"
 	measured = {getdate(row.date): flt(row.get(value_field)) for row in rows}
@@ -222,34 +226,35 @@ def build_anomaly(account, key, rows, settings, drivers, start, end):
 	if mean([point["value"] for point in cost_points]) < flt(settings.minimum_series_cost):
 		return None
 
-	# Level shift first. A series that settled at a new number weeks ago still reads as
-	# a loud day every single morning, and answering "it was high yesterday" when the
-	# real answer is "it changed on the twelfth" is the whole failure this replaces.
-	found = detect_level_shift(points, LEVEL_SHIFT_MINIMUM_CHANGE)
-	detector = "Level Shift"
-	if not found:
-		found = detect_spike(points, SPIKE_MAD_THRESHOLD)
-		detector = "Spike"
-	if not found:
-		return None
+	return {
+		"account": account,
+		"key": key,
+		"rows": rows,
+		"metric": metric,
+		"unit": unit,
+		"points": points,
+		"cost_points": cost_points,
+	}
 
-	impact = split_mean_change(cost_points, found["changed_on"])
+
+def build_anomaly(series, detector, found, settings, drivers):
+	impact = split_mean_change(series["cost_points"], found["changed_on"])
 	daily_cost_impact = impact["current"] - impact["baseline"] if impact else 0
 	if daily_cost_impact < flt(settings.minimum_daily_cost_impact):
 		return None
 
-	sample = rows[0]
+	sample = series["rows"][0]
 	anomaly = {
-		"account": account,
+		"account": series["account"],
 		"provider": sample.provider,
 		"currency": sample.currency,
-		"series_key": key,
+		"series_key": series["key"],
 		"service": sample.service,
 		"usage_type": sample.usage_type,
 		"region": sample.region,
 		"detector": detector,
-		"metric": metric,
-		"unit": unit,
+		"metric": series["metric"],
+		"unit": series["unit"],
 		"changed_on": found["changed_on"],
 		"detected_on": getdate(),
 		"baseline_value": found["baseline"],
@@ -462,7 +467,8 @@ def detect_anomalies():
 	series = get_cost_series(add_days(today, -BASELINE_DAYS), today)
 	stale = get_stale_accounts(series, today)
 
-	found = 0
+	dismissed = get_dismissed_dates(add_days(today, -BASELINE_DAYS))
+	candidates = []
 	for (account, key), rows in series.items():
 		if account in stale:
 			continue
@@ -473,7 +479,29 @@ def detect_anomalies():
 		if not window:
 			continue
 
-		anomaly = build_anomaly(account, key, window, settings, drivers, start, end)
+		dismissed_dates = dismissed.get((account, key), ())
+		candidate = prepare_series(account, key, window, settings, dismissed_dates, start, end)
+		if candidate:
+			candidates.append(candidate)
+
+	# Level shift first. A series that settled at a new number weeks ago still reads as
+	# a loud day every single morning, and answering "it was high yesterday" when the
+	# real answer is "it changed on the twelfth" is the whole failure this replaces.
+	points = [candidate["points"] for candidate in candidates]
+	shifts = detect_level_shifts(points, LEVEL_SHIFT_MINIMUM_CHANGE)
+	spikes = iter(
+		detect_spikes(
+			[days for days, shift in zip(points, shifts, strict=True) if not shift], SPIKE_MAD_THRESHOLD
+		)
+	)
+
+	found = 0
+	for candidate, shift in zip(candidates, shifts, strict=True):
+		detector, change = ("Level Shift", shift) if shift else ("Spike", next(spikes))
+		if not change:
+			continue
+
+		anomaly = build_anomaly(candidate, detector, change, settings, drivers)
 		if anomaly and save_anomaly(anomaly):
 			found += 1
 
@@ -9,8 +9,12 @@ stayed there — the shape behind a bill that is thirty percent higher than last
 without any single day ever looking wrong.
 
 Everything here takes and returns plain values so it can be tested without a database.
+The batch detectors judge every series over the same days as one matrix, which is what
+keeps a daily run over thousands of series cheap.
 """
 
+import numpy as np
+
 MINIMUM_SEGMENT_DAYS = 3
 MINIMUM_BASELINE_POINTS = 3
 # A perfectly flat series has no deviation to measure against, so a relative change is
@@ -51,32 +55,36 @@ def detect_spike(series, mad_threshold):
 	Weekday matters: backups, deploys and business traffic all run on a weekly shape,
 	and comparing a Sunday against a week of weekdays produces an alert every Sunday.
 	"""
-	if len(series) < MINIMUM_BASELINE_POINTS + 1:
-		return None
-
-	*history, latest = series
-	weekday = latest["date"].weekday()
-	baseline_points = [point["value"] for point in history if point["date"].weekday() == weekday]
-	if len(baseline_points) < MINIMUM_BASELINE_POINTS:
-		baseline_points = [point["value"] for point in history]
-
-	center = median(baseline_points)
-	if latest["value"] <= center:
-		return None
-
-	deviation = median_absolute_deviation(baseline_points, center)
-	if deviation:
-		if (latest["value"] - center) / deviation < mad_threshold:
-			return None
-	elif change_percent(center, latest["value"]) < FLAT_SERIES_CHANGE_PERCENT:
-		return None
-
-	return {
-		"changed_on": latest["date"],
-		"baseline": center,
-		"current": latest["value"],
-		"change_percent": change_percent(center, latest["value"]),
-	}
+	return detect_spikes([series], mad_threshold)[0]
+
+
+def detect_spikes(batch, mad_threshold):
+	"""`detect_spike` for every series in the batch, in order."""
+	found = [None] * len(batch)
+	for indexes, dates, values in group_by_days(batch, MINIMUM_BASELINE_POINTS + 1):
+		history, latest = values[:, :-1], values[:, -1]
+		same_weekday = np.array([date.weekday() == dates[-1].weekday() for date in dates[:-1]])
+		if same_weekday.sum() >= MINIMUM_BASELINE_POINTS:
+			history = history[:, same_weekday]
+
+		center = np.median(history, axis=1)
+		deviation = np.median(np.abs(history - center[:, None]), axis=1)
+		change = change_percents(center, latest)
+		with np.errstate(divide="ignore", invalid="ignore"):
+			loud = np.where(
+				deviation > 0,
+				(latest - center) / deviation >= mad_threshold,
+				change >= FLAT_SERIES_CHANGE_PERCENT,
+			)
+
+		for row in np.flatnonzero((latest > center) & loud):
+			found[indexes[row]] = {
+				"changed_on": dates[-1],
+				"baseline": float(center[row]),
+				"current": float(latest[row]),
+				"change_percent": float(change[row]),
+			}
+	return found
 
 
 def detect_level_shift(series, minimum_change_percent):
@@ -91,30 +99,72 @@ def detect_level_shift(series, minimum_change_percent):
 	This runs before the spike detector. A series that settled at a new number three
 	weeks ago should report the day it settled, not report today.
 	"""
-	if len(series) < MINIMUM_SEGMENT_DAYS * 2:
-		return None
-
-	values = [point["value"] for point in series]
-	total = len(values)
-
-	best = None
-	for index in range(MINIMUM_SEGMENT_DAYS, total - MINIMUM_SEGMENT_DAYS + 1):
-		before, after = values[:index], values[index:]
-		separation = abs(mean(after) - mean(before)) * (len(before) * len(after) / total) ** 0.5
-		if not best or separation > best["separation"]:
-			best = {"separation": separation, "index": index, "before": before, "after": after}
-
-	baseline, current = median(best["before"]), median(best["after"])
-	if current <= baseline:
-		return None
-
-	shift = change_percent(baseline, current)
-	if shift < minimum_change_percent:
-		return None
-
-	return {
-		"changed_on": series[best["index"]]["date"],
-		"baseline": baseline,
-		"current": current,
-		"change_percent": shift,
-	}
+	return detect_level_shifts([series], minimum_change_percent)[0]
+
+
+def detect_level_shifts(batch, minimum_change_percent):
+	"""`detect_level_shift` for every series in the batch, in order.
+
+	The mean on either side of every boundary comes from one running total per series,
+	so trying every day costs the same as reading the series once.
+	"""
+	found = [None] * len(batch)
+	for indexes, dates, values in group_by_days(batch, MINIMUM_SEGMENT_DAYS * 2):
+		total = values.shape[1]
+		running = np.cumsum(values, axis=1)
+		boundaries = np.arange(MINIMUM_SEGMENT_DAYS, total - MINIMUM_SEGMENT_DAYS + 1)
+		before_sum = running[:, boundaries - 1]
+		mean_before = before_sum / boundaries
+		mean_after = (running[:, -1:] - before_sum) / (total - boundaries)
+		separation = np.abs(mean_after - mean_before) * np.sqrt(boundaries * (total - boundaries) / total)
+		# First boundary on ties, as a day by day search would pick
+		boundary = boundaries[np.argmax(separation, axis=1)]
+
+		before = np.arange(total) < boundary[:, None]
+		baseline = np.nanmedian(np.where(before, values, np.nan), axis=1)
+		current = np.nanmedian(np.where(before, np.nan, values), axis=1)
+		shift = change_percents(baseline, current)
+
+		for row in np.flatnonzero((current > baseline) & (shift >= minimum_change_percent)):
+			found[indexes[row]] = {
+				"changed_on": dates[boundary[row]],
+				"baseline": float(baseline[row]),
+				"current": float(current[row]),
+				"change_percent": float(shift[row]),
+			}
+	return found
+
+
+def change_percents(baseline, current):
+	"""`change_percent` over arrays."""
+	with np.errstate(divide="ignore", invalid="ignore"):
+		return np.where(
+			baseline == 0,
+			np.where(current != 0, 100.0, 0.0),
+			(current - baseline) / np.abs(baseline) * 100,
+		)
+
+
+def group_by_days(batch, minimum_length):
+	"""Series covering the same days, as (positions in the batch, days, values matrix).
+
+	Series are usually the same window, one matrix per distinct window keeps them
+	rectangular when a few have days removed. Series shorter than `minimum_length`
+	are left out.
+	"""
+	groups = {}
+	for index, series in enumerate(batch):
+		if len(series) < minimum_length:
+			continue
+		first, last = series[0]["date"], series[-1]["date"]
+		if (last - first).days == len(series) - 1:
+			# Every day present, the first day and length name the window
+			key = (first, len(series))
+		else:
+			key = tuple(point["date"] for point in series)
+		groups.setdefault(key, []).append(index)
+
+	for indexes in groups.values():
+		days = [point["date"] for point in batch[indexes[0]]]
+		values = np.array([[point["value"] for point in batch[index]] for index in indexes], dtype=float)
+		yield indexes, days, values
@@ -1,13 +1,22 @@
 # Copyright (c) 2026, Frappe and Contributors
 # See license.txt
 
+import os
+import random
+import time
 import unittest
 from datetime import date, timedelta
 
 from press.press.doctype.cloud_usage_anomaly.detectors import (
+	FLAT_SERIES_CHANGE_PERCENT,
+	MINIMUM_BASELINE_POINTS,
+	MINIMUM_SEGMENT_DAYS,
 	change_percent,
 	detect_level_shift,
+	detect_level_shifts,
 	detect_spike,
+	detect_spikes,
+	mean,
 	median,
 	median_absolute_deviation,
 )
@@ -111,3 +120,115 @@ class TestLevelShiftDetector(unittest.TestCase):
 
 	def test_small_step_below_the_threshold_is_ignored(self):
 		self.assertIsNone(detect_level_shift(series([100] * 10 + [105] * 10), 20))
+
+
+def split_by_split_level_shift(series, minimum_change_percent):
+	"""Level shift detection before the running totals, every boundary sliced and summed"""
+	if len(series) < MINIMUM_SEGMENT_DAYS * 2:
+		return None
+
+	values = [point["value"] for point in series]
+	total = len(values)
+	best = None
+	for index in range(MINIMUM_SEGMENT_DAYS, total - MINIMUM_SEGMENT_DAYS + 1):
+		before, after = values[:index], values[index:]
+		separation = abs(mean(after) - mean(before)) * (len(before) * len(after) / total) ** 0.5
+		if not best or separation > best["separation"]:
+			best = {"separation": separation, "index": index, "before": before, "after": after}
+
+	baseline, current = median(best["before"]), median(best["after"])
+	shift = change_percent(baseline, current)
+	if current <= baseline or shift < minimum_change_percent:
+		return None
+	return {"changed_on": series[best["index"]]["date"], "baseline": baseline, "current": current}
+
+
+def sorted_baseline_spike(series, mad_threshold):
+	"""Spike detection before the matrices, every baseline sorted in pure Python"""
+	if len(series) < MINIMUM_BASELINE_POINTS + 1:
+		return None
+
+	*history, latest = series
+	weekday = latest["date"].weekday()
+	baseline_points = [point["value"] for point in history if point["date"].weekday() == weekday]
+	if len(baseline_points) < MINIMUM_BASELINE_POINTS:
+		baseline_points = [point["value"] for point in history]
+
+	center = median(baseline_points)
+	if latest["value"] <= center:
+		return None
+
+	deviation = median_absolute_deviation(baseline_points, center)
+	if deviation:
+		if (latest["value"] - center) / deviation < mad_threshold:
+			return None
+	elif change_percent(center, latest["value"]) < FLAT_SERIES_CHANGE_PERCENT:
+		return None
+	return {"changed_on": latest["date"], "baseline": center, "current": latest["value"]}
+
+
+def random_series(rng, days):
+	base = rng.choice([0, 1, 50, 100, 2500])
+	values = [base * rng.uniform(0.9, 1.1) for _ in range(days)]
+	shape = rng.choice(["flat", "step", "spike", "drop"])
+	if shape == "step":
+		for day in range(rng.randrange(days), days):
+			values[day] *= 1.6
+	elif shape == "spike":
+		values[-1] *= 4
+	elif shape == "drop":
+		values = [value * (0.3 if day > days // 2 else 1) for day, value in enumerate(values)]
+	return series(values)
+
+
+def random_batch(days):
+	rng = random.Random(7)
+	batch = [random_series(rng, days) for _ in range(10000)]
+	# Days dropped from a series, as dismissed days are, put it in a matrix of its own
+	batch += [[point for point in random_series(rng, days) if point["date"].day != 5] for _ in range(50)]
+	return batch
+
+
+class TestBatchDetectors(unittest.TestCase):
+	def test_batch_matches_series_by_series_detection(self):
+		batch = random_batch(30)
+
+		shifts = detect_level_shifts(batch, 20)
+		spikes = detect_spikes(batch, 3)
+
+		self.assertTrue(any(shifts) and any(spikes))
+		self.assertMatchesSeriesBySeries(batch, shifts, split_by_split_level_shift, 20)
+		self.assertMatchesSeriesBySeries(batch, spikes, sorted_baseline_spike, 3)
+
+	def assertMatchesSeriesBySeries(self, batch, batch_found, detect, threshold):
+		for points, found in zip(batch, batch_found, strict=True):
+			wanted = detect(points, threshold)
+			if wanted is None:
+				self.assertIsNone(found, points)
+				continue
+			self.assertEqual(found["changed_on"], wanted["changed_on"])
+			self.assertAlmostEqual(found["baseline"], wanted["baseline"])
+			self.assertAlmostEqual(found["current"], wanted["current"])
+
+	@unittest.skipUnless(
+		os.environ.get("PRESS_RUN_BENCHMARKS"), "set PRESS_RUN_BENCHMARKS=1 to run benchmarks"
+	)
+	def test_batch_detection_speed(self):
+		for days in (30, 90):
+			batch = random_batch(days)
+
+			start = time.perf_counter()
+			for points in batch:
+				split_by_split_level_shift(points, 20)
+				sorted_baseline_spike(points, 3)
+			series_by_series = time.perf_counter() - start
+
+			start = time.perf_counter()
+			detect_level_shifts(batch, 20)
+			detect_spikes(batch, 3)
+			batched = time.perf_counter() - start
+
+			print(
+				f"{len(batch)} series of {days} days: series by series {series_by_series * 1000:.0f}ms,"
+				f" as a batch {batched * 1000:.0f}ms"
+			)
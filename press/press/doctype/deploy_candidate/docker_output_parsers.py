@@ -10,11 +10,19 @@ import frappe
 from frappe.core.utils import find
 from frappe.utils import now_datetime, rounded
 
+from press.press.doctype.deploy_candidate_build_output_chunk.deploy_candidate_build_output_chunk import (
+	append_build_output,
+)
+
 # Reference:
 # https://stackoverflow.com/questions/14693701/how-can-i-remove-the-ansi-escape-sequences-from-a-string-in-python
 ansi_escape_rx = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 done_check_rx = re.compile(r"#\d+\sDONE\s\d+\.\d+")
 
+# Fields the build output parser sets, flushed when they change
+STEP_FIELDS = ("step_index", "command", "status", "output", "hash", "duration", "cached")
+BUILD_FIELDS = ("build_error", "docker_image_id")
+
 if typing.TYPE_CHECKING:
 	from collections.abc import Generator
 	from typing import Any
@@ -41,6 +49,10 @@ class DockerBuildOutputParser:
 
 	Due to the way agent updates are propagated, all lines are updated
 	when agent is polled, and so output is looped N! times.
+
+	Flushes only write what changed since the build was loaded: new output
+	lines go to Deploy Candidate Build Output Chunk, and only the build steps
+	and build fields that changed are updated.
 	"""
 
 	_steps_by_step_slug: dict[tuple[str, str], DeployCandidateBuildStep] | None
@@ -55,6 +67,10 @@ class DockerBuildOutputParser:
 		self.steps: dict[int, "DeployCandidateBuildStep"] = frappe._dict()
 		self._steps_by_step_slug = None
 
+		# Values as loaded, to flush only what changed
+		self.flushed_steps = {step.name: get_step_values(step) for step in dc.build_steps}
+		self.flushed_fields = {field: dc.get(field) for field in BUILD_FIELDS}
+
 	# Convenience map used to update build steps
 	@property
 	def steps_by_step_slug(self):
@@ -71,13 +87,35 @@ class DockerBuildOutputParser:
 		self._parse_line(raw_line)
 
 	def flush_output(self, commit: bool = True):
-		self.dc.build_output = "".join(self.lines)
 		self.dc.build_error = "".join(self.error_lines)
 
-		self.dc.save(ignore_version=True, ignore_permissions=True)
+		append_build_output(self.dc.name, self.lines)
+		self._flush_build_steps()
+		self._flush_build_fields()
 		if commit:
 			frappe.db.commit()
 
+	def _flush_build_steps(self):
+		updates = {}
+		for step in self.dc.build_steps:
+			values = get_step_values(step)
+			if values != self.flushed_steps.get(step.name):
+				updates[step.name] = values
+				self.flushed_steps[step.name] = values
+
+		if updates:
+			frappe.db.bulk_update("Deploy Candidate Build Step", updates, update_modified=False)
+
+	def _flush_build_fields(self):
+		changed = {
+			field: self.dc.get(field)
+			for field in BUILD_FIELDS
+			if self.dc.get(field) != self.flushed_fields[field]
+		}
+		if changed:
+			self.dc.db_set(changed)
+			self.flushed_fields.update(changed)
+
 	def _parse_line(self, raw_line: str):
 		escaped_line = ansi_escape(raw_line)
 
@@ -206,6 +244,10 @@ class DockerBuildOutputParser:
 		return dict(index=index, line=line, is_unusual=is_unusual)
 
 
+def get_step_values(step: "DeployCandidateBuildStep") -> dict:
+	return {field: step.get(field) for field in STEP_FIELDS}
+
+
 def ansi_escape(text: str) -> str:
 	return ansi_escape_rx.sub("", text)
 
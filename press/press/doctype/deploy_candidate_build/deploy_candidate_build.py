@@ -46,6 +46,10 @@ from press.press.doctype.deploy_candidate.utils import (
 	get_intel_build_server_with_least_active_builds,
 	is_suspended,
 )
+from press.press.doctype.deploy_candidate_build_output_chunk.deploy_candidate_build_output_chunk import (
+	delete_build_output,
+	read_build_output,
+)
 from press.utils import get_current_team, log_error
 from press.utils.webhook import create_webhook_event
 
@@ -279,8 +283,16 @@ class DeployCandidateBuild(Document):
 		if timestamp_field and hasattr(self, timestamp_field):
 			setattr(self, timestamp_field, now())
 
+		finished = self.status in (Status.SUCCESS.value, Status.FAILURE.value)
+		if finished:
+			self.build_output = read_build_output(self.name) or self.build_output
+
 		self.save(ignore_version=True)
 
+		if finished:
+			# build_output holds the whole log now
+			delete_build_output(self.name)
+
 		if commit:
 			frappe.db.commit()
 
@@ -625,7 +637,12 @@ class DeployCandidateBuild(Document):
 	def _update_status_from_remote_build_job(self, job: "AgentJob"):
 		match job.status:
 			case "Pending" | "Running":
-				return self.set_status(Status.RUNNING)
+				if self.status != Status.RUNNING.value:
+					return self.set_status(Status.RUNNING)
+				# Parsers have flushed what changed, skip rewriting every build step. Setting
+				# status updates modified, which keeps the build from being treated as stuck.
+				self.db_set("status", Status.RUNNING.value)
+				return self.publish_steps()
 			case "Failure" | "Undelivered" | "Delivery Failure":
 				self._set_build_duration()
 				return self.set_status(Status.FAILURE)
@@ -910,6 +927,7 @@ class DeployCandidateBuild(Document):
 		self.build_directory = None
 		self.build_error = ""
 		self.build_output = ""
+		delete_build_output(self.name)
 		# Failure flags
 		self.user_addressable_failure = False
 		self.manually_failed = False
@@ -1007,14 +1025,14 @@ class DeployCandidateBuild(Document):
 		frappe.session.data = session_data
 		frappe.db.commit()
 
+	def onload(self):
+		# Output of a running build is only in its chunks
+		if not self.build_output:
+			self.build_output = read_build_output(self.name)
+
 	def on_update(self):
 		if self.status == "Running":
-			frappe.publish_realtime(
-				f"bench_deploy:{self.name}:steps",
-				doctype=self.doctype,
-				docname=self.name,
-				message={"steps": self.build_steps, "name": self.name},
-			)
+			self.publish_steps()
 		else:
 			frappe.publish_realtime(
 				f"bench_deploy:{self.name}:finished",
@@ -1025,6 +1043,17 @@ class DeployCandidateBuild(Document):
 		if self.has_value_changed("status") and self.team != "Administrator":
 			create_webhook_event("Bench Deploy Status Update", self, self.team)
 
+	def on_trash(self):
+		delete_build_output(self.name)
+
+	def publish_steps(self):
+		frappe.publish_realtime(
+			f"bench_deploy:{self.name}:steps",
+			doctype=self.doctype,
+			docname=self.name,
+			message={"steps": self.build_steps, "name": self.name},
+		)
+
 	def run_scheduled_build_and_deploy(self):
 		self.set_status(Status.DRAFT)
 		self.pre_build()
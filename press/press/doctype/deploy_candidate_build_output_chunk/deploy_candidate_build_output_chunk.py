@@ -0,0 +1,75 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+
+from __future__ import annotations
+
+import frappe
+from frappe.model.document import Document
+
+
+class DeployCandidateBuildOutputChunk(Document):
+	# begin: auto-generated types
+	# This code is auto-generated. Do not modify anything in this block.
+
+	from typing import TYPE_CHECKING
+
+	if TYPE_CHECKING:
+		from frappe.types import DF
+
+		build: DF.Link
+		line_count: DF.Int
+		output: DF.LongText | None
+		start_line: DF.Int
+	# end: auto-generated types
+
+	pass
+
+
+def append_build_output(build: str, lines: list[str]) -> int:
+	"""Stores the lines not stored yet, `lines` is the full output seen so far. Returns lines added."""
+	# Serializes concurrent polls of the same build
+	status = frappe.db.get_value("Deploy Candidate Build", build, "status", for_update=True)
+	if status in ("Success", "Failure"):
+		# Output of a finished build was moved to its build_output, a late poll mustn't add it again
+		return 0
+	stored = get_stored_line_count(build)
+	new_lines = lines[stored:]
+	if not new_lines:
+		return 0
+
+	frappe.get_doc(
+		{
+			"doctype": "Deploy Candidate Build Output Chunk",
+			"build": build,
+			"start_line": stored,
+			"line_count": len(new_lines),
+			"output": "".join(new_lines),
+		}
+	).insert(ignore_permissions=True)
+	return len(new_lines)
+
+
+def get_stored_line_count(build: str) -> int:
+	last_chunk = frappe.db.get_value(
+		"Deploy Candidate Build Output Chunk",
+		{"build": build},
+		["start_line", "line_count"],
+		order_by="start_line desc",
+		as_dict=True,
+	)
+	return last_chunk.start_line + last_chunk.line_count if last_chunk else 0
+
+
+def read_build_output(build: str) -> str:
+	return "".join(
+		frappe.get_all(
+			"Deploy Candidate Build Output Chunk",
+			filters={"build": build},
+			pluck="output",
+			order_by="start_line asc",
+		)
+	)
+
+
+def delete_build_output(build: str):
+	frappe.db.delete("Deploy Candidate Build Output Chunk", {"build": build})
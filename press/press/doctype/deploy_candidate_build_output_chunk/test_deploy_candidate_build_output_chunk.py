@@ -0,0 +1,114 @@
+# Copyright (c) 2026, Frappe and Contributors
+# See license.txt
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from press.press.doctype.agent_job.agent_job import AgentJob
+from press.press.doctype.app.test_app import create_test_app
+from press.press.doctype.deploy_candidate.docker_output_parsers import DockerBuildOutputParser
+from press.press.doctype.deploy_candidate.test_deploy_candidate import (
+	create_test_deploy_candidate,
+	create_test_deploy_candidate_build,
+)
+from press.press.doctype.deploy_candidate_build.deploy_candidate_build import Status
+from press.press.doctype.deploy_candidate_build_output_chunk.deploy_candidate_build_output_chunk import (
+	append_build_output,
+	read_build_output,
+)
+from press.press.doctype.release_group.test_release_group import create_test_release_group
+
+if TYPE_CHECKING:
+	from press.press.doctype.deploy_candidate_build.deploy_candidate_build import DeployCandidateBuild
+
+# Remote build output, as published by agent for a build that fails on its last app
+CAPTURED_BUILD_LOG = os.path.join(os.path.dirname(__file__), "test_build_output.log")
+BUILD_STEPS = [("pre", "essentials"), ("bench", "init"), ("apps", "erpnext"), ("apps", "hrms")]
+
+
+@patch.object(AgentJob, "enqueue_http_request", new=Mock())
+class TestDeployCandidateBuildOutputChunk(FrappeTestCase):
+	def setUp(self):
+		super().setUp()
+		group = create_test_release_group([create_test_app()])
+		self.build: DeployCandidateBuild = create_test_deploy_candidate_build(
+			create_test_deploy_candidate(group), status="Running"
+		)
+		self.build.run_build = False
+		for stage_slug, step_slug in BUILD_STEPS:
+			self.build.append(
+				"build_steps",
+				{
+					"status": "Pending",
+					"stage_slug": stage_slug,
+					"step_slug": step_slug,
+					"stage": stage_slug.title(),
+					"step": step_slug,
+				},
+			)
+		self.build.insert(ignore_permissions=True)
+
+		with open(CAPTURED_BUILD_LOG) as f:
+			self.lines = f.readlines()
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def _replay(self, polls: int):
+		"""Publishes the captured log to the parser in `polls` growing prefixes, like agent polling."""
+		for poll in range(1, polls + 1):
+			build = frappe.get_doc("Deploy Candidate Build", self.build.name)
+			published = self.lines[: len(self.lines) * poll // polls]
+			DockerBuildOutputParser(build).parse_and_update(published)
+
+	def test_appending_full_output_stores_each_line_once(self):
+		append_build_output(self.build.name, self.lines[:10])
+		append_build_output(self.build.name, self.lines[:10])
+		append_build_output(self.build.name, self.lines)
+
+		self.assertEqual(
+			frappe.db.count("Deploy Candidate Build Output Chunk", {"build": self.build.name}), 2
+		)
+		self.assertEqual(read_build_output(self.build.name), "".join(self.lines))
+
+	@patch("press.press.doctype.deploy_candidate.docker_output_parsers.frappe.db.commit", new=Mock())
+	def test_replayed_build_log_updates_steps_and_output_incrementally(self):
+		self._replay(polls=20)
+
+		build = frappe.get_doc("Deploy Candidate Build", self.build.name)
+		statuses = {step.step_slug: step.status for step in build.build_steps}
+		self.assertEqual(
+			statuses, {"essentials": "Success", "init": "Success", "erpnext": "Success", "hrms": "Failure"}
+		)
+		self.assertIn("No matching distribution found", build.build_error)
+		self.assertFalse(build.build_output, "Output of a running build is kept in chunks")
+		self.assertEqual(read_build_output(build.name), "".join(self.lines))
+
+	@patch("press.press.doctype.deploy_candidate.docker_output_parsers.frappe.db.commit", new=Mock())
+	def test_flush_updates_only_steps_that_changed(self):
+		self._replay(polls=1)
+		build = frappe.get_doc("Deploy Candidate Build", self.build.name)
+
+		with patch(
+			"press.press.doctype.deploy_candidate.docker_output_parsers.frappe.db.bulk_update"
+		) as bulk:
+			DockerBuildOutputParser(build).parse_and_update(self.lines)
+
+		bulk.assert_not_called()
+
+	def test_finished_build_keeps_output_only_in_build_output(self):
+		append_build_output(self.build.name, self.lines)
+
+		self.build.set_status(Status.SUCCESS)
+
+		self.assertEqual(self.build.build_output, "".join(self.lines))
+		self.assertEqual(
+			frappe.db.count("Deploy Candidate Build Output Chunk", {"build": self.build.name}), 0
+		)
+		self.assertEqual(append_build_output(self.build.name, self.lines), 0)
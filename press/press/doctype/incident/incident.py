@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import time
 import urllib.parse
 from base64 import b64encode
 from contextlib import suppress
@@ -12,6 +13,8 @@ from typing import TYPE_CHECKING
 
 import frappe
 import requests
+from frappe.query_builder import Criterion
+from frappe.query_builder.functions import Max
 from frappe.types.DF import Phone
 from frappe.utils import cint
 from frappe.utils.background_jobs import enqueue_doc
@@ -74,6 +77,8 @@ CALL_THRESHOLD_SECONDS_NIGHT = (
 CALL_REPEAT_INTERVAL_DAY = 15 * 60
 CALL_REPEAT_INTERVAL_NIGHT = 20 * 60
 
+INCIDENT_TICK_STATS_KEY = "incident_tick_stats"
+
 INCIDENT_BANNER_TITLE = "Incident on server: {0}"
 INCIDENT_BANNER_MESSAGE = "There is an ongoing incident affecting sites on {0}."
 
@@ -883,31 +888,20 @@ Likely due to insufficient balance or incorrect credentials""",
 	def waited_enough_for_investigator_reactions(self) -> bool:
 		"""Check if the investigator has taken any action"""
 		investigator: IncidentInvestigator = frappe.get_doc("Incident Investigator", {"incident": self.name})
-		wait_time = get_wait_time_post_investigator_actions()
-		if investigator.status != "Completed":
-			return False
-
-		# Investigation is completed and actions are taken wait before calling
-		if (
-			investigator.status == "Completed"
-			and investigator.action_steps
-			and (investigator.modified > frappe.utils.now_datetime() - timedelta(minutes=wait_time))
-		):
-			return False
-
-		return True
+		return has_waited_for_investigator(
+			investigator.status,
+			investigator.modified,
+			bool(investigator.action_steps),
+			get_wait_time_post_investigator_actions(),
+		)
 
 	@property
 	def time_to_call_for_help(self) -> bool:
-		return self.status == "Confirmed" and frappe.utils.now_datetime() - self.creation > timedelta(
-			seconds=get_confirmation_threshold_duration() + get_call_threshold_duration()
-		)
+		return self.status == "Confirmed" and is_time_to_call(self, get_incident_thresholds())
 
 	@property
 	def time_to_call_for_help_again(self) -> bool:
-		return self.status == "Acknowledged" and frappe.utils.now_datetime() - self.modified > timedelta(
-			seconds=get_call_repeat_interval()
-		)
+		return self.status == "Acknowledged" and is_time_to_call(self, get_incident_thresholds())
 
 	@cached_property
 	def sites_down(self) -> list[str]:
@@ -918,47 +912,172 @@ Likely due to insufficient balance or incorrect credentials""",
 		return self.sites_down[0] if self.sites_down else None
 
 
-def get_confirmation_threshold_duration():
+def get_incident_thresholds() -> frappe._dict:
+	"""Incident Settings durations for the current time of day, read in one query."""
+	settings = (
+		frappe.db.get_value(
+			"Incident Settings",
+			None,
+			[
+				"confirmation_threshold_day",
+				"confirmation_threshold_night",
+				"call_threshold_day",
+				"call_threshold_night",
+				"call_repeat_interval_day",
+				"call_repeat_interval_night",
+				"wait_time_post_investigator_actions",
+			],
+			as_dict=True,
+		)
+		or frappe._dict()
+	)
+
 	if frappe.utils.now_datetime().hour in DAY_HOURS:
-		return (
-			cint(frappe.db.get_value("Incident Settings", None, "confirmation_threshold_day"))
-			or CONFIRMATION_THRESHOLD_SECONDS_DAY
+		return frappe._dict(
+			confirmation_threshold=cint(settings.confirmation_threshold_day)
+			or CONFIRMATION_THRESHOLD_SECONDS_DAY,
+			call_threshold=cint(settings.call_threshold_day) or CALL_THRESHOLD_SECONDS_DAY,
+			call_repeat_interval=cint(settings.call_repeat_interval_day) or CALL_REPEAT_INTERVAL_DAY,
+			wait_time_post_investigator_actions=cint(settings.wait_time_post_investigator_actions or 5),
 		)
-	return (
-		cint(frappe.db.get_value("Incident Settings", None, "confirmation_threshold_night"))
-		or CONFIRMATION_THRESHOLD_SECONDS_NIGHT
+	return frappe._dict(
+		confirmation_threshold=cint(settings.confirmation_threshold_night)
+		or CONFIRMATION_THRESHOLD_SECONDS_NIGHT,
+		call_threshold=cint(settings.call_threshold_night) or CALL_THRESHOLD_SECONDS_NIGHT,
+		call_repeat_interval=cint(settings.call_repeat_interval_night) or CALL_REPEAT_INTERVAL_NIGHT,
+		wait_time_post_investigator_actions=cint(settings.wait_time_post_investigator_actions or 5),
 	)
 
 
+def get_confirmation_threshold_duration():
+	return get_incident_thresholds().confirmation_threshold
+
+
 def get_wait_time_post_investigator_actions() -> int:
-	return cint(frappe.db.get_single_value("Incident Settings", "wait_time_post_investigator_actions") or 5)
+	return get_incident_thresholds().wait_time_post_investigator_actions
 
 
 def get_call_threshold_duration():
-	if frappe.utils.now_datetime().hour in DAY_HOURS:
-		return (
-			cint(frappe.db.get_value("Incident Settings", None, "call_threshold_day"))
-			or CALL_THRESHOLD_SECONDS_DAY
+	return get_incident_thresholds().call_threshold
+
+
+def get_call_repeat_interval():
+	return get_incident_thresholds().call_repeat_interval
+
+
+def is_time_to_call(incident: Incident | frappe._dict, thresholds: frappe._dict) -> bool:
+	"""Confirmed incidents call humans after the call threshold, acknowledged ones after the repeat interval."""
+	now = frappe.utils.now_datetime()
+	if incident.status == "Confirmed":
+		return now - incident.creation > timedelta(
+			seconds=thresholds.confirmation_threshold + thresholds.call_threshold
+		)
+	if incident.status == "Acknowledged":
+		return now - incident.modified > timedelta(seconds=thresholds.call_repeat_interval)
+	return False
+
+
+def has_waited_for_investigator(status: str, modified, has_action_steps: bool, wait_time: int) -> bool:
+	if status != "Completed":
+		return False
+
+	# Investigation is completed and actions are taken wait before calling
+	return not (has_action_steps and modified > frappe.utils.now_datetime() - timedelta(minutes=wait_time))
+
+
+def get_investigators(incidents: list[str]) -> dict[str, frappe._dict]:
+	"""Investigator status of each incident, with whether it took any action steps."""
+	investigators = frappe.get_all(
+		"Incident Investigator",
+		filters={"incident": ("in", incidents)},
+		fields=["name", "incident", "status", "modified"],
+	)
+	with_action_steps = set(
+		frappe.get_all(
+			"Action Step",
+			filters={
+				"parenttype": "Incident Investigator",
+				"parent": ("in", [investigator.name for investigator in investigators]),
+			},
+			pluck="parent",
+			distinct=True,
 		)
-	return (
-		cint(frappe.db.get_value("Incident Settings", None, "call_threshold_night"))
-		or CALL_THRESHOLD_SECONDS_NIGHT
+		if investigators
+		else []
 	)
+	for investigator in investigators:
+		investigator.has_action_steps = investigator.name in with_action_steps
+	return {investigator.incident: investigator for investigator in investigators}
 
 
-def get_call_repeat_interval():
-	if frappe.utils.now_datetime().hour in DAY_HOURS:
-		return (
-			cint(frappe.db.get_value("Incident Settings", None, "call_repeat_interval_day"))
-			or CALL_REPEAT_INTERVAL_DAY
+def get_last_resolved_logs(incidents: list[frappe._dict]) -> dict[tuple[str, str], str]:
+	"""Latest Resolved webhook log of each (alert, scope), for all incidents in one query."""
+	scopes = {(incident.alert, incident[INCIDENT_SCOPE]) for incident in incidents if incident.alert}
+	if not scopes:
+		return {}
+
+	log = frappe.qb.DocType("Alertmanager Webhook Log")
+	resolved = (log.status == "Resolved") & Criterion.any(
+		[(log.alert == alert) & log.group_key.like(f"%{scope}%") for alert, scope in scopes]
+	)
+	# Only the latest log of each group key, a scope spans a few group keys
+	groups = (
+		frappe.qb.from_(log)
+		.select(log.alert, log.group_key, Max(log.creation).as_("creation"))
+		.where(resolved)
+		.groupby(log.alert, log.group_key)
+		.run(as_dict=True)
+	)
+
+	latest = {}
+	for alert, scope in scopes:
+		matching = [group for group in groups if group.alert == alert and str(scope) in group.group_key]
+		if matching:
+			latest[(alert, scope)] = max(matching, key=lambda group: group.creation)
+	if not latest:
+		return {}
+
+	logs = (
+		frappe.qb.from_(log)
+		.select(log.name, log.alert, log.group_key, log.creation)
+		.where(log.status == "Resolved")
+		.where(
+			Criterion.any(
+				[
+					(log.alert == group.alert)
+					& (log.group_key == group.group_key)
+					& (log.creation == group.creation)
+					for group in latest.values()
+				]
+			)
 		)
-	return (
-		cint(frappe.db.get_value("Incident Settings", None, "call_repeat_interval_night"))
-		or CALL_REPEAT_INTERVAL_NIGHT
+		.run(as_dict=True)
 	)
+	names = {(row.alert, row.group_key, row.creation): row.name for row in logs}
+	return {
+		key: names[(group.alert, group.group_key, group.creation)]
+		for key, group in latest.items()
+		if (group.alert, group.group_key, group.creation) in names
+	}
+
+
+def record_incident_tick(tick: str, start: float, incidents: int):
+	frappe.cache.set_value(
+		f"{INCIDENT_TICK_STATS_KEY}:{tick}",
+		{"duration": time.monotonic() - start, "incidents": incidents},
+	)
+
+
+def get_incident_tick_stats() -> dict[str, dict]:
+	return {
+		tick: frappe.cache.get_value(f"{INCIDENT_TICK_STATS_KEY}:{tick}") or {}
+		for tick in ("validate", "resolve")
+	}
 
 
 def validate_incidents():
+	start = time.monotonic()
+	thresholds = get_incident_thresholds()
 	validating_incidents = frappe.get_all(
 		"Incident",
 		filters={
@@ -968,29 +1087,60 @@ def validate_incidents():
 	)
 	for incident_dict in validating_incidents:
 		if frappe.utils.now_datetime() - incident_dict.creation > timedelta(
-			seconds=get_confirmation_threshold_duration()
+			seconds=thresholds.confirmation_threshold
 		):
 			incident = Incident("Incident", incident_dict.name)
 			incident.confirm()
+	record_incident_tick("validate", start, len(validating_incidents))
 
 
 def resolve_incidents():
+	"""Resolves incidents whose alerts stopped firing and calls humans for the rest when it's time.
+
+	Settings, investigators and last resolved webhook logs are loaded once for all open incidents,
+	an incident's document is only loaded when it changes.
+	"""
+	start = time.monotonic()
+	thresholds = get_incident_thresholds()
 	ongoing_incidents = frappe.get_all(
 		"Incident",
 		filters={
 			"status": ("in", ["Validating", "Confirmed", "Acknowledged"]),
 		},
-		pluck="name",
+		fields=["name", "status", "creation", "modified", "alert", INCIDENT_SCOPE],
 	)
-	for incident_name in ongoing_incidents:
-		incident = Incident("Incident", incident_name)
-		incident.check_resolved()
+	investigators = get_investigators([incident.name for incident in ongoing_incidents])
+	last_resolved_logs = get_last_resolved_logs(ongoing_incidents)
+
+	stopped_firing = {
+		scope: not frappe.get_doc("Alertmanager Webhook Log", log).is_enough_firing
+		for scope, log in last_resolved_logs.items()
+	}
+
+	for incident_dict in ongoing_incidents:
+		if stopped_firing.get((incident_dict.alert, incident_dict[INCIDENT_SCOPE])):
+			incident = Incident("Incident", incident_dict.name)
+			incident.create_log_for_server(is_resolved=True)
+			incident.resolve()
+			continue
+
+		investigator = investigators.get(incident_dict.name)
 		if (
-			incident.time_to_call_for_help or incident.time_to_call_for_help_again
-		) and incident.waited_enough_for_investigator_reactions:
+			is_time_to_call(incident_dict, thresholds)
+			and investigator
+			and has_waited_for_investigator(
+				investigator.status,
+				investigator.modified,
+				investigator.has_action_steps,
+				thresholds.wait_time_post_investigator_actions,
+			)
+		):
+			incident = Incident("Incident", incident_dict.name)
 			incident.create_log_for_server()
 			incident.call_humans()
 
+	record_incident_tick("resolve", start, len(ongoing_incidents))
+
 
 def notify_ignored_servers():
 	servers = frappe.qb.DocType("Server")
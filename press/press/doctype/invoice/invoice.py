@@ -897,19 +897,20 @@ class Invoice(Document):
 		scale_duration = last_down_scale_at - last_up_scale_at
 		return round(scale_duration.total_seconds() / 3600, 2)
 
-	def add_usage_record(self, usage_record):
+	def add_usage_record(self, usage_record, save=True) -> bool:
+		"""Adds the usage record to its invoice item. Returns True if it was added."""
 		if self.type != "Subscription":
-			return
+			return False
 		# return if this usage_record is already accounted for in an invoice
 		if usage_record.invoice:
-			return
+			return False
 
 		# return if this usage_record does not fall inside period of invoice
 		usage_record_date = getdate(usage_record.date)
 		start = getdate(self.period_start)
 		end = getdate(self.period_end)
 		if not (start <= usage_record_date <= end):
-			return
+			return False
 
 		invoice_item = self.get_invoice_item_for_usage_record(usage_record)
 		# if not found, create a new invoice item
@@ -939,8 +940,10 @@ class Invoice(Document):
 		if usage_record.payout:
 			self.payout += usage_record.payout
 
-		self.save()
-		usage_record.db_set("invoice", self.name)
+		if save:
+			self.save()
+			usage_record.db_set("invoice", self.name)
+		return True
 
 	def remove_usage_record(self, usage_record):
 		if self.type != "Subscription":
@@ -9,6 +9,7 @@ from frappe.query_builder.functions import Count
 
 from press.api.client import dashboard_whitelist
 from press.guards import role_guard, team_guard
+from press.guards.role_guard.snapshot import clear_snapshots
 from press.overrides import get_permission_query_conditions_for_doctype
 from press.press.doctype.team.team_members import PERMISSION_FIELDS
 from press.utils import get_current_team, is_admin_user, is_team_owner
@@ -102,6 +103,9 @@ class PressRole(Document):
 	def validate(self):
 		self.validate_duplicate_title()
 
+	def on_update(self):
+		clear_snapshots(self.team)
+
 	def reload_for_update(self):
 		"""
 		Re-read the role under a row lock.
@@ -203,6 +207,7 @@ class PressRole(Document):
 		return super().delete()
 
 	def on_trash(self) -> None:
+		clear_snapshots(self.team)
 		frappe.db.delete("Account Request Press Role", {"press_role": self.name})
 		# Invites record the selected role in Account Request.press_role and keep
 		# it after acceptance, so the link must be unset for deletion to pass the
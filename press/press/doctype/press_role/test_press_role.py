@@ -1,10 +1,13 @@
 # Copyright (c) 2024, Frappe and Contributors
 # See license.txt
 
+from unittest.mock import patch
+
 import frappe
 from frappe.model.naming import make_autoname
 from frappe.tests.utils import FrappeTestCase
 
+from press.guards.role_guard.snapshot import SNAPSHOT_KEY, get_snapshot
 from press.press.doctype.team.test_team import create_test_team
 
 
@@ -106,6 +109,39 @@ class TestPressRole(FrappeTestCase):
 		self.perm_role.reload()
 		self.assertFalse(any(r.document_name == site_name for r in self.perm_role.resources))
 
+	def test_permission_snapshot_is_cached_and_cleared_on_role_changes(self):
+		site_name = self.create_site_for(self.team.name)
+		self.perm_role.add_user(self.team_member.name)
+		self.perm_role.add_resource([{"document_type": "Site", "document_name": site_name}])
+
+		snapshot = get_snapshot(self.team.name, self.team_member.name)
+		self.assertTrue(snapshot.has_roles)
+		self.assertEqual(snapshot.resources["Site"], {site_name})
+		self.assertNotIn("allow_site_creation", snapshot.flags)
+		with patch("press.guards.role_guard.snapshot.build_snapshot") as build_snapshot:
+			get_snapshot(self.team.name, self.team_member.name)
+		build_snapshot.assert_not_called()
+
+		self.perm_role.set_permission("allow_site_creation", 1)
+		self.perm_role.remove_resource("Site", site_name)
+
+		snapshot = get_snapshot(self.team.name, self.team_member.name)
+		self.assertIn("allow_site_creation", snapshot.flags)
+		self.assertNotIn("Site", snapshot.resources)
+		self.assertFalse(get_snapshot(self.team.name, self.external_team_member.name).has_roles)
+
+	def test_snapshot_built_before_commit_is_cleared_after_commit(self):
+		self.assertFalse(get_snapshot(self.team.name, self.team_member.name).has_roles)
+		self.perm_role.add_user(self.team_member.name)
+		# A concurrent request still reads the roles as they were before this transaction
+		frappe.cache.set_value(
+			f"{SNAPSHOT_KEY}:{self.team.name}:{self.team_member.name}", frappe._dict(has_roles=False)
+		)
+
+		frappe.db.after_commit.run()
+
+		self.assertTrue(get_snapshot(self.team.name, self.team_member.name).has_roles)
+
 
 # utils
 def create_permission_role(team, allow_site_creation=0):
@@ -14,7 +14,8 @@ from oci.core.models import (
 	TcpOptions,
 )
 
-from press.press.doctype.agent_job.agent_job import Agent, handle_polled_jobs, poll_random_jobs
+from press.press.doctype.agent_job.agent_job import Agent, handle_polled_jobs, poll_jobs
+from press.press.doctype.agent_job.poll_scheduler import JobPollScheduler
 from press.press.doctype.ansible_console.ansible_console import AnsibleAdHoc
 from press.runner import Ansible, Status, StepHandler
 from press.utils import servers_using_alternative_port_for_communication
@@ -341,7 +342,7 @@ class ProxyFailover(Document, StepHandler):
 
 		pending_jobs = frappe.get_all(
 			"Agent Job",
-			fields=["name", "job_id", "status", "callback_failure_count"],
+			fields=["name", "job_id", "job_type", "status", "callback_failure_count"],
 			filters={
 				"status": ("in", ["Pending", "Running"]),
 				"job_id": ("!=", 0),
@@ -357,11 +358,10 @@ class ProxyFailover(Document, StepHandler):
 			return
 
 		agent = Agent(self.primary, server_type="Proxy Server")
-		pending_ids = [j.job_id for j in pending_jobs]
-		if not (polled_jobs := poll_random_jobs(agent, pending_ids)):
-			return
-
-		handle_polled_jobs(polled_jobs, pending_jobs)
+		scheduler = JobPollScheduler(self.primary, pending_jobs)
+		if polled_jobs := poll_jobs(agent, scheduler):
+			handle_polled_jobs(polled_jobs, pending_jobs, scheduler)
+		scheduler.save()
 
 	def move_wildcard_domains_from_primary(self, step):
 		step.status = Status.Running
@@ -9,9 +9,9 @@ from typing import TypedDict
 
 import frappe
 import requests
-from frappe.utils.password import get_decrypted_password
 
 from press.utils import log_error
+from press.utils.prometheus import get_client as get_prometheus_client
 from press.utils.raven import send_raven_message
 
 RAVEN_SERVER_ALERTS_CHANNEL = "frappe-cloud-server-alerts"
@@ -224,10 +224,9 @@ def _get_public_server_health_metrics(server_names: list[str]) -> PublicServerHe
 	if not server_names:
 		return None
 
-	prometheus_connection = _get_public_server_pool_prometheus_connection()
-	if not prometheus_connection:
+	client = get_prometheus_client()
+	if not client:
 		return None
-	url, auth = prometheus_connection
 
 	instance_matcher = "|".join(_escape_prometheus_regex_literal(name) for name in server_names)
 
@@ -245,10 +244,19 @@ def _get_public_server_health_metrics(server_names: list[str]) -> PublicServerHe
 		f'job="node"}}[60m])) > 4'
 	)
 
-	available_memory_bytes_results = _query_prometheus_vector(available_memory_bytes_query, url, auth)
-	available_memory_ratio_results = _query_prometheus_vector(available_memory_ratio_query, url, auth)
-	cpu_idle_ratio_results = _query_prometheus_vector(cpu_idle_ratio_query, url, auth)
-	oom_kills_results = _query_prometheus_vector(oom_kills_query, url, auth)
+	queries = {
+		"available_memory_bytes": available_memory_bytes_query,
+		"available_memory_ratio": available_memory_ratio_query,
+		"cpu_idle_ratio": cpu_idle_ratio_query,
+		"oom_kills": oom_kills_query,
+	}
+	# The four queries are independent, so run them concurrently
+	responses = client.query_many(queries, return_exceptions=True)
+	results = {key: _get_prometheus_vector(query, responses[key]) for key, query in queries.items()}
+	available_memory_bytes_results = results["available_memory_bytes"]
+	available_memory_ratio_results = results["available_memory_ratio"]
+	cpu_idle_ratio_results = results["cpu_idle_ratio"]
+	oom_kills_results = results["oom_kills"]
 
 	if (
 		available_memory_bytes_results is None
@@ -269,16 +277,6 @@ def _get_public_server_health_metrics(server_names: list[str]) -> PublicServerHe
 	}
 
 
-def _get_public_server_pool_prometheus_connection() -> tuple[str, tuple[str, str]] | None:
-	monitor_server = frappe.db.get_single_value("Press Settings", "monitor_server")
-	if not monitor_server:
-		return None
-
-	url = f"https://{monitor_server}/prometheus/api/v1/query"
-	password = get_decrypted_password("Monitor Server", monitor_server, "grafana_password")
-	return url, ("frappe", str(password))
-
-
 def _escape_prometheus_regex_literal(value: str) -> str:
 	"""Escape a literal for a Prometheus RE2 regex label matcher."""
 	return PROMETHEUS_REGEX_META_CHAR_PATTERN.sub(r"\\\\\1", value)
@@ -305,22 +303,12 @@ def _build_public_server_metric_map(
 	return server_map
 
 
-def _query_prometheus_vector(query: str, url: str, auth: tuple[str, str]) -> list[dict] | None:
-	try:
-		response = requests.get(url, params={"query": query}, auth=auth, timeout=30)
-		data = response.json()
-	except (ValueError, requests.exceptions.RequestException) as exc:
-		log_error("Public Server Pool Prometheus Query Failed", query=query, exception=exc)
-		return None
-
-	if not response.ok:
-		log_error(
-			"Public Server Pool Prometheus Query Failed",
-			query=query,
-			status_code=response.status_code,
-			response=data,
-		)
+def _get_prometheus_vector(query: str, data: dict | Exception) -> list[dict] | None:
+	if isinstance(data, (ValueError, requests.exceptions.RequestException)):
+		log_error("Public Server Pool Prometheus Query Failed", query=query, exception=data)
 		return None
+	if isinstance(data, Exception):
+		raise data
 
 	if data.get("status") != "success":
 		log_error("Public Server Pool Prometheus Query Failed", query=query, response=data)
@@ -2311,7 +2311,7 @@ class Site(Document, TagHelpers):
 			and current_usages["database"] == site_usage_data["database"]
 			and current_usages["public"] == site_usage_data["public"]
 			and current_usages["private"] == site_usage_data["private"]
-			and current_usages["database_free"] == site_usage_data["private"]
+			and current_usages["database_free"] == site_usage_data["database_free"]
 		)
 
 		if same_as_last_usage:
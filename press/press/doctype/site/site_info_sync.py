@@ -0,0 +1,206 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+"""Bulk counterpart of `Site.sync_info` for all sites in one bench's agent response."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import dateutil.parser
+import frappe
+import pytz
+from frappe.query_builder.functions import Max
+from frappe.utils import now_datetime
+
+from press.utils import get_client_blacklisted_keys, log_error
+
+try:
+	from frappe.utils import convert_utc_to_user_timezone
+except ImportError:
+	from frappe.utils import convert_utc_to_system_timezone as convert_utc_to_user_timezone
+
+SITE_USAGE_FIELDS = [
+	"name",
+	"creation",
+	"modified",
+	"owner",
+	"modified_by",
+	"site",
+	"backups",
+	"database",
+	"database_free",
+	"database_free_tables",
+	"public",
+	"private",
+]
+USAGE_KEYS = ("backups", "database", "database_free", "public", "private")
+BENCH_SYNC_STATS_KEY = "bench_sync_stats"
+
+
+def sync_sites_info(bench: str, data: dict[str, dict]) -> dict:
+	"""Inserts new Site Usage rows in bulk and updates only sites whose config, timezone or database changed.
+
+	Sites with a changed config still go through `Site.sync_info`, it maintains the configuration table.
+	"""
+	start = time.monotonic()
+	sites = {
+		site.name: site
+		for site in frappe.get_all(
+			"Site",
+			filters={"name": ("in", list(data))},
+			fields=["name", "config", "timezone", "database_name"],
+		)
+	}
+	last_usages = get_last_usages(list(sites))
+	blacklisted_keys = set(get_client_blacklisted_keys())
+
+	usages, updates, config_changed, failed = [], {}, [], 0
+	for name, site in sites.items():
+		info = data[name]
+		try:
+			site_usages = get_new_usages(name, info["usage"], last_usages.get(name))
+			changed_config = has_config_changed(site, info["config"], blacklisted_keys)
+			changes = {} if changed_config else get_changed_values(site, info)
+		except Exception:
+			# A malformed entry only skips its own site
+			log_error(
+				"Site Sync Error",
+				site=name,
+				info=info,
+				reference_doctype="Bench",
+				reference_name=bench,
+			)
+			failed += 1
+			continue
+
+		usages.extend(site_usages)
+		if changed_config:
+			config_changed.append(name)
+		elif changes:
+			updates[name] = changes
+
+	insert_site_usages(usages)
+	if updates:
+		frappe.db.bulk_update("Site", updates)
+	frappe.db.commit()
+
+	for name in config_changed:
+		try:
+			frappe.get_doc("Site", name, for_update=True).sync_info({**data[name], "usage": []})
+			frappe.db.commit()
+		except Exception:
+			log_error(
+				"Site Sync Error",
+				site=name,
+				info=data[name],
+				reference_doctype="Bench",
+				reference_name=bench,
+			)
+			frappe.db.rollback()
+
+	stats = {
+		"duration": time.monotonic() - start,
+		"sites": len(sites),
+		"usages_inserted": len(usages),
+		"sites_updated": len(updates) + len(config_changed),
+		"sites_failed": failed,
+	}
+	frappe.cache.hset(BENCH_SYNC_STATS_KEY, bench, stats)
+	return stats
+
+
+def get_bench_sync_stats(bench: str) -> dict | None:
+	return frappe.cache.hget(BENCH_SYNC_STATS_KEY, bench)
+
+
+def get_last_usages(sites: list[str]) -> dict[str, frappe._dict]:
+	if not sites:
+		return {}
+
+	usage = frappe.qb.DocType("Site Usage")
+	latest = (
+		frappe.qb.from_(usage)
+		.select(usage.site, Max(usage.creation).as_("creation"))
+		.where(usage.site.isin(sites))
+		.groupby(usage.site)
+	)
+	rows = (
+		frappe.qb.from_(usage)
+		.join(latest)
+		.on((usage.site == latest.site) & (usage.creation == latest.creation))
+		.select(usage.site, usage.creation, *(usage[key] for key in USAGE_KEYS))
+		.run(as_dict=True)
+	)
+	return {row.site: row for row in rows}
+
+
+def get_new_usages(site: str, usage: dict | list[dict], last: frappe._dict | None) -> list[dict]:
+	"""Same rules as `Site._insert_site_usage`, applied against the in-memory last usage."""
+	new_usages = []
+	for entry in usage if isinstance(usage, list) else [usage]:
+		row = frappe._dict(
+			site=site,
+			backups=entry["backups"],
+			database=entry["database"],
+			database_free=entry.get("database_free", 0),
+			database_free_tables=json.dumps(entry.get("database_free_tables", []), indent=1),
+			public=entry["public"],
+			private=entry["private"],
+		)
+		if last and all(last[key] == row[key] for key in USAGE_KEYS):
+			continue
+
+		row.creation = now_datetime()
+		if entry.get("timestamp"):
+			row.creation = convert_utc_to_user_timezone(dateutil.parser.parse(entry["timestamp"])).replace(
+				tzinfo=None
+			)
+			# Already recorded, or older than what we have
+			if last and last.creation and row.creation <= last.creation:
+				continue
+
+		new_usages.append(row)
+		last = row
+	return new_usages
+
+
+def insert_site_usages(usages: list[dict]):
+	if not usages:
+		return
+
+	timestamp = now_datetime()
+	user = frappe.session.user
+	for usage in usages:
+		usage.update(name=frappe.generate_hash(length=10), modified=timestamp, owner=user, modified_by=user)
+
+	values = [tuple(usage[field] for field in SITE_USAGE_FIELDS) for usage in usages]
+	frappe.db.bulk_insert("Site Usage", SITE_USAGE_FIELDS, values)
+
+
+def has_config_changed(site: frappe._dict, fetched_config: dict, blacklisted_keys: set[str]) -> bool:
+	config = {key: value for key, value in fetched_config.items() if key not in blacklisted_keys}
+	return site.config != json.dumps({**json.loads(site.config or "{}"), **config}, indent=4)
+
+
+def get_changed_values(site: frappe._dict, info: dict) -> dict:
+	changes = {}
+	timezone = info["timezone"]
+	if site.timezone != timezone and is_valid_timezone(timezone):
+		changes["timezone"] = timezone
+
+	database_name = info["config"].get("db_name")
+	if site.database_name != database_name:
+		changes["database_name"] = database_name
+	return changes
+
+
+def is_valid_timezone(timezone: str) -> bool:
+	# Empty string is fine, since we default to IST
+	if not timezone:
+		return True
+	try:
+		pytz.timezone(timezone)
+	except pytz.exceptions.UnknownTimeZoneError:
+		return False
+	return True
@@ -53,25 +53,35 @@ def update_cpu_usage_server(server):
 		fields=["name", "plan", "current_cpu_usage"],
 	)
 
+	# No Site hook reads current_cpu_usage, so the column is written without saving each site
+	try:
+		frappe.db.bulk_update(
+			"Site",
+			{
+				site.name: {"current_cpu_usage": cpu_usage}
+				for site, cpu_usage in get_changed_cpu_usages(sites, usage)
+			},
+			update_modified=False,
+		)
+		frappe.db.commit()
+	except rq.timeouts.JobTimeoutException:
+		# Next run writes the usages again, as before
+		frappe.db.rollback()
+
+
+def get_changed_cpu_usages(sites, usage) -> list[tuple]:
+	changed = []
 	for site in sites:
 		if site.name not in usage:
 			continue
 		try:
-			cpu_usage = usage[site.name]
-			cpu_limit = get_cpu_limits(site.plan)
-			latest_cpu_usage = int((cpu_usage / cpu_limit) * 100)
-
-			if site.current_cpu_usage != latest_cpu_usage:
-				site_doc = frappe.get_doc("Site", site.name)
-				site_doc.current_cpu_usage = latest_cpu_usage
-				site_doc.save()
-				frappe.db.commit()
-		except rq.timeouts.JobTimeoutException:
-			frappe.db.rollback()
-			return
+			cpu_usage = int((usage[site.name] / get_cpu_limits(site.plan)) * 100)
 		except Exception:
-			log_error("Site CPU Usage Update Error", site=site, cpu_usage=cpu_usage, cpu_limit=cpu_limit)
-			frappe.db.rollback()
+			log_error("Site CPU Usage Update Error", site=site, cpu_usage=usage[site.name])
+			continue
+		if site.current_cpu_usage != cpu_usage:
+			changed.append((site, cpu_usage))
+	return changed
 
 
 def update_disk_usages():
@@ -39,6 +39,7 @@ from press.press.doctype.site.site import (
 	process_rename_site_job_update,
 	suspend_sites_exceeding_disk_usage_for_last_14_days,
 )
+from press.press.doctype.site.site_info_sync import sync_sites_info
 from press.press.doctype.site_migration.site_migration import SiteMigration
 from press.press.doctype.site_plan.test_site_plan import create_test_plan
 from press.press.doctype.team.test_team import create_test_team
@@ -669,6 +670,54 @@ class TestSite(FrappeTestCase):
 		self.assertEqual(latest.private, 300)
 		self.assertEqual(latest.backups, 400)
 
+	@patch("press.press.doctype.site.site_info_sync.frappe.db.commit", new=Mock())
+	def test_bulk_sync_info_inserts_new_usages_and_skips_unchanged_sites(self):
+		unchanged, moved = create_test_site(), create_test_site()
+		usage = {"database": 100, "database_free": 10, "public": 200, "private": 300, "backups": 400}
+		for site in (unchanged, moved):
+			site.db_set("config", json.dumps({"db_name": site.database_name}, indent=4))
+			frappe.get_doc({"doctype": "Site Usage", "site": site.name, **usage}).insert()
+
+		data = {
+			unchanged.name: {
+				"usage": usage,
+				"config": {"db_name": unchanged.database_name},
+				"timezone": unchanged.timezone,
+			},
+			moved.name: {
+				"usage": [{**usage, "database": 150, "timestamp": "2026-10-17T10:00:00+00:00"}],
+				"config": {"db_name": moved.database_name},
+				"timezone": "Asia/Kolkata",
+			},
+		}
+		with patch.object(Site, "sync_info") as sync_info:
+			stats = sync_sites_info(moved.bench, data)
+
+		sync_info.assert_not_called()
+		self.assertEqual(stats["usages_inserted"], 1)
+		self.assertEqual(stats["sites_updated"], 1)
+		self.assertEqual(frappe.db.count("Site Usage", {"site": unchanged.name}), 1)
+		self.assertEqual(frappe.get_last_doc("Site Usage", {"site": moved.name}).database, 150)
+		self.assertEqual(frappe.db.get_value("Site", moved.name, "timezone"), "Asia/Kolkata")
+
+	@patch("press.press.doctype.site.site_info_sync.frappe.db.commit", new=Mock())
+	@patch("press.press.doctype.site.site_info_sync.log_error")
+	def test_bulk_sync_info_skips_only_malformed_sites(self, log_error):
+		malformed, site = create_test_site(), create_test_site()
+		site.db_set("config", json.dumps({"db_name": site.database_name}, indent=4))
+		usage = {"database": 100, "database_free": 10, "public": 200, "private": 300, "backups": 400}
+		data = {
+			malformed.name: {"config": {}, "timezone": malformed.timezone},
+			site.name: {"usage": usage, "config": {"db_name": site.database_name}, "timezone": site.timezone},
+		}
+		with patch.object(Site, "sync_info") as sync_info:
+			stats = sync_sites_info(site.bench, data)
+
+		sync_info.assert_not_called()
+		log_error.assert_called_once()
+		self.assertEqual(stats["sites_failed"], 1)
+		self.assertEqual(frappe.get_last_doc("Site Usage", {"site": site.name}).database, 100)
+
 	def test_free_sites_ignore_usage_exceed_tracking(self):
 		team = create_test_team(free_account=False)
 		plan_10 = create_test_plan("Site", price_usd=10.0, price_inr=750.0, plan_name="USD 10")
@@ -910,3 +959,39 @@ class TestSite(FrappeTestCase):
 		}
 		self.assertTrue(bahrain_files.isdisjoint(deleted_files))
 		self.assertTrue(other_files.issubset(set(deleted_files)))
+
+
+@patch("press.press.doctype.site.site_usages.frappe.db.commit", new=Mock())
+@patch("press.press.doctype.site.site_usages.get_cpu_limits", new=Mock(return_value=1_000_000))
+class TestSiteCPUUsage(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def _update(self, site, cpu_time: int):
+		from press.press.doctype.site.site_usages import update_cpu_usage_server
+
+		with patch(
+			"press.press.doctype.site.site_usages.get_current_cpu_usage_for_sites_on_server",
+			return_value={site.name: cpu_time},
+		):
+			update_cpu_usage_server(site.server)
+
+	def test_cpu_usage_is_bulk_written_without_saving_site(self):
+		site = create_test_site()
+		site.db_set("current_cpu_usage", 10)
+
+		with patch.object(Site, "save") as save:
+			self._update(site, 200_000)
+
+		save.assert_not_called()
+		self.assertEqual(frappe.db.get_value("Site", site.name, "current_cpu_usage"), 20)
+
+	def test_cpu_usage_crossing_the_plan_limit_is_bulk_written_too(self):
+		site = create_test_site()
+		site.db_set("current_cpu_usage", 90)
+
+		with patch.object(Site, "save") as save:
+			self._update(site, 1_200_000)
+
+		save.assert_not_called()
+		self.assertEqual(frappe.db.get_value("Site", site.name, "current_cpu_usage"), 120)
@@ -1,10 +1,21 @@
 # Copyright (c) 2022, Frappe and contributors
 # For license information, please see license.txt
 
+from collections import defaultdict
+
 import frappe
 from frappe.model.document import Document
-from frappe.query_builder import Interval
-from frappe.query_builder.functions import Now
+from frappe.utils import add_days, get_datetime, now_datetime
+
+CHILD_DOCTYPES = [
+	"Site Analytics User",
+	"Site Analytics Login",
+	"Site Analytics App",
+	"Site Analytics DocType",
+	"Site Analytics Active",
+]
+# Snapshots deleted per transaction while pruning
+PRUNE_BATCH_SIZE = 1000
 
 
 class SiteAnalytics(Document):
@@ -46,80 +57,150 @@ class SiteAnalytics(Document):
 
 	@staticmethod
 	def clear_old_logs(days=30):
-		tables = [
+		"""Deletes snapshots older than `days` along with their rows, in small committed batches."""
+		cutoff = add_days(now_datetime(), -days)
+		while names := frappe.get_all(
 			"Site Analytics",
-			"Site Analytics User",
-			"Site Analytics Login",
-			"Site Analytics App",
-			"Site Analytics DocType",
-			"Site Analytics Active",
-		]
-		for table in tables:
-			table = frappe.qb.DocType(table)
-			frappe.db.delete(table, filters=(table.modified < (Now() - Interval(days=days))))
+			filters={"modified": ("<", cutoff)},
+			pluck="name",
+			order_by="modified asc",
+			limit=PRUNE_BATCH_SIZE,
+		):
+			for doctype in CHILD_DOCTYPES:
+				frappe.db.delete(doctype, {"parenttype": "Site Analytics", "parent": ("in", names)})
+			frappe.db.delete("Site Analytics", {"name": ("in", names)})
 			frappe.db.commit()
 
 
-def create_site_analytics(site, data):
-	def get_last_logins(analytics):
-		last_logins = []
-		for login in analytics.get("last_logins", []):
-			last_logins.append(
+def on_doctype_update():
+	frappe.db.add_index("Site Analytics", ["site", "timestamp"])
+
+
+def get_last_logins(analytics):
+	last_logins = []
+	for login in analytics.get("last_logins", []):
+		last_logins.append(
+			{
+				"user": login["user"],
+				"full_name": login["full_name"],
+				"timestamp": login["creation"],
+			}
+		)
+	return last_logins
+
+
+def get_sales_data(analytics):
+	sales_data = []
+	for row in analytics.get("activation", {}).get("sales_data", []):
+		doctype, count = next(iter(row.items()))
+		if count:
+			sales_data.append(
 				{
-					"user": login["user"],
-					"full_name": login["full_name"],
-					"timestamp": login["creation"],
+					"document_type": doctype,
+					"count": count,
 				}
 			)
-		return last_logins
-
-	def get_sales_data(analytics):
-		sales_data = []
-		for row in analytics.get("activation", {}).get("sales_data", []):
-			doctype, count = tuple(row.items())[0]
-			if count:
-				sales_data.append(
-					{
-						"document_type": doctype,
-						"count": count,
-					}
-				)
-		return sales_data
-
-	def get_last_active(analytics):
-		last_active = []
-		for user in analytics.get("users", []):
-			if user and user.get("enabled") == 1:
-				last_active.append(user)
-
-		return last_active
-
-	timestamp = data["timestamp"]
+	return sales_data
+
+
+def get_last_active(analytics):
+	last_active = []
+	for user in analytics.get("users", []):
+		if user and user.get("enabled") == 1:
+			last_active.append(user)
+
+	return last_active
+
+
+def get_site_analytics_doc(site, data) -> Document:
 	analytics = data["analytics"]
-	if not frappe.db.exists("Site Analytics", {"site": site, "timestamp": timestamp}):
-		doc = frappe.get_doc(
+	return frappe.get_doc(
+		{
+			"doctype": "Site Analytics",
+			"site": site,
+			"timestamp": data["timestamp"],
+			"country": analytics.get("country"),
+			"time_zone": analytics.get("time_zone"),
+			"language": analytics.get("language"),
+			"scheduler_enabled": analytics.get("scheduler_enabled"),
+			"setup_complete": analytics.get("setup_complete"),
+			"space_used": analytics.get("space_used"),
+			"backup_size": analytics.get("backup_size"),
+			"database_size": analytics.get("database_size"),
+			"files_size": analytics.get("files_size"),
+			"emails_sent": analytics.get("emails_sent"),
+			"installed_apps": analytics.get("installed_apps", []),
+			"users": analytics.get("users", []),
+			"last_logins": get_last_logins(analytics),
+			"last_active": get_last_active(analytics),
+			"company": analytics.get("company"),
+			"domain": analytics.get("domain"),
+			"activation_level": analytics.get("activation", {}).get("activation_level"),
+			"sales_data": get_sales_data(analytics),
+		}
+	)
+
+
+def create_site_analytics(site, data):
+	if not frappe.db.exists("Site Analytics", {"site": site, "timestamp": data["timestamp"]}):
+		get_site_analytics_doc(site, data).insert()
+
+
+def create_sites_analytics(data: dict[str, dict]) -> int:
+	"""Inserts snapshots of many sites with one multi-row insert per table. Returns snapshots inserted."""
+	existing = {
+		(row.site, row.timestamp)
+		for row in frappe.get_all(
+			"Site Analytics",
+			filters={
+				"site": ("in", list(data)),
+				"timestamp": ("in", list({analytics["timestamp"] for analytics in data.values()})),
+			},
+			fields=["site", "timestamp"],
+		)
+	}
+	docs = [
+		get_site_analytics_doc(site, analytics)
+		for site, analytics in data.items()
+		if (site, get_datetime(analytics["timestamp"])) not in existing
+	]
+	if docs:
+		bulk_insert_site_analytics(docs)
+	return len(docs)
+
+
+def bulk_insert_site_analytics(docs: list[Document]):
+	"""Writes documents without running controller hooks, Site Analytics has none."""
+	timestamp = now_datetime()
+	user = frappe.session.user
+	rows = defaultdict(list)
+	for doc in docs:
+		doc.update(
 			{
-				"doctype": "Site Analytics",
-				"site": site,
-				"timestamp": timestamp,
-				"country": analytics.get("country"),
-				"time_zone": analytics.get("time_zone"),
-				"language": analytics.get("language"),
-				"scheduler_enabled": analytics.get("scheduler_enabled"),
-				"setup_complete": analytics.get("setup_complete"),
-				"space_used": analytics.get("space_used"),
-				"backup_size": analytics.get("backup_size"),
-				"database_size": analytics.get("database_size"),
-				"files_size": analytics.get("files_size"),
-				"emails_sent": analytics.get("emails_sent"),
-				"installed_apps": analytics.get("installed_apps", []),
-				"users": analytics.get("users", []),
-				"last_logins": get_last_logins(analytics),
-				"last_active": get_last_active(analytics),
-				"company": analytics.get("company"),
-				"domain": analytics.get("domain"),
-				"activation_level": analytics.get("activation", {}).get("activation_level"),
-				"sales_data": get_sales_data(analytics),
+				"name": frappe.generate_hash(length=10),
+				"creation": timestamp,
+				"modified": timestamp,
+				"owner": user,
+				"modified_by": user,
 			}
 		)
-		doc.insert()
+		rows[doc.doctype].append(doc.get_valid_dict(convert_dates_to_str=True))
+		for child in doc.get_all_children():
+			child.update(
+				{
+					"parent": doc.name,
+					"parenttype": doc.doctype,
+					"creation": timestamp,
+					"modified": timestamp,
+					"owner": user,
+					"modified_by": user,
+				}
+			)
+			row = child.get_valid_dict(convert_dates_to_str=True)
+			# Child tables are autoincrement named
+			row.pop("name", None)
+			rows[child.doctype].append(row)
+
+	for doctype, values in rows.items():
+		fields = list(values[0])
+		frappe.db.bulk_insert(doctype, fields, [tuple(row[field] for field in fields) for row in values])
@@ -1,9 +1,72 @@
 # Copyright (c) 2022, Frappe and Contributors
 # See license.txt
 
-# import frappe
+from unittest.mock import Mock, patch
+
+import frappe
 from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_days, now_datetime
+
+from press.press.doctype.site.test_site import create_test_site
+from press.press.doctype.site_analytics.site_analytics import SiteAnalytics, create_sites_analytics
+
+
+def get_test_analytics(timestamp: str = "2026-10-17 10:00:00") -> dict:
+	return {
+		"timestamp": timestamp,
+		"analytics": {
+			"country": "India",
+			"scheduler_enabled": None,
+			"installed_apps": [{"app_name": "frappe", "version": "15.0.0", "branch": "version-15"}],
+			"users": [
+				{"email": "a@example.com", "enabled": 1, "is_system_manager": 1},
+				{"email": "b@example.com", "enabled": 0},
+			],
+			"last_logins": [{"user": "a@example.com", "full_name": "A", "creation": "2026-10-17 09:00:00"}],
+			"activation": {"activation_level": 3, "sales_data": [{"Sales Invoice": 4}, {"Quotation": 0}]},
+		},
+	}
 
 
 class TestSiteAnalytics(FrappeTestCase):
-	pass
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_bulk_insert_matches_document_insert(self):
+		first, second = create_test_site(), create_test_site()
+		inserted = create_sites_analytics(
+			{first.name: get_test_analytics(), second.name: get_test_analytics()}
+		)
+		# Snapshot already recorded
+		inserted += create_sites_analytics({first.name: get_test_analytics()})
+
+		self.assertEqual(inserted, 2)
+		analytics = frappe.get_last_doc("Site Analytics", {"site": first.name})
+		self.assertEqual(analytics.country, "India")
+		self.assertEqual(analytics.scheduler_enabled, 0)
+		self.assertEqual(analytics.activation_level, 3)
+		self.assertEqual([user.email for user in analytics.users], ["a@example.com", "b@example.com"])
+		self.assertEqual([user.idx for user in analytics.users], [1, 2])
+		self.assertEqual([user.email for user in analytics.last_active], ["a@example.com"])
+		self.assertEqual(analytics.installed_apps[0].app_name, "frappe")
+		self.assertEqual(analytics.last_logins[0].user, "a@example.com")
+		self.assertEqual(
+			[(row.document_type, row.count) for row in analytics.sales_data], [("Sales Invoice", 4)]
+		)
+
+	@patch("press.press.doctype.site_analytics.site_analytics.frappe.db.commit", new=Mock())
+	@patch("press.press.doctype.site_analytics.site_analytics.PRUNE_BATCH_SIZE", new=1)
+	def test_clear_old_logs_deletes_old_snapshots_with_their_rows(self):
+		site = create_test_site()
+		create_sites_analytics({site.name: get_test_analytics("2026-01-01 00:00:00")})
+		old = frappe.get_last_doc("Site Analytics", {"site": site.name}).name
+		frappe.db.set_value(
+			"Site Analytics", old, "modified", add_days(now_datetime(), -40), update_modified=False
+		)
+		create_sites_analytics({site.name: get_test_analytics()})
+
+		SiteAnalytics.clear_old_logs(days=30)
+
+		self.assertFalse(frappe.db.exists("Site Analytics", old))
+		self.assertFalse(frappe.db.exists("Site Analytics User", {"parent": old}))
+		self.assertEqual(frappe.db.count("Site Analytics", {"site": site.name}), 1)
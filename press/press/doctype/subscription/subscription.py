@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 import frappe
 import rq
 from frappe.model.document import Document
+from frappe.monitor import add_data_to_monitor
 from frappe.query_builder.functions import Coalesce, Count
 from frappe.utils import cint, flt
 
@@ -16,7 +17,7 @@ from press.overrides import get_permission_query_conditions_for_doctype
 from press.press.doctype.database_server.database_server import DatabaseServer
 from press.press.doctype.s3_storage_plan.s3_storage_plan import AUDIT_LOG_STORAGE_PLAN
 from press.press.doctype.site_plan.site_plan import SitePlan
-from press.utils import log_error
+from press.press.doctype.subscription.usage_record_batch import UsageRecordBatch
 from press.utils.jobs import has_job_timeout_exceeded
 
 if TYPE_CHECKING:
@@ -325,40 +326,42 @@ def create_usage_records_of_date(
 	Creates daily usage records for paid Subscriptions
 
 	If no date is provided, it defaults to today.
-	If usage_record_creation_batch_size is not provided, it will fetch from `Press Settings` or default to 500.
+	Works through all pending subscriptions in batches of usage_record_creation_batch_size,
+	from `Press Settings` or 500, until they are done or the job times out.
 	"""
 	free_sites = sites_with_free_hosting()
 	settings = frappe.get_single("Press Settings")
-	subscriptions = frappe.db.get_all(
+	batch_size = usage_record_creation_batch_size or settings.usage_record_creation_batch_size or 500
+	attempted, batches = [], []
+	while subscriptions := get_subscriptions_without_usage_record(free_sites, date, attempted, batch_size):
+		if has_job_timeout_exceeded():
+			break
+		try:
+			batches.append(UsageRecordBatch(subscriptions, date).run())
+		except rq.timeouts.JobTimeoutException:
+			# This job took too long to execute
+			# We need to rollback the transaction
+			# Try again in the next job
+			frappe.db.rollback()
+			break
+		attempted.extend(subscriptions)
+	add_data_to_monitor(usage_record_batches=batches)
+
+
+def get_subscriptions_without_usage_record(free_sites, date, attempted, limit) -> list[str]:
+	return frappe.db.get_all(
 		"Subscription",
 		filters={
 			"enabled": True,
 			"plan": ("in", paid_plans()),
-			"name": ("not in", created_usage_records(free_sites, date=date)),
+			"name": ("not in", created_usage_records(free_sites, date=date) + attempted),
 			"document_name": ("not in", free_sites),
 		},
 		pluck="name",
 		order_by=None,
-		limit=usage_record_creation_batch_size or settings.usage_record_creation_batch_size or 500,
+		limit=limit,
 		ignore_ifnull=True,
-		debug=True,
 	)
-	for name in subscriptions:
-		if has_job_timeout_exceeded():
-			return
-		subscription = frappe.get_cached_doc("Subscription", name)
-		try:
-			subscription.create_usage_record(date=date)
-			frappe.db.commit()
-		except rq.timeouts.JobTimeoutException:
-			# This job took too long to execute
-			# We need to rollback the transaction
-			# Try again in the next job
-			frappe.db.rollback()
-			return
-		except Exception:
-			frappe.db.rollback()
-			log_error(title="Create Usage Record Error", name=name)
 
 
 def paid_plans():
@@ -9,6 +9,7 @@ from frappe.tests.utils import FrappeTestCase
 
 from press.press.doctype.site.test_site import create_test_site
 from press.press.doctype.subscription.subscription import sites_with_free_hosting
+from press.press.doctype.subscription.usage_record_batch import UsageRecordBatch
 from press.press.doctype.team.test_team import create_test_team
 
 
@@ -185,3 +186,29 @@ class TestSubscription(FrappeTestCase):
 		# test: site owned by free account
 		free_sites = sites_with_free_hosting()
 		self.assertEqual(len(free_sites), 2)
+
+	def test_usage_record_batch_creates_records_and_adds_them_to_upcoming_invoice(self):
+		self.team.create_upcoming_invoice()
+		site = create_test_site(team=self.team.name)
+		subscription = frappe.get_doc("Subscription", {"document_type": "Site", "document_name": site.name})
+
+		with patch.object(frappe.db, "commit"):
+			result = UsageRecordBatch([subscription.name]).run()
+
+		self.assertEqual(result["created"], 1)
+		usage_record = frappe.get_doc("Usage Record", {"subscription": subscription.name})
+		invoice = frappe.get_doc("Invoice", {"team": self.team.name, "status": "Draft"})
+		self.assertEqual(usage_record.invoice, invoice.name)
+		self.assertEqual(invoice.total, usage_record.amount)
+
+	def test_usage_record_batch_skips_subscriptions_already_charged_for_the_day(self):
+		self.team.create_upcoming_invoice()
+		site = create_test_site(team=self.team.name)
+		subscription = frappe.get_doc("Subscription", {"document_type": "Site", "document_name": site.name})
+
+		with patch.object(frappe.db, "commit"):
+			subscription.create_usage_record()
+			result = UsageRecordBatch([subscription.name]).run()
+
+		self.assertEqual(result["created"], 0)
+		self.assertEqual(frappe.db.count("Usage Record", {"subscription": subscription.name}), 1)
@@ -0,0 +1,279 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import frappe
+from frappe.model.naming import NamingSeries
+from frappe.utils import get_datetime, get_datetime_str, getdate, now_datetime, nowtime
+
+from press.press.doctype.s3_storage_plan.s3_storage_plan import AUDIT_LOG_STORAGE_PLAN
+from press.utils import log_error
+
+if TYPE_CHECKING:
+	from press.press.doctype.team.team import Team
+
+USAGE_RECORD_FIELDS = [
+	"name",
+	"creation",
+	"modified",
+	"owner",
+	"modified_by",
+	"docstatus",
+	"team",
+	"document_type",
+	"document_name",
+	"plan_type",
+	"plan",
+	"amount",
+	"date",
+	"time",
+	"subscription",
+	"interval",
+	"site",
+]
+SUBSCRIPTION_FIELDS = [
+	"name",
+	"creation",
+	"team",
+	"document_type",
+	"document_name",
+	"plan_type",
+	"plan",
+	"interval",
+	"additional_storage",
+	"site",
+]
+BATCH_DOCUMENT_TYPES = ("Site", "Server", "Database Server", "Self Hosted Server", "Marketplace App")
+
+
+class UsageRecordBatch:
+	"""Creates daily usage records for a batch of subscriptions from preloaded lookups.
+
+	Subscriptions with priced extras (storage, snapshots, audit logs) or other intervals
+	go through Subscription.create_usage_record instead.
+	"""
+
+	def __init__(self, subscription_names: list[str], date=None):
+		self.date = getdate(date)
+		self.subscriptions = frappe.get_all(
+			"Subscription", filters={"name": ("in", subscription_names)}, fields=SUBSCRIPTION_FIELDS
+		)
+		self.plans = {}
+
+	def run(self) -> dict:
+		start = time.monotonic()
+		batchable = [s for s in self.subscriptions if is_batchable(s)]
+		self.create_one_by_one([s for s in self.subscriptions if not is_batchable(s)])
+
+		self.preload(batchable)
+		records_by_team = defaultdict(list)
+		for subscription in batchable:
+			try:
+				record = self.get_usage_record(subscription)
+			except Exception:
+				log_error(title="Create Usage Record Error", name=subscription.name)
+				continue
+			if record:
+				records_by_team[record.team].append((subscription, record))
+
+		created = sum(self.create_for_team(team, rows) for team, rows in records_by_team.items())
+		return {
+			"subscriptions": len(self.subscriptions),
+			"created": created,
+			"duration": round(time.monotonic() - start, 3),
+		}
+
+	def preload(self, subscriptions: list):
+		self.teams = self.get_teams({s.team for s in subscriptions})
+		self.charged = self.get_charged(subscriptions)
+		self.chargeable = self.get_chargeable_documents(subscriptions)
+		self.primary_servers = set(
+			frappe.get_all(
+				"Server",
+				filters={"name": ("in", self.document_names(subscriptions, "Server")), "is_primary": 1},
+				pluck="name",
+			)
+		)
+
+	def get_teams(self, names: set) -> dict:
+		fields = ["name", "parent_team", "billing_team", "payment_mode", "currency", "free_account"]
+		teams = {t.name: t for t in frappe.get_all("Team", {"name": ("in", list(names))}, fields)}
+		parents = {t.parent_team for t in teams.values() if t.parent_team}
+		parents |= {t.billing_team for t in teams.values() if t.billing_team}
+		if parents - set(teams):
+			teams.update(self.get_teams(parents - set(teams)))
+		return teams
+
+	def get_charged(self, subscriptions: list) -> set[tuple[str, str]]:
+		"""(subscription, plan) of usage records already created for the date, a rerun skips these."""
+		if not subscriptions:
+			return set()
+		records = frappe.get_all(
+			"Usage Record",
+			filters={
+				"subscription": ("in", [s.name for s in subscriptions]),
+				"date": self.date,
+				"docstatus": 1,
+			},
+			fields=["subscription", "plan"],
+		)
+		return {(record.subscription, record.plan) for record in records}
+
+	def get_chargeable_documents(self, subscriptions: list) -> dict[tuple[str, str], str | None]:
+		"""Maps (document type, name) of documents that can be charged to their team."""
+		chargeable = {}
+		for document_type in BATCH_DOCUMENT_TYPES:
+			names = self.document_names(subscriptions, document_type)
+			for document in get_chargeable(document_type, names):
+				chargeable[(document_type, document.name)] = document.team
+		return chargeable
+
+	def document_names(self, subscriptions: list, document_type: str) -> list[str]:
+		return list({s.document_name for s in subscriptions if s.document_type == document_type})
+
+	def get_usage_record(self, subscription) -> frappe._dict | None:
+		if not self.can_charge(subscription) or getdate(subscription.creation) > self.date:
+			return None
+		if (subscription.name, subscription.plan) in self.charged:
+			return None
+		if (
+			subscription.plan_type == "Server Plan"
+			and subscription.document_type == "Server"
+			and subscription.document_name not in self.primary_servers
+		):
+			return None
+
+		team = self.get_billing_team(subscription.team)
+		return frappe._dict(
+			team=team.name,
+			free_account=team.free_account,
+			document_type=subscription.document_type,
+			document_name=subscription.document_name,
+			plan_type=subscription.plan_type,
+			plan=subscription.plan,
+			amount=self.get_plan(subscription).get_price_for_interval(subscription.interval, team.currency),
+			date=self.date,
+			subscription=subscription.name,
+			interval=subscription.interval,
+			site=subscription.site if subscription.document_type == "Marketplace App" else None,
+		)
+
+	def can_charge(self, subscription) -> bool:
+		key = (subscription.document_type, subscription.document_name)
+		if key not in self.chargeable:
+			return False
+		if subscription.document_type == "Marketplace App":
+			return subscription.team not in (self.chargeable[key], "Administrator")
+		return True
+
+	def get_billing_team(self, name: str):
+		team = self.teams[name]
+		if team.parent_team:
+			team = self.teams[team.parent_team]
+		if team.billing_team and team.payment_mode == "Paid By Partner":
+			team = self.teams[team.billing_team]
+		return team
+
+	def get_plan(self, subscription):
+		key = (subscription.plan_type, subscription.plan)
+		if key not in self.plans:
+			self.plans[key] = frappe.get_cached_doc(*key)
+		return self.plans[key]
+
+	def create_for_team(self, team: str, rows: list) -> int:
+		records = [record for _, record in rows]
+		try:
+			insert_usage_records(records)
+			if not records[0].free_account:
+				add_to_upcoming_invoice(frappe.get_doc("Team", team), records)
+			frappe.db.commit()
+			return len(records)
+		except Exception:
+			frappe.db.rollback()
+			log_error("Usage Record Batch Error", team=team)
+			return self.create_one_by_one([subscription for subscription, _ in rows])
+
+	def create_one_by_one(self, subscriptions: list) -> int:
+		created = 0
+		for subscription in subscriptions:
+			try:
+				doc = frappe.get_cached_doc("Subscription", subscription.name)
+				created += bool(doc.create_usage_record(date=self.date))
+				frappe.db.commit()
+			except Exception:
+				frappe.db.rollback()
+				log_error(title="Create Usage Record Error", name=subscription.name)
+		return created
+
+
+def is_batchable(subscription) -> bool:
+	if subscription.interval != "Daily" or subscription.additional_storage:
+		return False
+	if subscription.plan_type == "Server Snapshot Plan":
+		return False
+	if subscription.plan_type == "S3 Storage Plan" and subscription.plan == AUDIT_LOG_STORAGE_PLAN:
+		return False
+	if subscription.document_type == "Marketplace App" and not subscription.site:
+		return False
+	return subscription.document_type in BATCH_DOCUMENT_TYPES
+
+
+def get_chargeable(document_type: str, names: list[str]) -> list:
+	"""Returns the documents the subscription can charge for, mirrors `can_charge_for_subscription`."""
+	if not names:
+		return []
+	filters = {"name": ("in", names)}
+	if document_type == "Site":
+		documents = frappe.get_all(
+			document_type,
+			filters={**filters, "status": ("not in", ["Archived", "Suspended"]), "free": 0},
+			fields=["name", "team", "trial_end_date"],
+		)
+		today = frappe.utils.getdate()
+		return [
+			d
+			for d in documents
+			if d.team not in (None, "", "Administrator")
+			and (not d.trial_end_date or today > get_datetime(d.trial_end_date).date())
+		]
+	if document_type == "Self Hosted Server":
+		filters["status"] = ("not in", ["Archived", "Unreachable", "Pending"])
+		filters["team"] = ("not in", ["", "Administrator"])
+	fields = ["name", "team"] if frappe.get_meta(document_type).has_field("team") else ["name"]
+	return [frappe._dict({"team": None, **d}) for d in frappe.get_all(document_type, filters, fields)]
+
+
+def insert_usage_records(records: list[frappe._dict]):
+	timestamp = get_datetime_str(now_datetime())
+	time_of_day = nowtime()
+	user = frappe.session.user
+	for record, name in zip(records, reserve_names(len(records)), strict=True):
+		record.name = name
+		record.docstatus = 1
+		record.update(creation=timestamp, modified=timestamp, owner=user, modified_by=user, time=time_of_day)
+
+	values = [tuple(record[field] for field in USAGE_RECORD_FIELDS) for record in records]
+	frappe.db.bulk_insert("Usage Record", USAGE_RECORD_FIELDS, values)
+
+
+def reserve_names(count: int) -> list[str]:
+	"""Reserves `count` consecutive names of the Usage Record naming series."""
+	series = NamingSeries(frappe.get_meta("Usage Record").autoname)
+	prefix = series.get_prefix()
+	frappe.db.sql("SELECT `current` FROM `tabSeries` WHERE `name` = %s FOR UPDATE", prefix)
+	current = series.get_current_value()
+	series.update_counter(current + count)
+	return [f"{prefix}{number:06d}" for number in range(current + 1, current + count + 1)]
+
+
+def add_to_upcoming_invoice(team: Team, records: list[frappe._dict]):
+	invoice = team.get_upcoming_invoice(for_update=True) or team.create_upcoming_invoice()
+	linked = [record.name for record in records if invoice.add_usage_record(record, save=False)]
+	if not linked:
+		return
+	invoice.save()
+	frappe.db.set_value("Usage Record", {"name": ("in", linked)}, "invoice", invoice.name)
@@ -0,0 +1,239 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+"""Diff based reconciliation of Virtual Machines against one bulk cloud provider response.
+
+Each instance in the response is reduced to a snapshot of the fields `VirtualMachine.sync`
+would set from it. Machines whose snapshot matches their row are left alone, changes with no
+side effects are written in bulk and only the rest go through the full `sync`.
+"""
+
+from __future__ import annotations
+
+import time
+import zlib
+from typing import TYPE_CHECKING, Any
+
+import frappe
+from frappe.utils import flt
+
+from press.utils import log_error
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+
+# Changes to these only need the row updated, anything else in a snapshot (status, IPs, shape
+# and volumes) updates the linked server, DNS records or billing, so it goes through `sync`
+PLAIN_FIELDS = ("public_dns_name", "private_dns_name", "platform", "termination_protection")
+# A snapshot only covers what the bulk response includes, OCI IPs and AWS volume sizes take a call
+# per machine. Every machine still gets a full sync once in this many runs of the 15 minute job.
+FULL_SYNC_ROTATION = 24
+SYNC_INTERVAL = 15 * 60
+SYNC_STATS_KEY = "virtual_machine_sync_stats"
+
+
+def get_snapshots(
+	instances: dict[str, Any], snapshot: Callable[[Any], dict[str, Any]]
+) -> tuple[dict[str, dict[str, Any]], list[str]]:
+	"""Snapshots of `instances` by instance id, and the ids whose snapshot couldn't be built.
+
+	An instance the snapshot doesn't understand, say in a state missing from the status map,
+	is left to the full sync instead of failing the whole cluster.
+	"""
+	snapshots, unreadable = {}, []
+	for instance_id, instance in instances.items():
+		try:
+			snapshots[instance_id] = snapshot(instance)
+		except Exception:
+			log_error("Virtual Machine Sync Snapshot Error", instance_id=instance_id)
+			unreadable.append(instance_id)
+	return snapshots, unreadable
+
+
+def reconcile(
+	provider: str, cluster: str, snapshots: dict[str, dict[str, Any]], unreadable: list[str] | None = None
+) -> frappe._dict:
+	"""Applies plain changes from `snapshots`, keyed by instance id, in one bulk update.
+
+	Returns counts and the (name, instance id) of machines that need the full sync, which
+	includes machines of the `unreadable` instance ids.
+	"""
+	unreadable = unreadable or []
+	result = frappe._dict(machines=0, unchanged=0, updated=0, full_sync=[], unreadable=len(unreadable))
+	if not snapshots and not unreadable:
+		return result
+
+	fields = {field for snapshot in snapshots.values() for field in snapshot if field != "volumes"}
+	machines = frappe.get_all(
+		"Virtual Machine",
+		filters={
+			"status": ("not in", ("Terminated", "Draft")),
+			"cloud_provider": provider,
+			"cluster": cluster,
+			"instance_id": ("in", [*snapshots, *unreadable]),
+		},
+		fields=["name", "instance_id", *sorted(fields)],
+	)
+	volumes = get_volumes([machine.name for machine in machines]) if machines else {}
+
+	result.machines = len(machines)
+	updates = {}
+	for machine in machines:
+		snapshot = snapshots.get(machine.instance_id)
+		if snapshot is None:
+			result.full_sync.append((machine.name, machine.instance_id))
+			continue
+
+		changes = {
+			field: value
+			for field, value in snapshot.items()
+			if field != "volumes" and differs(machine[field], value)
+		}
+		volumes_changed = "volumes" in snapshot and volumes_differ(
+			volumes.get(machine.name, {}), snapshot["volumes"]
+		)
+
+		if volumes_changed or set(changes) - set(PLAIN_FIELDS) or is_due_for_full_sync(machine.name):
+			result.full_sync.append((machine.name, machine.instance_id))
+		elif changes:
+			updates[machine.name] = changes
+		else:
+			result.unchanged += 1
+
+	if updates:
+		frappe.db.bulk_update("Virtual Machine", updates)
+		frappe.db.commit()
+	result.updated = len(updates)
+	return result
+
+
+def get_volumes(machines: list[str]) -> dict[str, dict[str, frappe._dict]]:
+	volumes = {}
+	for volume in frappe.get_all(
+		"Virtual Machine Volume",
+		filters={"parenttype": "Virtual Machine", "parent": ("in", machines)},
+		fields=["parent", "volume_id", "device", "size"],
+	):
+		volumes.setdefault(volume.parent, {})[volume.volume_id] = volume
+	return volumes
+
+
+def differs(current: Any, value: Any) -> bool:
+	if isinstance(value, bool | int | float):
+		return flt(current) != flt(value)
+	return (current or "") != (value or "")
+
+
+def volumes_differ(current: dict[str, frappe._dict], volumes: dict[str, dict] | None) -> bool:
+	"""Compares the attached volumes and whichever of their fields the provider reported."""
+	if volumes is None or set(current) != set(volumes):
+		return True
+	return any(
+		differs(current[volume_id][field], value)
+		for volume_id, volume in volumes.items()
+		for field, value in volume.items()
+	)
+
+
+def is_due_for_full_sync(machine: str) -> bool:
+	"""Spreads the full syncs of a cluster evenly over the rotation."""
+	run = int(time.time()) // SYNC_INTERVAL
+	return zlib.crc32(machine.encode()) % FULL_SYNC_ROTATION == run % FULL_SYNC_ROTATION
+
+
+def aws_snapshot(instance: dict, status_map: dict[str, str]) -> dict[str, Any]:
+	"""The fields `VirtualMachine._sync_aws` sets from a describe_instances entry, without the
+	volume sizes, termination protection and instance type details it fetches separately."""
+	snapshot = {
+		"status": status_map[instance["State"]["Name"]],
+		"machine_type": instance.get("InstanceType"),
+		"public_ip_address": instance.get("PublicIpAddress"),
+		"private_ip_address": instance.get("PrivateIpAddress"),
+		"is_static_ip": has_static_ip(instance),
+		"public_dns_name": instance.get("PublicDnsName"),
+		"private_dns_name": instance.get("PrivateDnsName"),
+		"platform": instance.get("Architecture", "x86_64"),
+		"volumes": {
+			mapping["Ebs"]["VolumeId"]: {"device": mapping["DeviceName"]}
+			for mapping in instance.get("BlockDeviceMappings", [])
+			if "Ebs" in mapping
+		},
+	}
+	if instance.get("NetworkInterfaces"):
+		snapshot["secondary_private_ip"] = next(
+			(
+				address["PrivateIpAddress"]
+				for address in instance["NetworkInterfaces"][0]["PrivateIpAddresses"]
+				if not address["Primary"]
+			),
+			None,
+		)
+	return snapshot
+
+
+def has_static_ip(instance: dict) -> bool:
+	try:
+		ip_owner_id = instance["NetworkInterfaces"][0]["Association"]["IpOwnerId"]
+		return ip_owner_id.lower() != "amazon"
+	except (KeyError, IndexError):
+		return False
+
+
+def hetzner_snapshot(server, volumes: dict, status_map: dict[str, str], root_disk_id: str) -> dict[str, Any]:
+	"""The fields `VirtualMachine._sync_hetzner` sets from a server, with its volumes looked up
+	in `volumes` (by id, from one volumes listing) instead of fetching each one."""
+	public_ip_address = ""
+	if server.public_net and server.public_net.primary_ipv4:
+		public_ip_address = server.public_net.primary_ipv4.ip
+
+	attached = {root_disk_id: {"device": "/dev/sda", "size": server.primary_disk_size}}
+	for volume in server.volumes:
+		if volume.id not in volumes:
+			# Attached after the volumes were listed
+			attached = None
+			break
+		listed = volumes[volume.id]
+		attached[str(volume.id)] = {"device": listed.linux_device, "size": listed.size}
+
+	return {
+		"status": status_map[server.status],
+		"machine_type": server.server_type.name,
+		"vcpu": server.server_type.cores,
+		"ram": server.server_type.memory * 1024,
+		"private_ip_address": server.private_net[0].ip if server.private_net else "",
+		"public_ip_address": public_ip_address,
+		"termination_protection": bool(server.protection.get("delete", False)),
+		"volumes": attached,
+	}
+
+
+def oci_snapshot(instance, status_map: dict[str, str]) -> dict[str, Any]:
+	"""The fields `VirtualMachine._sync_oci` sets from a list_instances entry. IPs and volumes
+	take calls per machine, so drift there is picked up by the rotating full sync."""
+	if instance.lifecycle_state == "TERMINATED":
+		return {"status": "Terminated"}
+
+	vcpu, memory = instance.shape_config.vcpus, instance.shape_config.memory_in_gbs
+	return {
+		"status": status_map[instance.lifecycle_state],
+		"ram": memory * 1024,
+		"vcpu": vcpu,
+		"machine_type": f"{int(vcpu)}x{int(memory)}",
+	}
+
+
+def record_sync_stats(provider: str, key: str, result: frappe._dict, start: float, **counts) -> dict:
+	stats = {
+		"duration": time.monotonic() - start,
+		"machines": result.machines,
+		"unchanged": result.unchanged,
+		"updated": result.updated,
+		"full_syncs": len(result.full_sync),
+		"unreadable": result.unreadable,
+		**counts,
+	}
+	frappe.cache.hset(SYNC_STATS_KEY, f"{provider}:{key}", stats)
+	return stats
+
+
+def get_sync_stats(provider: str, key: str) -> dict | None:
+	return frappe.cache.hget(SYNC_STATS_KEY, f"{provider}:{key}")
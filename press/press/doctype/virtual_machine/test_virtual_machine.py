@@ -11,6 +11,7 @@ from frappe.tests.utils import FrappeTestCase
 
 from press.press.doctype.cluster.test_cluster import create_test_cluster
 from press.press.doctype.root_domain.test_root_domain import create_test_root_domain
+from press.press.doctype.virtual_machine.cloud_sync import get_snapshots, reconcile
 from press.press.doctype.virtual_machine.virtual_machine import VirtualMachine
 
 if TYPE_CHECKING:
@@ -121,3 +122,46 @@ class TestVirtualMachine(FrappeTestCase):
 				ip = vm_doc.get_private_ip()
 				self.assertTrue(ip not in allocated_ips)
 				allocated_ips.add(ip)
+
+	@patch("press.press.doctype.virtual_machine.cloud_sync.is_due_for_full_sync", new=lambda _: False)
+	def test_bulk_sync_only_fully_syncs_machines_with_side_effects(self):
+		vm = create_test_virtual_machine()
+		vm.reload()
+		snapshot = {
+			"status": vm.status,
+			"machine_type": vm.machine_type,
+			"public_ip_address": vm.public_ip_address,
+			"private_ip_address": vm.private_ip_address,
+			"platform": vm.platform,
+			"volumes": {volume.volume_id: {"device": volume.device} for volume in vm.volumes},
+		}
+
+		result = reconcile(vm.cloud_provider, vm.cluster, {vm.instance_id: snapshot})
+		self.assertEqual((result.unchanged, result.updated, result.full_sync), (1, 0, []))
+
+		dns_name = "vm.aws.internal"
+		result = reconcile(
+			vm.cloud_provider, vm.cluster, {vm.instance_id: {**snapshot, "public_dns_name": dns_name}}
+		)
+		self.assertEqual((result.updated, result.full_sync), (1, []))
+		self.assertEqual(frappe.db.get_value("Virtual Machine", vm.name, "public_dns_name"), dns_name)
+
+		result = reconcile(
+			vm.cloud_provider, vm.cluster, {vm.instance_id: {**snapshot, "public_ip_address": "1.2.3.4"}}
+		)
+		self.assertEqual(result.full_sync, [(vm.name, vm.instance_id)])
+
+	@patch("press.press.doctype.virtual_machine.cloud_sync.log_error")
+	def test_bulk_sync_fully_syncs_machines_whose_snapshot_fails(self, log_error):
+		vm = create_test_virtual_machine()
+		status_map = {"running": "Running"}
+		# The second instance has no machine here, its snapshot still has to be built
+		instances = {vm.instance_id: "stopping", "i-0987654321": "running"}
+
+		snapshots, unreadable = get_snapshots(instances, lambda state: {"status": status_map[state]})
+
+		log_error.assert_called_once()
+		self.assertEqual((list(snapshots), unreadable), (["i-0987654321"], [vm.instance_id]))
+		result = reconcile(vm.cloud_provider, vm.cluster, snapshots, unreadable)
+		self.assertEqual(result.full_sync, [(vm.name, vm.instance_id)])
+		self.assertEqual(result.unreadable, 1)
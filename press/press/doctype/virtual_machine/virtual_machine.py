@@ -7,6 +7,7 @@ import ipaddress
 import time
 import typing
 from contextlib import suppress
+from functools import partial
 
 import boto3
 import botocore
@@ -45,6 +46,15 @@ from oci.exceptions import TransientServiceError
 from press.frappe_compute_client.client import Client as FrappeComputeClient
 from press.overrides import get_permission_query_conditions_for_doctype
 from press.press.doctype.server_activity.server_activity import log_server_activity
+from press.press.doctype.virtual_machine.cloud_sync import (
+	aws_snapshot,
+	get_snapshots,
+	has_static_ip,
+	hetzner_snapshot,
+	oci_snapshot,
+	reconcile,
+	record_sync_stats,
+)
 from press.runner import Ansible
 from press.utils import log_error
 from press.utils.jobs import has_job_timeout_exceeded
@@ -1469,13 +1479,6 @@ class VirtualMachine(Document):
 		self.update_servers()
 
 	def _sync_aws(self, response=None):  # noqa: C901
-		def _has_static_ip(instance) -> bool:
-			try:
-				ip_owner_id = instance["NetworkInterfaces"][0]["Association"]["IpOwnerId"]
-				return ip_owner_id.lower() != "amazon"
-			except (KeyError, IndexError):
-				return False
-
 		if not response:
 			try:
 				response = self.client().describe_instances(InstanceIds=[self.instance_id])
@@ -1490,7 +1493,7 @@ class VirtualMachine(Document):
 
 			self.public_ip_address = instance.get("PublicIpAddress")
 			self.private_ip_address = instance.get("PrivateIpAddress")
-			self.is_static_ip = _has_static_ip(instance)
+			self.is_static_ip = has_static_ip(instance)
 
 			if instance.get("NetworkInterfaces"):
 				self.secondary_private_ip = next(
@@ -2821,23 +2824,36 @@ class VirtualMachine(Document):
 				)
 
 	def bulk_sync_aws_cluster(self, start, end):
+		sync_start = time.monotonic()
 		client = self.client()
 		machines = self.__class__._get_active_machines_within_chunk_range(
 			self.cloud_provider, self.cluster, start, end
 		)
 		instance_ids = [machine.instance_id for machine in machines]
 		response = client.describe_instances(Filters=[{"Name": "instance-id", "Values": instance_ids}])
-		for reservation in response["Reservations"]:
-			for instance in reservation["Instances"]:
-				machine: VirtualMachine = frappe.get_doc(
-					"Virtual Machine", {"instance_id": instance["InstanceId"]}
-				)
-				try:
-					machine.sync({"Reservations": [{"Instances": [instance]}]})
-					frappe.db.commit()  # release lock
-				except Exception:
-					log_error("Virtual Machine Sync Error", virtual_machine=machine.name)
-					frappe.db.rollback()
+		instances = {
+			instance["InstanceId"]: instance
+			for reservation in response["Reservations"]
+			for instance in reservation["Instances"]
+		}
+
+		status_map = self.get_aws_status_map()
+		snapshots, unreadable = get_snapshots(instances, partial(aws_snapshot, status_map=status_map))
+		result = reconcile(self.cloud_provider, self.cluster, snapshots, unreadable)
+		failed = 0
+		for name, instance_id in result.full_sync:
+			machine: VirtualMachine = frappe.get_doc("Virtual Machine", name)
+			try:
+				machine.sync({"Reservations": [{"Instances": [instances[instance_id]]}]})
+				frappe.db.commit()  # release lock
+			except Exception:
+				log_error("Virtual Machine Sync Error", virtual_machine=machine.name)
+				frappe.db.rollback()
+				failed += 1
+
+		record_sync_stats(
+			self.cloud_provider, f"{self.cluster}:{start}-{end}", result, sync_start, failed=failed
+		)
 
 	@classmethod
 	def _get_active_machines_within_chunk_range(cls, provider, cluster, start, end):
@@ -2882,6 +2898,7 @@ class VirtualMachine(Document):
 			)
 
 	def bulk_sync_oci_cluster(self, cluster_name: str):
+		sync_start = time.monotonic()
 		cluster: Cluster = frappe.get_doc("Cluster", cluster_name)
 		client: "ComputeClient" = self.client()
 
@@ -2902,7 +2919,12 @@ class VirtualMachine(Document):
 			)
 			instance_ids = set(instance_ids)
 			# filter out non-existing instances
-			response = [instance for instance in response if instance.id in instance_ids]
+			response = {instance.id: instance for instance in response if instance.id in instance_ids}
+
+			status_map = self.get_oci_status_map()
+			snapshots, unreadable = get_snapshots(response, partial(oci_snapshot, status_map=status_map))
+			result = reconcile("OCI", cluster.name, snapshots, unreadable)
+			response = [response[instance_id] for _, instance_id in result.full_sync]
 
 			# Split into batches
 			BATCH_SIZE = 15
@@ -2917,6 +2939,8 @@ class VirtualMachine(Document):
 					enqueue_after_commit=True,
 					instances=response[i : i + BATCH_SIZE],
 				)
+			# Full syncs run in the batch jobs, so aren't part of the duration
+			record_sync_stats("OCI", cluster.name, result, sync_start)
 		except Exception:
 			log_error("Virtual Machine OCI Bulk Sync Error", cluster=cluster.name)
 			frappe.db.rollback()
@@ -2966,6 +2990,7 @@ class VirtualMachine(Document):
 			)
 
 	def bulk_sync_hetzner_cluster(self, cluster_name: str):
+		sync_start = time.monotonic()
 		cluster: Cluster = frappe.get_doc("Cluster", cluster_name)
 		client: HetznerClient = self.client()
 		try:
@@ -2982,16 +3007,32 @@ class VirtualMachine(Document):
 			)
 			instance_ids = set(instance_ids)
 			# filter out non-existing instances
-			servers = [server for server in servers if str(server.id) in instance_ids]
-
-			for server in servers:
-				machine: VirtualMachine = frappe.get_doc("Virtual Machine", {"instance_id": str(server.id)})
+			servers = {str(server.id): server for server in servers if str(server.id) in instance_ids}
+			volumes = {volume.id: volume for volume in client.volumes.get_all()}
+
+			status_map = self.get_hetzner_status_map()
+			snapshots, unreadable = get_snapshots(
+				servers,
+				partial(
+					hetzner_snapshot,
+					volumes=volumes,
+					status_map=status_map,
+					root_disk_id=HETZNER_ROOT_DISK_ID,
+				),
+			)
+			result = reconcile("Hetzner", cluster.name, snapshots, unreadable)
+			failed = 0
+			for name, instance_id in result.full_sync:
+				machine: VirtualMachine = frappe.get_doc("Virtual Machine", name)
 				try:
-					machine.sync(server_instance=server)
+					machine.sync(server_instance=servers[instance_id])
 					frappe.db.commit()  # release lock
 				except Exception:
 					log_error("Virtual Machine Sync Error", virtual_machine=machine.name)
 					frappe.db.rollback()
+					failed += 1
+
+			record_sync_stats("Hetzner", cluster.name, result, sync_start, failed=failed)
 		except Exception:
 			log_error("Virtual Machine Hetzner Bulk Sync Error", cluster=cluster.name)
 			frappe.db.rollback()
@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import re
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 
 import frappe
 import requests
@@ -142,15 +145,138 @@ def get_slow_query_logs(database, start_datetime, end_datetime, search_pattern,
 	return out
 
 
-def normalize_query(query: str) -> str:
-	q = sqlparse.parse(query)[0]
-	for token in q.flatten():
-		token_type = str(token.ttype)
-		if "Token.Literal" in token_type or token_type == "Token.Keyword.Order":
-			token.value = "?"
+# Literals, comments and spacing are normalized in one regex pass, sqlparse formats each distinct fingerprint once
+FINGERPRINT_TOKEN = re.compile(
+	r"""
+	(?P<comment>/\*.*?\*/|--[^\n]*|\#[^\n]*)
+	|(?P<string>'(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*")
+	|(?P<identifier>`(?:[^`]|``)*`)
+	|(?P<number>(?<![\w$.])-?(?:0x[0-9a-f]+|\d+(?:\.\d*)?(?:e[+-]?\d+)?|\.\d+(?:e[+-]?\d+)?)(?![\w$]))
+	|(?P<word>[a-z_$][\w$]*)
+	|(?P<space>\s+)
+	""",
+	re.IGNORECASE | re.VERBOSE | re.DOTALL,
+)
+FINGERPRINT_SPACING = [
+	(re.compile(r"\s+"), " "),
+	(re.compile(r"\s*,\s*"), ", "),
+	(re.compile(r"\(\s*"), "("),
+	(re.compile(r"\s*\)"), ")"),
+	(re.compile(r"\s*(<=>|<=|>=|!=|<>|=|<|>)\s*"), r" \1 "),
+	(re.compile(r"\bIN\s*\(\?(?:, \?)*\)"), "IN (?)"),
+]
+FINGERPRINT_KEYWORDS = frozenset(
+	{
+		"SELECT",
+		"DISTINCT",
+		"FROM",
+		"WHERE",
+		"AND",
+		"OR",
+		"NOT",
+		"IN",
+		"IS",
+		"NULL",
+		"LIKE",
+		"BETWEEN",
+		"EXISTS",
+		"AS",
+		"ON",
+		"USING",
+		"JOIN",
+		"INNER",
+		"LEFT",
+		"RIGHT",
+		"OUTER",
+		"CROSS",
+		"STRAIGHT_JOIN",
+		"GROUP",
+		"BY",
+		"HAVING",
+		"ORDER",
+		"LIMIT",
+		"OFFSET",
+		"UNION",
+		"ALL",
+		"INSERT",
+		"INTO",
+		"VALUES",
+		"VALUE",
+		"REPLACE",
+		"UPDATE",
+		"SET",
+		"DELETE",
+		"IGNORE",
+		"DUPLICATE",
+		"KEY",
+		"FOR",
+		"SHARE",
+		"LOCK",
+		"MODE",
+		"CASE",
+		"WHEN",
+		"THEN",
+		"ELSE",
+		"END",
+		"FORCE",
+		"USE",
+		"INDEX",
+		"SQL_NO_CACHE",
+		"SQL_CALC_FOUND_ROWS",
+		"HIGH_PRIORITY",
+		"LOW_PRIORITY",
+	}
+)
+# Old sqlparse normalization replaced sort directions too, kept so summaries group the same way
+ORDER_KEYWORDS = frozenset(("ASC", "DESC"))
+FINGERPRINT_CACHE_SIZE = 4096
+_fingerprint_cache: OrderedDict[bytes, str] = OrderedDict()
+# Reports run on gunicorn threads, the cache is shared between them
+_fingerprint_cache_lock = threading.Lock()
 
+
+def normalize_query(query: str) -> str:
+	return format_fingerprint(fingerprint_query(query))
+
+
+def fingerprint_query(query: str) -> str:
+	"""Query with literals replaced by `?`, IN lists collapsed, comments dropped and spacing normalized."""
+	key = hashlib.blake2b(query.encode(), digest_size=16).digest()
+	with _fingerprint_cache_lock:
+		if (fingerprint := _fingerprint_cache.get(key)) is not None:
+			_fingerprint_cache.move_to_end(key)
+			return fingerprint
+
+	fingerprint = FINGERPRINT_TOKEN.sub(_replace_fingerprint_token, query).strip()
+	for pattern, replacement in FINGERPRINT_SPACING:
+		fingerprint = pattern.sub(replacement, fingerprint)
+
+	with _fingerprint_cache_lock:
+		_fingerprint_cache[key] = fingerprint
+		if len(_fingerprint_cache) > FINGERPRINT_CACHE_SIZE:
+			_fingerprint_cache.popitem(last=False)
+	return fingerprint
+
+
+def _replace_fingerprint_token(match: re.Match) -> str:
+	kind = match.lastgroup
+	if kind in ("string", "number"):
+		return "?"
+	if kind in ("comment", "space"):
+		return " "
+	if kind == "word":
+		word = match.group().upper()
+		if word in ORDER_KEYWORDS:
+			return "?"
+		if word in FINGERPRINT_KEYWORDS:
+			return word
+	return match.group()
+
+
+@functools.lru_cache(maxsize=1024)
+def format_fingerprint(fingerprint: str) -> str:
 	# Format query consistently so identical queries can be matched
-	q = format_query(q, strip_comments=True)
+	q = format_query(fingerprint, strip_comments=True)
 
 	# Transform IN parts like this: IN (?, ?, ?) -> IN (?)
 	return re.sub(r" IN \(\?[\s\n\?\,]*\)", " IN (?)", q, flags=re.IGNORECASE)
@@ -0,0 +1,92 @@
+# Copyright (c) 2026, Frappe and Contributors
+# See license.txt
+
+import os
+import re
+import time
+import unittest
+from collections import defaultdict
+
+import sqlparse
+from frappe.tests.utils import FrappeTestCase
+
+from press.press.report.mariadb_slow_queries.mariadb_slow_queries import (
+	_fingerprint_cache,
+	fingerprint_query,
+	format_fingerprint,
+	normalize_query,
+	summarize_by_query,
+)
+
+# Slow log queries shaped like the ones Frappe sites produce, literals vary between rows
+SLOW_QUERIES = os.path.join(os.path.dirname(__file__), "test_slow_queries.sql")
+
+
+def sqlparse_normalize(query: str) -> str:
+	"""Normalization before fingerprinting, parses every row with sqlparse"""
+	q = sqlparse.parse(query)[0]
+	for token in q.flatten():
+		token_type = str(token.ttype)
+		if "Token.Literal" in token_type or token_type == "Token.Keyword.Order":
+			token.value = "?"
+	q = sqlparse.format(str(q).strip(), keyword_case="upper", reindent=True, strip_comments=True)
+	return re.sub(r" IN \(\?[\s\n\?\,]*\)", " IN (?)", q, flags=re.IGNORECASE)
+
+
+class TestMariaDBSlowQueries(FrappeTestCase):
+	def setUp(self):
+		with open(SLOW_QUERIES) as f:
+			self.queries = f.read().splitlines()
+
+	def test_fingerprint_replaces_literals_and_collapses_in_lists(self):
+		self.assertEqual(
+			fingerprint_query(
+				"select `name` from `tabItem`  where `item_group` in ('A', 'B',\n'C') and qty>-1.5 /* hint */"
+				" and `name` = 'it''s' order by modified desc limit 20"
+			),
+			"SELECT `name` FROM `tabItem` WHERE `item_group` IN (?) AND qty > ? AND `name` = ? ORDER BY modified ? LIMIT ?",
+		)
+		# Identifiers that look like literals are kept
+		self.assertEqual(fingerprint_query("SELECT t0.name FROM `tab1` t0"), "SELECT t0.name FROM `tab1` t0")
+
+	def test_sample_slow_log_groups_like_sqlparse_normalization(self):
+		expected = group_queries(self.queries, sqlparse_normalize)
+		self.assertEqual(group_queries(self.queries, normalize_query), expected)
+
+		rows = [
+			{"query": query, "duration": 1.0, "rows_examined": 10, "rows_sent": 1} for query in self.queries
+		]
+		summaries = summarize_by_query(rows)
+		self.assertEqual(
+			sorted(summary["count"] for summary in summaries), sorted(len(group) for group in expected)
+		)
+
+	@unittest.skipUnless(
+		os.environ.get("PRESS_RUN_BENCHMARKS"), "set PRESS_RUN_BENCHMARKS=1 to run benchmarks"
+	)
+	def test_fingerprint_speed_against_sqlparse(self):
+		start = time.perf_counter()
+		for query in self.queries:
+			sqlparse_normalize(query)
+		parsed = time.perf_counter() - start
+
+		# Cold caches, as for the first report of a sample
+		_fingerprint_cache.clear()
+		format_fingerprint.cache_clear()
+		start = time.perf_counter()
+		for query in self.queries:
+			normalize_query(query)
+		fingerprinted = time.perf_counter() - start
+
+		print(
+			f"Normalized {len(self.queries)} slow log queries: sqlparse {parsed * 1000:.1f}ms,"
+			f" fingerprint {fingerprinted * 1000:.1f}ms"
+		)
+
+
+def group_queries(queries: list[str], normalize) -> set[frozenset[int]]:
+	"""Positions of the queries that share a normalized form, independent of how that form looks"""
+	groups = defaultdict(set)
+	for position, query in enumerate(queries):
+		groups[normalize(query)].add(position)
+	return {frozenset(group) for group in groups.values()}
@@ -0,0 +1,400 @@
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '1818e8' AND `warehouse` = 'Stores - 1818e8' AND (`posting_date` < '2026-09-1' OR (`posting_date` = '2026-09-1' AND `posting_time` <= '11:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-02'
+UPDATE `tabVersion` SET `modified` = '2026-10-12 10:350:00.2961', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'd0eda8'
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('a38fd547', '301850c5', '5f557203', '18f135d2', '8c38fb29', 'b64ce422', '1012f037', '907a70c3', 'f4205b4', '9e7769b1', '34b9b5df', '7f150524', 'ae2eb154', '881ed162', '6d76b07e', 'c6f87718', '506bf2ef', '7731af10', '95e761d1') and `qty` > -154.5 group by `parent` having sum(`amount`) >= 4070
+UPDATE `tabVersion` SET `modified` = '2026-10-15 10:176:00.7353', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'e00902'
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('1e398f10', '830e07bc', '6b0a18e8') and `qty` > -176.5 group by `parent` having sum(`amount`) >= 2490
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('c3baea', '2026-10-17 06:00:00', '2026-10-17 06:00:00', 'Sync Error', 'Traceback: c3baea')
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '48db40' AND `warehouse` = 'Stores - 48db40' AND (`posting_date` < '2026-09-6' OR (`posting_date` = '2026-09-6' AND `posting_time` <= '16:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = '14a0f9' order by `tabSales Invoice`.`modified` desc limit 86 offset 7359
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-04'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-03-01' and '2026-03-28' and `company` = '3bbbe9' and `is_cancelled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('10c4759', '254b0c4e', '6b4013ef', '88daf401', '5e8766ed', '9c1caaf7', '90fbbd11', '519088f5', 'f3fe39c0', '20203626')
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-01'
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('9118bb16') AND `disabled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('353c631c', '9d33a01c', '6050914a', '2607679d', 'a268aa87', '4093f6de', 'f4998d7c', '58ee8571', '9a2ef80f', '5d39d0a8', '7961fd92', '1f7296ab', '1d87cec3', 'd953ee26', '7cf20724', 'fe3bfada', 'fa529ba3', '774b15d7', '7afb2c68', '7bdc968b', '4fd58dbe', '15fc899e', '24e4e25a', '1a28f7b3', 'bfeaa155', '57b6fb7e', 'bd87a865', '43c71b9a') AND `disabled` = 0
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = 'c215a8' order by `tabSales Invoice`.`modified` desc limit 271 offset 4883
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('5de00997', 'e883a1d4', '2ac34446', '5b0ee76f', 'c59db916', '3908f227', '8857f9a4', '8aa4248c', 'c7702420', '80b0c08b', '5464ecc2', 'a2eddbbd', '39194242', '9cfc8652', 'cfbf3360', 'c9d488b1', 'fc241d0b')
+UPDATE `tabVersion` SET `modified` = '2026-10-12 10:179:00.5974', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'fcf00f'
+UPDATE `tabVersion` SET `modified` = '2026-10-11 10:320:00.9998', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '7b8f2a'
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'b98c67@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 82
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = '9c9011' order by `tabSales Invoice`.`modified` desc limit 424 offset 9762
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'a65114' AND `warehouse` = 'Stores - a65114' AND (`posting_date` < '2026-09-3' OR (`posting_date` = '2026-09-3' AND `posting_time` <= '13:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('6bae4b', '2026-10-17 03:00:00', '2026-10-17 03:00:00', 'Sync Error', 'Traceback: 6bae4b')
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-03'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-01-01' and '2026-01-28' and `company` = '3f9d52' and `is_cancelled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('73c1cd2c', '8fcd7f40', '72235c2', 'c28ee907', 'e4ddf9b9', 'e998d0ee', '1038f0b5', '7178ba0a', '535b6a43', '9ccea098', 'f92e2339', '816bee06', '9b2bd6c0', '831d03bf', '330c16a3', 'b156d1ad', '46f5a1b4') AND `disabled` = 0
+UPDATE `tabVersion` SET `modified` = '2026-10-12 10:343:00.4960', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '3672d6'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-06-01' and '2026-06-28' and `company` = 'fe7b8a' and `is_cancelled` = 0
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('756b72', '2026-10-17 07:00:00', '2026-10-17 07:00:00', 'Sync Error', 'Traceback: 756b72')
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '453bf4' AND `warehouse` = 'Stores - 453bf4' AND (`posting_date` < '2026-09-7' OR (`posting_date` = '2026-09-7' AND `posting_time` <= '17:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('263cfa5e', '895e8b6b', 'eb4ed2e3', '83c8cb28', '9212824c', '7e9ee51d', 'b34e8ece', '53b97377', '16e6fec3', '4770a087', 'eba0ea8', 'ccb1c51d', 'b02e3d8d')
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = 'b0f87' order by `tabSales Invoice`.`modified` desc limit 270 offset 3906
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-03-01' and '2026-03-28' and `company` = '4a3adf' and `is_cancelled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('cdbde747', '4a65651', 'fe977c56', '401d68fb', '9758340', '3edb920', '4b8157d', 'bbab27f6', '81728a07', '8d118e37', 'fa619774', '30803889')
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('fb5c9d', '2026-10-17 01:00:00', '2026-10-17 01:00:00', 'Sync Error', 'Traceback: fb5c9d')
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('bdaaea00', 'e13e213e', '416e99b0', '6e4505f5', '29ca862d', 'e2ec40a', '15a0cce6', 'aa4c5c60', 'd75d6769', '618177ff', 'dedb9109', '8185797c', 'aba8b9b3', 'f88ede10', '482cc78e', '99498ac4', '3e01aaa6', 'b153d69c', '4b05e1ae', 'b94af3a', '759eb559') AND `disabled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('f637a468', '54348156', 'f8fdd208', 'fc2325a9', '8c0d0033', '52d31e1b', '3e940bb4', '8d18011', 'f735efe6', 'e1e437b7', '4f3e885e', '37c60e98')
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('4767e1fa', '80b5244a', 'a7f0c99e', '33736dcc', '3f88af59', '81365acc', 'c6b789ef', '144702b', '17420e94', '43a08f06', 'd129d067', '16fa1421', '24d4589c', '66465d28', '963892a7', 'aaaaf81') AND `disabled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('f527b5c2', '8778f742', 'da6e6d8e', 'c0236e49', '27be9ab1', 'a854c834', 'e48e9e02', 'b74b589b', 'c8b6eaff', 'e10c167d', '98b81c66', '63b759f5', 'c3a9e889', '537d9128', 'b87e4e2b', 'fc173498', '7e834904', '26433798', '48bfcbcf') AND `disabled` = 0
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-02'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = 'f5a2d8' order by `tabSales Invoice`.`modified` desc limit 54 offset 6170
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-08'
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('74fa9412')
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('86a74a63', '10e8ad01', 'bee80626', 'bc9e28ea', '794ec926', '408fc146', 'cf28f65e', '130f27b2', 'd89c36b2', '43fb9fbc', '3c1ae917', 'bab5b373', 'c1a624dc', '348922d7', '3b1185d9', 'bd65680c', 'a661f62c', 'f9c9c679', '75d8d8a4', '7e736d5f', 'd874bc79', '61ef7bd1') AND `disabled` = 0
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('a48c1d5c', '32c32444', '13d5316f', '998648e0', '25bda659', '54ef125a', '41023aed', 'a6caf4a3', 'be437c7b', 'b16107f1', '4dee4812', '9f03bc5a', '9158d4a8', '222930ae', '3312ead', '7b7fec4b', 'f877ae3', '7c5d42dc', '44ce4ab3', 'f8f659ac', 'ac084ba5') and `qty` > -112.5 group by `parent` having sum(`amount`) >= 8021
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-05'
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'fe749e@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 138
+UPDATE `tabVersion` SET `modified` = '2026-10-13 10:135:00.5890', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '86292b'
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('a1b501d6', '823d11ed', '4791c2e9', 'e3096619', '1cd86fc1', 'b40de56d', '5d7cfed1', '3b3bf4bf', '7f7595b5', 'e5d00a4d', 'e04b0dce', '7c73b6c9', '64e27602', '65b8c35', '28b88073', 'eb4e11', 'f3308ce5', '7ddfcbc9', 'ae7c8f09', '736506ec', '67c98fb9', '4d4ca9c7', 'ba28a679', '24056360', '6a8ad9cb', '580dc5ab', '60487e15') and `qty` > -431.5 group by `parent` having sum(`amount`) >= 5428
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'dab079' AND `warehouse` = 'Stores - dab079' AND (`posting_date` < '2026-09-2' OR (`posting_date` = '2026-09-2' AND `posting_time` <= '12:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = '34145e' order by `tabSales Invoice`.`modified` desc limit 369 offset 1320
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('482082', '2026-10-17 05:00:00', '2026-10-17 05:00:00', 'Sync Error', 'Traceback: 482082')
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('6d6b98', '2026-10-17 04:00:00', '2026-10-17 04:00:00', 'Sync Error', 'Traceback: 6d6b98')
+UPDATE `tabVersion` SET `modified` = '2026-10-15 10:123:00.6034', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '51bcd7'
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('e322e96d', '524137f', 'bfe98f8c', 'dee0a843', '69ac0f03', '6201a9d3', '69f44612') and `qty` > -108.5 group by `parent` having sum(`amount`) >= 6174
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'd94355' AND `warehouse` = 'Stores - d94355' AND (`posting_date` < '2026-09-3' OR (`posting_date` = '2026-09-3' AND `posting_time` <= '13:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = 'daff9a' order by `tabSales Invoice`.`modified` desc limit 240 offset 7355
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('27855798', '26edf1bd', '85b9c09a', 'f8cd9ec3', 'ae9c78bd', '1be03df0', 'f1058667', 'd34d1c0d') AND `disabled` = 0
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-04'
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('2ad9d2b') and `qty` > -236.5 group by `parent` having sum(`amount`) >= 4564
+UPDATE `tabVersion` SET `modified` = '2026-10-14 10:42:00.4214', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '6b8629'
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('c2ae35', '2026-10-17 02:00:00', '2026-10-17 02:00:00', 'Sync Error', 'Traceback: c2ae35')
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('9c2f6723', '2ff3c23c', 'e57f7691', '392bc552', '7c2c6a87', '6ac26ae0', 'e90fb651', 'aa50b96f', 'e71597a', 'f2e2054d', '9844f476', '25795c18', 'ec032e6b', '64b9cb1c', 'dea6e4e', '3683d4bc') and `qty` > -306.5 group by `parent` having sum(`amount`) >= 2325
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = 'aa1813' order by `tabSales Invoice`.`modified` desc limit 372 offset 6203
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '5b4c0d' AND `warehouse` = 'Stores - 5b4c0d' AND (`posting_date` < '2026-09-7' OR (`posting_date` = '2026-09-7' AND `posting_time` <= '17:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('b48bb075', '7934f0b8') AND `disabled` = 0
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '8ec37' AND `warehouse` = 'Stores - 8ec37' AND (`posting_date` < '2026-09-1' OR (`posting_date` = '2026-09-1' AND `posting_time` <= '11:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('bf4e302c', '10170d2b', 'e6077d79', '9b09ab55', '56cd42d2', '5cebe213', '45b669f7')
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '2ed51b' AND `warehouse` = 'Stores - 2ed51b' AND (`posting_date` < '2026-09-3' OR (`posting_date` = '2026-09-3' AND `posting_time` <= '13:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('53eab031', 'dc7a615d', '51cdf2f9', '75f5c1a0', '5ca2c132', 'c8a94814', 'c841721e', '9880e88b') and `qty` > -102.5 group by `parent` having sum(`amount`) >= 6417
+UPDATE `tabVersion` SET `modified` = '2026-10-12 10:44:00.3413', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '9fe5e3'
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('c272f5', '2026-10-17 05:00:00', '2026-10-17 05:00:00', 'Sync Error', 'Traceback: c272f5')
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('4485c04f', '5f7b07b8', '4109d8d6', 'bcf1fcb5', '42a55162', '32fe1f36', '707c5f3d', '3f5783ea', '2f8c6c08', '3ece9f2c', '3c49fdbd', '27401fa0', '4806d26f', 'e258d268', 'e8566431', '940a3537', '30312932', '538ae1c1', '10970046')
+UPDATE `tabVersion` SET `modified` = '2026-10-14 10:308:00.9555', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '3087de'
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('833e469f', 'ddba8547', '2d819d38', '72f92026', '9a60f919', '428bf773', 'c6664843', 'c71c588c', 'aa2d6c38', 'f2198825', '19f7781', '1b1466f6') AND `disabled` = 0
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = 'd19f0b' order by `tabSales Invoice`.`modified` desc limit 168 offset 6700
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-07-01' and '2026-07-28' and `company` = '65d464' and `is_cancelled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('4ebe9880', '6af7ea31', 'f4042f1e', 'd25f954', '4ff6f2c5', 'bece7145', '9107756f', 'e239d3d7', '5b7042df', '6a01260f', '6a9c2a33', '4a99e63', 'dd3f4006', 'c4440054', 'ff2282e6', 'cd5e4aa0', '5d20c6a6', 'a4fc8621', '327bcda3', '6406f458', 'ba60491e', '67ac56f8')
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('75fdf3', '2026-10-17 03:00:00', '2026-10-17 03:00:00', 'Sync Error', 'Traceback: 75fdf3')
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = 'ce74b3' order by `tabSales Invoice`.`modified` desc limit 466 offset 6499
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('ed5ec904', '5eef9b8b', 'bcbc58a3', '81247dd4', '2bf39775', '2558d6c0', '5912eb60', '4886058b', '296cb08c', '856aab1d', '2bfa1f10', 'eced8ded', '112d4095', '1bd9d912', '623c70ce', '7d920a56', 'c0e908a8', 'ce0843c2', 'caca003c', 'f78530bf') and `qty` > -65.5 group by `parent` having sum(`amount`) >= 712
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '634d19' AND `warehouse` = 'Stores - 634d19' AND (`posting_date` < '2026-09-4' OR (`posting_date` = '2026-09-4' AND `posting_time` <= '14:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('9d5ee2f9', 'd8aa7be3', '3234752b', 'd445a53e', '791397a3', '2ed6d460', '90bfd792', '37d7d190', 'aadacf0', '6655b9f0', 'f044c032', '84949aab', '280f005d') and `qty` > -64.5 group by `parent` having sum(`amount`) >= 2448
+UPDATE `tabVersion` SET `modified` = '2026-10-12 10:342:00.5311', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '9c2cd'
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('9e6fb2', '2026-10-17 04:00:00', '2026-10-17 04:00:00', 'Sync Error', 'Traceback: 9e6fb2')
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'ec1072@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 376
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('c086ee53', '81012ad6') AND `disabled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('bb69e1f0', 'b14aed54', 'd0a32611', '1c0df645', '3196cd44', '21b1aed2', 'fb52882f', 'e2bce763', '7deb30ad', '49b29bbe', 'f4e64fe6', 'cf9d5d05', 'ea81ad63', 'cb8389fb', '2a44bf93', 'afa6798a', 'c9d35f16', 'b898a70c', 'ee3ab808', '389bc3dc') AND `disabled` = 0
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '2b32ad' AND `warehouse` = 'Stores - 2b32ad' AND (`posting_date` < '2026-09-2' OR (`posting_date` = '2026-09-2' AND `posting_time` <= '12:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-09'
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-08'
+UPDATE `tabVersion` SET `modified` = '2026-10-16 10:159:00.9598', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '40ef5e'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = '85e925' order by `tabSales Invoice`.`modified` desc limit 183 offset 8750
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('250a82', '2026-10-17 07:00:00', '2026-10-17 07:00:00', 'Sync Error', 'Traceback: 250a82')
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('e5e928c')
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('84804942', 'bbc81f54', '7e2b86d1', '3f9d8024', '2a43f047', 'e74c00f4', '1a2fd3', 'b43b6dd', 'fc05531', '88122e14', '675295f', '67eee099', '2f87466e', '3cd7dcef', '28c26bb2', 'ef1f012', 'e967ebdb', 'c7642bde', '1adbe533', '329602a', '9cd5f2bb', '8d094979', 'a82409f1', 'f0e02c42', '327f82f8', '246b9480', '69c60d1b', '3313a101', '84ac8fe6', '9bab5340') and `qty` > -332.5 group by `parent` having sum(`amount`) >= 6803
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-08'
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('a7d0e597', '73d63426', '2ce678fe', '39d7c140', 'ff21dd5a', '1af3bda5', '42ecdcf9', '3b77cbb4', 'a4de7a8d', '9eff2b4', '1f8e6521', '55e4615b', 'e42a872f', 'bfe95413', 'ecd87a48', 'b1f2ad8b', 'f15ea89d', 'd867c466', '43678856', 'b630f005', 'd72cb97', '4417c530', 'a2c81c32', '8dc508c6') AND `disabled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('edb6ce85', 'f71377dc', 'e4e8d8d2', '378d04ea', '15de2868', 'e14aa460', '81e6d6c8', '3e5f684', '2b7604fe', '42a78500', 'e79a95aa', '3c71a896', 'd77b26d3', 'be6ed515', '33e92723', 'f1d7b8aa', '28c06f25', 'bf03c644', 'ea3ab6d2', '53add817', '3122c815')
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-03'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-06-01' and '2026-06-28' and `company` = '9f395e' and `is_cancelled` = 0
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-02-01' and '2026-02-28' and `company` = '10e1fe' and `is_cancelled` = 0
+UPDATE `tabVersion` SET `modified` = '2026-10-18 10:423:00.4708', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '16646a'
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('190d78d3', 'cabe5e52', 'c1e299a3', 'a5753d8b', '347a7325') AND `disabled` = 0
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = '79e08f' order by `tabSales Invoice`.`modified` desc limit 436 offset 4712
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('c5e506', '2026-10-17 08:00:00', '2026-10-17 08:00:00', 'Sync Error', 'Traceback: c5e506')
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = '11dd8' order by `tabSales Invoice`.`modified` desc limit 179 offset 8041
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'c44da1@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 42
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('539ef49c', '5b09b845', '185ba663', '66b9aaf9', 'edb27a0f', '65047845', 'e44fbd3e', 'e3f1bdf6', 'bec6b7ec', '160f6d6e', '6c10b601', 'e371613e', 'a55741cb', '671ce23', '5f381d79', '34c411c3', '4d9aa696', '4360c66a', '6d956563', 'e6b6122f', '8b80fd3a') AND `disabled` = 0
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-05-01' and '2026-05-28' and `company` = '2b67a9' and `is_cancelled` = 0
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('20454643', '55848bff', '7646cf57', 'a4880c45', 'e2979619', 'b25201e9', '3ce9a9af', '81f8d9df') and `qty` > -155.5 group by `parent` having sum(`amount`) >= 2532
+UPDATE `tabVersion` SET `modified` = '2026-10-15 10:153:00.7125', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'bbb910'
+UPDATE `tabVersion` SET `modified` = '2026-10-11 10:199:00.7600', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'e29f9e'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = 'bcfd52' order by `tabSales Invoice`.`modified` desc limit 208 offset 90
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('5021b4', '2026-10-17 07:00:00', '2026-10-17 07:00:00', 'Sync Error', 'Traceback: 5021b4')
+UPDATE `tabVersion` SET `modified` = '2026-10-11 10:500:00.1742', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'e87f44'
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('37c714cf', '292cfb34', 'b759efcf', 'c823802f', 'f38a1e14', 'f0ca5b41', '3326d90f', '84eb99bd', '59242043', '19e0d64a', 'd8df71f4', '93166586', '74efd764', '8a814a78', '3479b1f0', 'b7a0b785', '79c9cdb6', '831ef5c3')
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '5b0047' AND `warehouse` = 'Stores - 5b0047' AND (`posting_date` < '2026-09-5' OR (`posting_date` = '2026-09-5' AND `posting_time` <= '15:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('6651b3c4', 'fbeb716', '3682cec', '133f5243', '6b2838e0', 'ea59fdda', '6ba8f8ee', 'a0e99efb', 'b2c0b0bc', 'acc53466', '5a24dd36', '94865d85', '43e15c55')
+UPDATE `tabVersion` SET `modified` = '2026-10-13 10:151:00.8982', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '77d575'
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'b09f@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 413
+UPDATE `tabVersion` SET `modified` = '2026-10-19 10:483:00.2300', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'c8b6be'
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '3562ef' AND `warehouse` = 'Stores - 3562ef' AND (`posting_date` < '2026-09-9' OR (`posting_date` = '2026-09-9' AND `posting_time` <= '19:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-09-01' and '2026-09-28' and `company` = 'd6db01' and `is_cancelled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('6b46159a', '3bf2f108', 'd3b9cd98', '23abac2e', '79265fef', '7e3a46a3', '8ea4dc66', 'ef6df4f', '7bffb6a4') AND `disabled` = 0
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '77cc40@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 357
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('773c2b1a', '5ffd3d40', '6d0227c2', '6b379413', 'fffcbff7', 'f5eac4c1', 'ad0ad387', '134d2c81', '2e367dcb', 'a3151d0c', '5c418d05', 'a2d92973', 'a5826fb2', '74db5fe', '54367ba', '9c13aef3', 'bbe27a8', 'aebe1773', 'bc8df872', 'ee7653c9', 'ffbd8d4a', '5498c004', 'cf0061ca', 'fb518504', '180ecb0d', '82b85bb8', '7bf2a7f5')
+UPDATE `tabVersion` SET `modified` = '2026-10-17 10:182:00.8089', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '4afa5e'
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'f9061f' AND `warehouse` = 'Stores - f9061f' AND (`posting_date` < '2026-09-1' OR (`posting_date` = '2026-09-1' AND `posting_time` <= '11:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('9ddffe', '2026-10-17 02:00:00', '2026-10-17 02:00:00', 'Sync Error', 'Traceback: 9ddffe')
+UPDATE `tabVersion` SET `modified` = '2026-10-12 10:391:00.2849', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'a01232'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-01-01' and '2026-01-28' and `company` = '7f6d88' and `is_cancelled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('cf71e7f5', '6bcb5706', '93484239', 'b21a30cc', 'eb2b50b5', '67970ab1', '724bf80b', '11354113', '39e0d8b', 'ae120a3c', '631bcb09', '9807633c', '978b6641', 'fe3d856b', 'f00e60f8', 'a8ce4082', 'fb14b195', '27c17a26', '79b6fcb9', 'c5174a9f', '69942abd', '8c7e80c1', '1a1f80d1', '153a8e30', 'a4fe5561') AND `disabled` = 0
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('ab5b95', '2026-10-17 04:00:00', '2026-10-17 04:00:00', 'Sync Error', 'Traceback: ab5b95')
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('78eabc3a', '48d09c8', '46839f5b', 'b82763ba', '91a94fac') AND `disabled` = 0
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'e2220a' AND `warehouse` = 'Stores - e2220a' AND (`posting_date` < '2026-09-7' OR (`posting_date` = '2026-09-7' AND `posting_time` <= '17:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('babcb4aa', '99a16b9e', '2a7ec806', 'f52bc655', 'dc685e91', 'd5bd0132', '7c8005c5', '9be4078c', 'f4dad88', '50f7b168')
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-08-01' and '2026-08-28' and `company` = '29fd96' and `is_cancelled` = 0
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('99e422', '2026-10-17 07:00:00', '2026-10-17 07:00:00', 'Sync Error', 'Traceback: 99e422')
+UPDATE `tabVersion` SET `modified` = '2026-10-11 10:217:00.2576', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '449d27'
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('2402eeb0', 'cfcf0196', 'e3ff2dd0', 'de01282a', 'fe2a7b12', '926893ed', '25a1ba53', '461af27f', 'f9b1de86', 'd9e71957', 'cc19393d', 'ce99b522', '8c3fc5e6', 'af447cf2', 'c6ec6e3e', 'e9eb7933', '7ffe6c7d', '58cb5fde', '88d8c0a5', '15c6b9a6', '8a3c3502', '8dbd9a53', '7c1964bb', 'cc21a87a', '61b99161', '334f6a84', 'c9a61015')
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('3b9d22', '2026-10-17 09:00:00', '2026-10-17 09:00:00', 'Sync Error', 'Traceback: 3b9d22')
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('d554fc05', '8598853a', '522c9583', '7a018e0c', '8194455d', '96de3dda', '33adba6f', '306c3a5a', '3673174d', '313b7e29', '1799a7da', '2e41ea06', 'ce4d2a2a', 'b378f0cb', '4a30189b', '5ce22657', '93ef0704', '907e897c', '5be04057', '6709ab4c', 'c7966470', '84685b61', 'db611f75', '2625748a', '3f0dd583', 'b6a8ad2', 'ec30b3c2', 'ff44abde', '7e46da13')
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('50d7941d', '98e2e954', '7c597f7', '584cc92f', '47d1ffb9') AND `disabled` = 0
+UPDATE `tabVersion` SET `modified` = '2026-10-19 10:27:00.570', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '70b80'
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '72c6a2' AND `warehouse` = 'Stores - 72c6a2' AND (`posting_date` < '2026-09-6' OR (`posting_date` = '2026-09-6' AND `posting_time` <= '16:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+UPDATE `tabVersion` SET `modified` = '2026-10-11 10:75:00.5204', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '19dedb'
+UPDATE `tabVersion` SET `modified` = '2026-10-14 10:7:00.7666', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'e4653d'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = 'e38256' order by `tabSales Invoice`.`modified` desc limit 384 offset 2289
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('edc46fb9', '62948bfe', 'd79da6a3', '5907fd1', 'a0dce604', '133d4b63', '73cc2690', 'f8e96431', '56fbc2f1', '5293a807', 'd2b41d4f', '3bdfae68', '7a3ff311', '1d98a474', 'a0d09c62', '5db44741', '248c6fa6', '54fc94a4', '38be1ce3', 'bc6e9d5f', 'e859f16', '2e242fc8', 'b6b6a4d2', '738d7ccc', '8da9ec93', 'e3aa471c', '250bc6e7', '706067ab', 'dee7b644', '263e8db3') AND `disabled` = 0
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = '74c884' order by `tabSales Invoice`.`modified` desc limit 463 offset 7904
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-04-01' and '2026-04-28' and `company` = 'fdb38c' and `is_cancelled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('4a17fe93', '6a671ecc', 'e56d5404', '29858691', 'eb72a15', 'd51321ff', 'b9fa20fb', 'fa811b6d', '4b246aa0', '24f432ad', 'fa8792bf', 'a3ca8d60', '41a7212') AND `disabled` = 0
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-09-01' and '2026-09-28' and `company` = '2358d9' and `is_cancelled` = 0
+UPDATE `tabVersion` SET `modified` = '2026-10-17 10:34:00.8512', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '291be'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = '442995' order by `tabSales Invoice`.`modified` desc limit 128 offset 3048
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = '85131e' order by `tabSales Invoice`.`modified` desc limit 478 offset 7303
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('5b51e2c0', 'b6ef5dfc', '3ea65dd8', 'd10878d0') AND `disabled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('1b917a1d', 'f43cc03a', 'bb1f453d', '7eab71d1', '7249d149', '83688d07', '69076ac', '87cf894b', 'cdf3da53', '898e8dda', '22662de7', '54bcbcb', '3e587e62', 'f7a93fdb', '16ad95c8', '39445629', '9e7bf788', '2eb15ca2', '2afa3645', '1a48ef9f', '4fd98632', '401e0548', '8e2c1685', 'd130fbbe', 'f4921539', '7b2e68a', '4fac06e', '18b2594d')
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('93945bed', '76c4c74f', '85dd8358', '3d05a4cb', 'b3e090aa', '71b7e67c', '1a555522', '59c775be', 'de9943a6', '180a3de7', 'b793be67', '2dd11155', 'b904d54', '45e42f4d', '1f802666', '77001ae3', '7e5c0a1d', '95fdadc9', '803183c3', 'c2f268b9', '47955cd6') and `qty` > -63.5 group by `parent` having sum(`amount`) >= 6646
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-01'
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'd0a6ab' AND `warehouse` = 'Stores - d0a6ab' AND (`posting_date` < '2026-09-1' OR (`posting_date` = '2026-09-1' AND `posting_time` <= '11:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '3366a3' AND `warehouse` = 'Stores - 3366a3' AND (`posting_date` < '2026-09-4' OR (`posting_date` = '2026-09-4' AND `posting_time` <= '14:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-05-01' and '2026-05-28' and `company` = 'dd9866' and `is_cancelled` = 0
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-09'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-04-01' and '2026-04-28' and `company` = 'd6f9ac' and `is_cancelled` = 0
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('7a54c2', '2026-10-17 01:00:00', '2026-10-17 01:00:00', 'Sync Error', 'Traceback: 7a54c2')
+UPDATE `tabVersion` SET `modified` = '2026-10-16 10:488:00.3908', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'dca332'
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-08'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = '5a3a70' order by `tabSales Invoice`.`modified` desc limit 72 offset 3317
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-07'
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('69112487') AND `disabled` = 0
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('6afc289a', 'd99619cd', 'c89fa771', '4780c42f', 'df6d487a') and `qty` > -57.5 group by `parent` having sum(`amount`) >= 6218
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '1bb27@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 403
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'd256dd@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 472
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('3e1e7f97', 'f57181a7', '5368de8b', '344da10e', 'f8dce53f', '6d2ba5e2', 'e429370c', 'e91b5531', 'f4b6c7c1', '2bcbaa1', '68c1935', 'c252a09', '41ad2c8b', '909f8ff1', 'e55929b1', '7f51800b', '4cc0eedb', 'eb998e41', '89547528', 'c602e3de', '4ffaaa98', '89db1c3f', '9eb7ce5b', 'ff92655e', '6fe9b385', '84777780', 'd35f847e') and `qty` > -351.5 group by `parent` having sum(`amount`) >= 7046
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '5fd9b3@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 257
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('e13cdf92', '302ece3f', 'f6e79284', '6bd56c0d', '7c993a3a') and `qty` > -393.5 group by `parent` having sum(`amount`) >= 9624
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-05'
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-01'
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('4e868a', '2026-10-17 01:00:00', '2026-10-17 01:00:00', 'Sync Error', 'Traceback: 4e868a')
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('d797a9ee', '19371cb1', '96113b67', '3f3f20d', 'ab090579', '78f6a4c', '3257ae42', '2cd986e8', '7f73d6f2', 'c4daf940', '8da1c6a4', '9128a82e', '4419ca8e')
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('693de148', '9a0bc130', '1f1ab658', '2535ea0c', '28222210', '84b76cbd', 'c26e5270') and `qty` > -15.5 group by `parent` having sum(`amount`) >= 1640
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-05-01' and '2026-05-28' and `company` = '4683be' and `is_cancelled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('e7630c32', 'f29c7dd6', '950ee291', '10223eca', '595116e1', '31102878', '73289c32', '9fbea640', '62ba641a', '5011ece', 'dff6f5d', '38550f64', 'e3fa79a9', '655fcf16', '95295835', 'c3992a90', 'f5a92f83', 'b3e93e1', '708c5162', 'df93e22', '9ec3fd06', '3d00bdf7', '3fd40dd8', '390ff0f4', 'b42312f', '28ce935c', 'ee4a6e55', '964573f5') AND `disabled` = 0
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('caf216', '2026-10-17 02:00:00', '2026-10-17 02:00:00', 'Sync Error', 'Traceback: caf216')
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-02-01' and '2026-02-28' and `company` = '656204' and `is_cancelled` = 0
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '3cb77b' AND `warehouse` = 'Stores - 3cb77b' AND (`posting_date` < '2026-09-5' OR (`posting_date` = '2026-09-5' AND `posting_time` <= '15:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = '8e12e4' order by `tabSales Invoice`.`modified` desc limit 227 offset 7652
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-03-01' and '2026-03-28' and `company` = '34568a' and `is_cancelled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('e64d52a0', '70ba90f0', '966a93e1', 'fd6edc91', '5e34f81d', '88df8c67', '3f0a483a', '67766a7f', '9bb33b8c', '829c1172', '3669265a', '2021dc2c', 'df54fa50', 'c02cbb7c', '1f6f17a0', 'ad87e50d', '8355ce73', '176a8b51', '8ae75d3f', 'da135667')
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('4f8fdd84', '3d71035', '63d2c4cb', 'b5f0bd5f', '160684b7') and `qty` > -398.5 group by `parent` having sum(`amount`) >= 3793
+UPDATE `tabVersion` SET `modified` = '2026-10-13 10:433:00.7609', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '6743ca'
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('7922a93', '5dd84e90', 'adfbe15c', 'cca4e513', 'a9e2612e', 'b0e25386')
+UPDATE `tabVersion` SET `modified` = '2026-10-14 10:323:00.2943', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '4f9840'
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('b77555e7', '8551cc0e', '41349d66', 'ecfa3553', '6f57b993', 'ab8de210', 'af3018d7', '93453d6f', '595aa0bc', 'ef886112', '3faf7b', '1ca3a6a8', 'd59304bd', 'c3821561', 'c6c6f4d0', 'a7c98f61') and `qty` > -22.5 group by `parent` having sum(`amount`) >= 9586
+UPDATE `tabVersion` SET `modified` = '2026-10-18 10:485:00.6946', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '595a75'
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'f3c9df' AND `warehouse` = 'Stores - f3c9df' AND (`posting_date` < '2026-09-5' OR (`posting_date` = '2026-09-5' AND `posting_time` <= '15:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-08-01' and '2026-08-28' and `company` = '22f526' and `is_cancelled` = 0
+UPDATE `tabVersion` SET `modified` = '2026-10-13 10:482:00.2772', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'c2b13e'
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('d6e88d16', 'c422ff91', '67f617e5', 'd4c79ec8', '34d1bd92', '1d4e724a', 'b0ac658d', '4a12321d', '32ac419', '5c48784e', '7c9262d5', '34d8c73a', 'b1c0cc9', 'f71e85e', 'e553ef86') and `qty` > -101.5 group by `parent` having sum(`amount`) >= 1811
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '5cebfc@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 149
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('2c4b76f', '77f06139') AND `disabled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('7d26ff92', 'f4ec72b1', '6f2a6038', '7d0411cb', '30974c01', 'c8ac1ba7', '8b06c17b', '526256de', '22016af', '5bfaca0e', 'eb681073', '1749a883', 'a4fe64d5', '49358889', 'a0b3d934', '9d04e3c4', 'ef6c77bc', 'bb0b58e4', 'a7110b0e', 'b3097038', '405c8a4a') AND `disabled` = 0
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = '51f5b7' order by `tabSales Invoice`.`modified` desc limit 118 offset 6037
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-03'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-07-01' and '2026-07-28' and `company` = 'daf6c3' and `is_cancelled` = 0
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-03-01' and '2026-03-28' and `company` = 'aa85cd' and `is_cancelled` = 0
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('52dda7', '2026-10-17 07:00:00', '2026-10-17 07:00:00', 'Sync Error', 'Traceback: 52dda7')
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-04'
+UPDATE `tabVersion` SET `modified` = '2026-10-14 10:384:00.1839', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '8c5130'
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('184f9ba2', '3002a032', '87e0eecb', 'ab94c668', '40651107', 'b587728c', '7d4145ed', '3a1c07c9', '8dd45639', '7549a476', '39ff77f9', '8a8dd460', '929cedc6', 'b25c7f15', '1ceebc19', 'bc4f68f7', '83600d24', 'e8c4d036', '96a50b7f', '911ddb92', '1489dcef')
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-03'
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '1d5db2' AND `warehouse` = 'Stores - 1d5db2' AND (`posting_date` < '2026-09-3' OR (`posting_date` = '2026-09-3' AND `posting_time` <= '13:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '8c8051' AND `warehouse` = 'Stores - 8c8051' AND (`posting_date` < '2026-09-2' OR (`posting_date` = '2026-09-2' AND `posting_time` <= '12:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = '969bd7' order by `tabSales Invoice`.`modified` desc limit 449 offset 4100
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('3887155', '6568c82', '57a56e3f', 'fe968f77', '26a391d7', '7cb73161', '8074514c', '7be56be3', 'df80c7f5', '8199946', 'ccea934d', 'd64ffe41', '913d536', '13193d6a', '2eaa3de5')
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '8459f0@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 39
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-06'
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('634c305d', 'effa41eb', '5a8aec9f', '5079e1d6', '1886f43', '55e3aa7e', '9443efe9', '7bc293b4', '557291ca', '3a0392f2', '54049b7', '3fad6bbb', '759bbe56', 'e053cffd', 'fc848f79') and `qty` > -324.5 group by `parent` having sum(`amount`) >= 2389
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('45f97bce', '10406af3', '80001cf5', 'fdc9bd19', '4316dd14', '5b5974aa', '91a76acc', '92d2a63c', '8734bd6d', '959c064f', 'f4fb5de4', '239bb65b', 'fdffacba')
+UPDATE `tabVersion` SET `modified` = '2026-10-17 10:180:00.9023', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '3ec59d'
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '52bd3b' AND `warehouse` = 'Stores - 52bd3b' AND (`posting_date` < '2026-09-9' OR (`posting_date` = '2026-09-9' AND `posting_time` <= '19:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '8d200f' AND `warehouse` = 'Stores - 8d200f' AND (`posting_date` < '2026-09-2' OR (`posting_date` = '2026-09-2' AND `posting_time` <= '12:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+UPDATE `tabVersion` SET `modified` = '2026-10-15 10:461:00.2871', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '51bad8'
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('5e80be4', 'c22c8317', '2a20f08d', 'a05efda2', '449efe34', '3ca593db', 'b4533d4e', '52303a0', '37e37148', 'c35b299', '664a7421', '72aacd6d', '3349fd14', 'e49118ed', '9a57cce3', '485acab3', 'dd33cf9d', '807d93dd')
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-01-01' and '2026-01-28' and `company` = '365477' and `is_cancelled` = 0
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'c6a55e@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 254
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('df91857f', '37b4b62', '696f541', 'ecdfbd22', '511fd02e', '906b6ef7', 'a7729aa0', 'fcce6b2e', '503d63f5', 'e572a9d', '6a464913', '9d2cfac6', 'b5cbfde6', 'b960e68c', 'd5bd6fee')
+UPDATE `tabVersion` SET `modified` = '2026-10-19 10:177:00.8825', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '6c58e5'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-09-01' and '2026-09-28' and `company` = '473c3a' and `is_cancelled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('40bf113d', '2507735', '8ee1be87', '79cba469', '198be250')
+UPDATE `tabVersion` SET `modified` = '2026-10-16 10:482:00.9929', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '42553c'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-02-01' and '2026-02-28' and `company` = '1b990f' and `is_cancelled` = 0
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('5ab3af', '2026-10-17 07:00:00', '2026-10-17 07:00:00', 'Sync Error', 'Traceback: 5ab3af')
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('e121af87', 'fe8b3400', '7fa456c7', '3773b4d8', 'fb3969ad', '91cc46da', 'ca73cd73', '281f097b', '7a34ffd9', 'dcf226db')
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('54df0867', '101b029', '7c4d18cd')
+UPDATE `tabVersion` SET `modified` = '2026-10-13 10:13:00.1827', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'af6642'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = '18f8ee' order by `tabSales Invoice`.`modified` desc limit 385 offset 2764
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('b76325', '2026-10-17 01:00:00', '2026-10-17 01:00:00', 'Sync Error', 'Traceback: b76325')
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('338d81b5', 'cac7cf63', 'a099b9ad', 'b08054db', '3ee5c50', '9b21c7e', '22845588', '813953eb') and `qty` > -295.5 group by `parent` having sum(`amount`) >= 7053
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = '1086ca' order by `tabSales Invoice`.`modified` desc limit 450 offset 1807
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '8a5a2f@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 76
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('5a83bd61', 'd6ee47a8', '7f0b528b', 'f50da545', 'eb2f59d7', '13cbbcbd', '597500fe', 'f87213ce', '37133e01', 'da69ca88', 'f7ae1f2e', 'f8d98653', 'e2166948', '39557226', 'bb3cec31', '12880989', '45e18c86') AND `disabled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('324a5372', '823d8678') AND `disabled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('5361dba4')
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('54ac365e', 'b0b6b765', '690e3666', 'fb7c096b', 'fe4ba5d3', 'dfc34c1f', 'bec9ffc9', 'b7bf1af9', '44c25dc5', '66376b92', '6c05af54', '5179d507', '8a3d3a9d', '6b4d5b9d', '620ab0ff', 'f9125b64', '26b76d36', '631784f7')
+UPDATE `tabVersion` SET `modified` = '2026-10-16 10:208:00.9150', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'cacb0'
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'ca973c@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 381
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('f9d6a749', '86b8e98f', '44336a4d', '9ce15cf9', 'a8db9bd0', 'ad5d2966', 'd381bdd5', '52778ced', '126e45a3', 'a0ffa121', 'cc1cf866', '8b067af7', 'aa0bcc3c') AND `disabled` = 0
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'f28641@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 424
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('a9baa6', '2026-10-17 09:00:00', '2026-10-17 09:00:00', 'Sync Error', 'Traceback: a9baa6')
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('a9886cb4', '16872f85', '46674b28', '6542a692', '4a5e3677', 'ff38e639', '723a4135', 'b1ec8c57', '1c9ed256', '730647d5', 'a27777bc', '7a747d27', 'bb0dc7ba', 'cc5c2f3f', '2cace96d')
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '4e7964@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 368
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '33a17e' AND `warehouse` = 'Stores - 33a17e' AND (`posting_date` < '2026-09-5' OR (`posting_date` = '2026-09-5' AND `posting_time` <= '15:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('5f226b19', 'eba7323e', 'b3d0a1d', 'b7a7cc17', '7149a59d', '602f9af2', '5dff24a9', 'ab04a87', 'b668c911', 'c0cae261', '4b954893', 'f843bab8', '686db9fe', '6e53dbac', 'a5ef82fc', '9b81289e', 'cf9251e1', '41bd180c', '5a33c642', '3d16964f', '62a6c595', 'd985c91d', '9425be21', '212532de', 'ecc0cfde') and `qty` > -498.5 group by `parent` having sum(`amount`) >= 9506
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('3400447a', '5456df6d', 'dc34acbb', '121ea0e4', '1476e333', 'c18bbb5b', '720d7b54', '61208f98', '64acab7a', '869bd0f1', '6a2a93c8', '7f2128ec', 'ef8d1386', 'e6bc784d', 'a49b37b7', 'c1cd2483', 'caa88660', '68d05d8', '1b9958b3', '97c0349c', '9040d8d0', '76691b13') AND `disabled` = 0
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'c0b780@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 423
+UPDATE `tabVersion` SET `modified` = '2026-10-11 10:40:00.9355', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'd90f42'
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('16979162', 'd9209a91', 'c0d908d1', '3733eeb7', '907d6be9', '744b8963', 'e14c998', 'd2f139fc', 'ae54dd71', '332876db', 'b608029d', '55e9263c', '7b983896', 'dced67f2', 'e05f3ca', '8ce58671') AND `disabled` = 0
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('ae5a23', '2026-10-17 05:00:00', '2026-10-17 05:00:00', 'Sync Error', 'Traceback: ae5a23')
+UPDATE `tabVersion` SET `modified` = '2026-10-16 10:340:00.838', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '8e5e5c'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = '7461c3' order by `tabSales Invoice`.`modified` desc limit 208 offset 7288
+UPDATE `tabVersion` SET `modified` = '2026-10-12 10:26:00.2244', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '1fdcd5'
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('2e1f558e', '3a205ad', 'ec224e37', 'b8a5a600', '8fa1961f', 'bcb91fa1', 'ccfa8b19', '2a0417f0', '7f8b25fd', '3886b6fe', 'ac818d66', 'b86e41f0', 'acca1434', 'bfa8cb61', '4b7e1509', 'cd4b338d') and `qty` > -430.5 group by `parent` having sum(`amount`) >= 2604
+UPDATE `tabVersion` SET `modified` = '2026-10-13 10:445:00.928', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '27a363'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = 'cc15a3' order by `tabSales Invoice`.`modified` desc limit 164 offset 9184
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('420ee3c3', '530b60a7', '8c799db1', 'd75fc88a', '36eebaa4', '26e2c66f', 'f20fff4b', 'cca3a4a0', 'aa568415', 'fae7b0f0', '3b16ce12', '64396bcb', 'f96375f1', '86ee8c7', '53de9e36', '61460464', '27ee8e54', 'a40a5eba', '4a82ee5e', '392e71f4', 'a7a2ddcd', '8bb44830', 'b1b69776', '17f58994', '32ba5b15', '76e66257', '261fbbcc', 'ba6de76b', '2f175191', '6e0b34eb')
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'f07e70' AND `warehouse` = 'Stores - f07e70' AND (`posting_date` < '2026-09-2' OR (`posting_date` = '2026-09-2' AND `posting_time` <= '12:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('59132801', '48cb407', 'c0182c67', 'c80da511', '7f1dedd1', 'e3af4216', 'ee093f2b', 'e9b76eac', '17ce4a2a', '33549b7d', '7c181ee7', '47ae00e3', 'dd2e97b9', '4d8e4eb1', '9907e9da', '957b1761')
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '948220@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 307
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '731a89' AND `warehouse` = 'Stores - 731a89' AND (`posting_date` < '2026-09-6' OR (`posting_date` = '2026-09-6' AND `posting_time` <= '16:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '8f2619' AND `warehouse` = 'Stores - 8f2619' AND (`posting_date` < '2026-09-9' OR (`posting_date` = '2026-09-9' AND `posting_time` <= '19:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('294f97e0', '9878f66b', '64ace67c', '761e1ab9', '930a7f4', '8a256d8', 'a23fbd4', '836bdf6f', '9448f92e', '18e3dac1', '69bafa1d', 'a5956772', 'b24e3a02', '21c8be28', '6a52ce18', '93f72e77', 'd65218fb', '5a55c064', '13840655', '5fed2bec', 'ba458e95', 'a9c3d962', 'bbf73ce8', '29f4536e', '5c0412d2', '2b714bf1') AND `disabled` = 0
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '8a81ee@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 61
+UPDATE `tabVersion` SET `modified` = '2026-10-14 10:207:00.9097', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '489264'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-05-01' and '2026-05-28' and `company` = '9fce48' and `is_cancelled` = 0
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('1ee99d8e', '1596640e', 'a9f4a20e', '9419b2a2', '37b630f3', '3be20afe', '3e59ed08', '9865304e', 'c663221d', 'c8b510c1', '83505d57', 'b5f656b8', 'd1b37416', 'fe84f53', 'd2450b1b', '3ee97d2b', '12b39dfc', '9963b9ec', '5658fb0f', 'fba2bae9', '191b7733', 'a8d9088', '3703ac2e', '9e458516', 'c5d9e022', 'b11c5b15', '2cb92415', 'd08ca03a', '4db925db') and `qty` > -416.5 group by `parent` having sum(`amount`) >= 7565
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = 'adc638' order by `tabSales Invoice`.`modified` desc limit 86 offset 2477
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-01-01' and '2026-01-28' and `company` = 'ff4ea5' and `is_cancelled` = 0
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'b7aa6e@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 498
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'c8d06d@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 481
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('a7bb3668', 'f2290e2d', 'a1ecc850', '1da79227', '116a8a89', 'f7ecfe27', 'c87cdc9a', 'c9983f10', 'cd624d72', '40835c74', 'c02edf60', 'd69f8fd8', 'd8f41ca4', '3b6a0b33', '3d7796de', '32b10455', '966ea432', '75393fcd') and `qty` > -450.5 group by `parent` having sum(`amount`) >= 8071
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('cafebc', '2026-10-17 05:00:00', '2026-10-17 05:00:00', 'Sync Error', 'Traceback: cafebc')
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '85670@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 150
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('b38050b9', 'e3b9e7fd', '7128f6bd', '684e487a', 'a9374236', '89c5fea1')
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-09-01' and '2026-09-28' and `company` = '4efe55' and `is_cancelled` = 0
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('db539aa1', 'd4a3f5c6', 'f7df5ef1', '2986d823', '641462a5', '86f6240a', '251a8e3') and `qty` > -90.5 group by `parent` having sum(`amount`) >= 1699
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'aa932d@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 214
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('71b058b1', '442f2468', 'f5354d3a', '4bbbcbd3', '5ca054e7', '4e2a5823', 'a9420dfe', 'b593ac67', 'a1c5c6c6', 'afb245fe', '6038919b') and `qty` > -347.5 group by `parent` having sum(`amount`) >= 977
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'c04660@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 263
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = '820bd1' order by `tabSales Invoice`.`modified` desc limit 24 offset 6426
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('fb6dfb25', '47e73205', 'a0967041', 'c3301131', '3de292c5', '4a8a33b1', 'c5db3bd2', '8b566eee', '69b1b9e', '6bb32b68', '8c5770c9', 'fa681a14', '68560e02', 'a617ad4d', '1595f16e', 'ce0e2a76', 'f3348405', 'ad2eeb51', 'a3b21bd2', '616788d3', '7e34c4f9') and `qty` > -354.5 group by `parent` having sum(`amount`) >= 4546
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-05-01' and '2026-05-28' and `company` = 'f64ddf' and `is_cancelled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('f197ca14', '79882a7a', '32859a94', '9ee73a49', '5226702f', 'ed94830c', '7034316f', '67300d22', '1bc1ef63', 'ae7a7002', '429d20fd', '5c9e5d0e', '64db492c', '51d30208', '62b13fb2', 'cb13d0ab', 'f6ae5b5b', '78f9721a', '4450315b', '1ccabc6e', '3437ada6', 'ed014bc7', 'e8a58a07', '9f6b7943', '7342d5a1', '805248a7', 'd64cb2ca', '688375c7', 'a319c60b')
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-07-01' and '2026-07-28' and `company` = '467feb' and `is_cancelled` = 0
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-02'
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('a50fccb1', '2d29c39a', 'f7a09efe', 'b91148e8', 'a247e4e1', 'be0b3177')
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'ab5e7b' AND `warehouse` = 'Stores - ab5e7b' AND (`posting_date` < '2026-09-3' OR (`posting_date` = '2026-09-3' AND `posting_time` <= '13:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+UPDATE `tabVersion` SET `modified` = '2026-10-15 10:207:00.3505', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '6ebbd3'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-01-01' and '2026-01-28' and `company` = '1ffc2e' and `is_cancelled` = 0
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('5c1657', '2026-10-17 02:00:00', '2026-10-17 02:00:00', 'Sync Error', 'Traceback: 5c1657')
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('f4337bd8', '533c8248', '37e88f6d', 'e0bf46', '752e43a3', 'a115f523', 'c3949286', '2385e28f', '726639c5', '466a622c', '80dce46e', 'f213144', 'fa2e7c76', '72197c9f', '971a5442', '8e0eb0e4', '987dd4b4', 'ceb025f0', '84288d2', 'a23934f', '89b161c0', 'd3cfeead', '77b38c99', '1c4cb9ae', '7bd575ba', '3976edf3', '4b4d6236') AND `disabled` = 0
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('37c5b30a', '8e7d6ed9', 'cb20bbec', 'd20aa558', '357fe80e', '481e0dce', 'd6e34109', 'f951bed0') and `qty` > -366.5 group by `parent` having sum(`amount`) >= 499
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-02-01' and '2026-02-28' and `company` = '449f74' and `is_cancelled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('16eac2ed', '95bd4f82', '1cc4d89a', '666f88f2', '63eb2034', '83181a75', 'f45be5b1', '96b89f5a', '68b60ffc', '39ed92cc', 'aaad9768', 'de1e90d6', 'e1bcb3e5', 'fee5bf02', 'e027248', 'cdde1a2c', '5f10b670', 'f61a699b', '8812e7d2', '545535d0', 'a8674764', 'fc7b0b0c', '4072fb73', '1246167b')
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'be3994@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 101
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-03'
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('50d04ccb', 'fdd0ded4', '5ac4fd09', '4e4578b5', '1af25591', 'b536a39', 'bd471475', '2cd81dfa', 'b0fa6616', '5af25c11', '6bc7e3e7', 'e623d713', '785c1f8', 'cdf2b4aa', 'b692c7d1', '747e9011', 'c5d0b7da', '1a2698cc', '57cac47b', '1b50afce', 'dbae282a') and `qty` > -399.5 group by `parent` having sum(`amount`) >= 7721
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('566f709c', 'cb74b998', '518addb8', '79eb04d1', 'e5b59f85', 'd268c279', 'f9eca092', '20d91a5e', 'd9978d70', '1bdea0a2', '873ec0fe', '903c07c7', '4051234b', '8208217c', '638f622f', '3593f8bb', '5a93b16f', '407f2c24', 'a8054213', '56e9280', 'f0010b8c', 'e8abc37f', '316e09bc', 'b5d0a4af', '473f64ae', 'f2000111', 'd0a1cd26', 'fb056ddf', '84dc6dd1', '6fcead76') AND `disabled` = 0
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-02-01' and '2026-02-28' and `company` = '61000e' and `is_cancelled` = 0
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '191a69@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 303
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '2b41de@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 205
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'bd0d9a@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 380
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('f9e4fd3c', '333be773', 'cd7f1172', '3df689', '9beaac5', '776ec748', 'c7658c1', '66e85767', '3d8e2f18', 'f0f05ff2', 'ee4155c3', 'f59f6ff6', '38370736', 'c67c93a0', 'ac0052da', 'b5277f4', 'ee2bb94e', '8e623291', 'a37ddf40', '93fbbca1', 'eb55e7da', '69eaccc5', '43510578', 'a9429df', '27460880', '77c94af2', '4aa34a6', '7a95b359', 'c1d2a5ee', 'f4db8edd') AND `disabled` = 0
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-09-01' and '2026-09-28' and `company` = '13df01' and `is_cancelled` = 0
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('75034ba2', '659f1814', 'abb33ad1', '1f42f19', '8f558977', 'beb814c1', '35627716', '6299237', '2ff76051', 'd464cd7b') and `qty` > -429.5 group by `parent` having sum(`amount`) >= 7503
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('a66a37d2', 'bc4cc2bf', '3506ce5f', 'abf67497', '6dd61460', 'fbb9f057', '1c43398d', '9cd89d82', 'f9f8febb', '161b3682', '8bce4153', '85091230', '5a3f44ca', 'ad7a915c', '181269c3', '167ccabc', 'baeca3bb', '3d2a933c', 'd987e542', 'e1a0b6f7', 'd92bbd3a', 'fbd12e24', '19f66f4d') AND `disabled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('7e7fb0ed', '9b3ed083', '93845a88', 'fa8387fc', '55b8fb74')
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('b1453977', 'c47207eb', '9948a0c7', '36c0fa3d', '8526e964', '62a7ec8b', '74a3baf3', 'fbd5bef2', '684ae995', 'ec7da744', '9c6bd7e2', '931335ee', 'a60929e6', '35f8abc8', 'ea997260', 'c233c03f', 'bb917046', 'c083c439', 'cbeada73', '146e6828', 'e9b1e659', '58575ea') AND `disabled` = 0
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('c32829', '2026-10-17 05:00:00', '2026-10-17 05:00:00', 'Sync Error', 'Traceback: c32829')
+UPDATE `tabVersion` SET `modified` = '2026-10-19 10:175:00.3781', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '55b61'
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'a6627d' AND `warehouse` = 'Stores - a6627d' AND (`posting_date` < '2026-09-4' OR (`posting_date` = '2026-09-4' AND `posting_time` <= '14:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('48c849', '2026-10-17 04:00:00', '2026-10-17 04:00:00', 'Sync Error', 'Traceback: 48c849')
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'a4aee3' AND `warehouse` = 'Stores - a4aee3' AND (`posting_date` < '2026-09-3' OR (`posting_date` = '2026-09-3' AND `posting_time` <= '13:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('1163fd17', 'b1e60b4f', '64212293', '4dcc67f8', '13f3fec6', '105e7420', 'bac6f344', '11211ec7', '8922398d', '3b8b7a0', '12cd8d4e', '5c8b5376', '13115908', '246952ec', '8eab2767', '1ce4910f', 'b8f22dff', '7e62aa44', 'a5fd8b03', 'f833f72e') AND `disabled` = 0
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-01-01' and '2026-01-28' and `company` = 'abb44e' and `is_cancelled` = 0
+UPDATE `tabVersion` SET `modified` = '2026-10-15 10:301:00.5111', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'a96222'
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-05-01' and '2026-05-28' and `company` = 'd63cff' and `is_cancelled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('956b0d3b', '39277dbc', 'fe2cc0b', '1096ac41', '4bbf1e19', '3cb1f3d', '44b10f66', 'da40af72', 'ee44adb2', '214c413c', 'efa13ed8', 'f68c4d75', '5af98018', '5d17126a', '8acc654c', 'b8ff0724', '2d23dac8', '236b8d4c', '5e8f8198') AND `disabled` = 0
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-01'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = '4826bf' order by `tabSales Invoice`.`modified` desc limit 16 offset 7742
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '17feee@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 208
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '1c2c12@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 31
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = '43eae9' order by `tabSales Invoice`.`modified` desc limit 240 offset 7551
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('73f8c133', 'a189027b', '515c9ac2', '191207b8', '3490b514', '47d74c11', 'a9b6103e', 'ca00a875', '5c79ed2e', '11720154', '1ea52600', 'b416da5b', 'fbf36252', '7997f8de', '7b48db01', '41dfc3a6', '2e12b23b', '8270fdfa', '2c904ae', 'a0a6fb86', 'a72924b7', 'cfc1bb99', '83c0aaae', 'e7152766', '643d66a', 'a4c092c0') AND `disabled` = 0
+UPDATE `tabVersion` SET `modified` = '2026-10-18 10:371:00.1342', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'e6ce7c'
+UPDATE `tabVersion` SET `modified` = '2026-10-14 10:345:00.3477', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '7dfa7d'
+UPDATE `tabVersion` SET `modified` = '2026-10-18 10:312:00.4224', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '27a1b0'
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'e2f360@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 386
+UPDATE `tabVersion` SET `modified` = '2026-10-12 10:496:00.6680', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '44d8e3'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 1 and `tabSales Invoice`.`customer` = '12c68f' order by `tabSales Invoice`.`modified` desc limit 272 offset 6174
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-05'
+UPDATE `tabVersion` SET `modified` = '2026-10-18 10:410:00.157', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '53ff28'
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'fa6bec@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 221
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-05'
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('8287c1b1', '22d0a1cc') AND `disabled` = 0
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('f13fca73', '550052a3', '93b39964', '8afd1e20', '5b0de8a8', '5858b9f0', 'b455e37c', 'c227cfd2', '6fed9708', '5082baa5', '2ce83ee4', 'cfb5d95a', '7b50f775', 'b1703050', '4824f9e') and `qty` > -400.5 group by `parent` having sum(`amount`) >= 2636
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'a45fca' AND `warehouse` = 'Stores - a45fca' AND (`posting_date` < '2026-09-4' OR (`posting_date` = '2026-09-4' AND `posting_time` <= '14:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'cc63bb' AND `warehouse` = 'Stores - cc63bb' AND (`posting_date` < '2026-09-2' OR (`posting_date` = '2026-09-2' AND `posting_time` <= '12:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+UPDATE `tabVersion` SET `modified` = '2026-10-11 10:136:00.3872', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '2cae5c'
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = '260bb7' order by `tabSales Invoice`.`modified` desc limit 241 offset 5494
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-01'
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('caaf746a', 'de3c6c15', 'ba90c40a', '54229e4f', '57798ebc')
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = '9f58c4' order by `tabSales Invoice`.`modified` desc limit 48 offset 7731
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-04-01' and '2026-04-28' and `company` = '373deb' and `is_cancelled` = 0
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('6c68f0cd', '8597b645', '887ca84b', '54f3ea6b', 'b97424f3', 'e9ce681', '7e95f59', '3a91eb84', 'b96fabb7', '6048ad1', '38921637', '834666fa', '4a724048', '362283de', 'a3c97e9a', 'b7c6b33f', 'b0f30463')
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('e6087f0e', '42c2e85d', '21982f13', '2847d30e', 'fe090d3', '39ef8ace', '76828aae', 'c57579e0', '56c1525e', 'd3b5b60a', 'b43fd19c', 'b75e1ede', 'ae6329e4', 'f56dfc05', 'b3b35aa3', 'cb5b0c81', 'ce191e0c', '4f471eee', '658236a4', '50c1a9ca', '85dd60f1', 'b89fe6cd')
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('c9034a8', '53353132', '8384914e', '3c811b85', '26b8778b', '2cdf5e64', 'ee81a709', 'a122dab6', 'e09578b7', '3ec399e5') AND `disabled` = 0
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-07'
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '210300' AND `warehouse` = 'Stores - 210300' AND (`posting_date` < '2026-09-1' OR (`posting_date` = '2026-09-1' AND `posting_time` <= '11:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('118bd57b', 'da3855cc', 'c02ca748', 'a9185c36', 'c550b07d', '573e9ee6', '6ff666b5', '8511fd5b', '15f07a3a', '25137cda', '64d41a3e', 'b28bdfc2', '181312c3', 'b743765c', 'f6a96fef', 'bc6a0904', 'd1d286c', '829c80e', '49bc55a8', 'e8e9a8f1', 'c496c1c8', 'ab9a7a55')
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-04-01' and '2026-04-28' and `company` = 'e77d36' and `is_cancelled` = 0
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-08-01' and '2026-08-28' and `company` = '71499' and `is_cancelled` = 0
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-05-01' and '2026-05-28' and `company` = '3a591e' and `is_cancelled` = 0
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '691b3f' AND `warehouse` = 'Stores - 691b3f' AND (`posting_date` < '2026-09-4' OR (`posting_date` = '2026-09-4' AND `posting_time` <= '14:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 0 and `tabSales Invoice`.`customer` = 'db6fdd' order by `tabSales Invoice`.`modified` desc limit 481 offset 8889
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-01'
+UPDATE `tabVersion` SET `modified` = '2026-10-18 10:194:00.5077', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = 'f43d9a'
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'ed7786' AND `warehouse` = 'Stores - ed7786' AND (`posting_date` < '2026-09-1' OR (`posting_date` = '2026-09-1' AND `posting_time` <= '11:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '9a919e@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 411
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'fffd63' AND `warehouse` = 'Stores - fffd63' AND (`posting_date` < '2026-09-3' OR (`posting_date` = '2026-09-3' AND `posting_time` <= '13:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-06-01' and '2026-06-28' and `company` = '8d27d3' and `is_cancelled` = 0
+select `name`, `owner`, `modified` from `tabSales Invoice` where `tabSales Invoice`.`docstatus` = 2 and `tabSales Invoice`.`customer` = '46a8bb' order by `tabSales Invoice`.`modified` desc limit 120 offset 6885
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-02'
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '51e736@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 236
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-03'
+UPDATE `tabVersion` SET `modified` = '2026-10-18 10:243:00.4539', `data` = '{\"changed\": [[\"status\", \"Draft\", \"Submitted\"]]}' WHERE `name` = '7c7ac8'
+SELECT SQL_NO_CACHE * FROM `tabDeleted Document` WHERE `creation` > '2026-10-02'
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('b4785e', '2026-10-17 03:00:00', '2026-10-17 03:00:00', 'Sync Error', 'Traceback: b4785e')
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = '253376@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 321
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '9dcb75' AND `warehouse` = 'Stores - 9dcb75' AND (`posting_date` < '2026-09-8' OR (`posting_date` = '2026-09-8' AND `posting_time` <= '18:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+/* frappe.desk.reportview.get */ select `tabToDo`.`name`, `tabToDo`.`description` from `tabToDo` where `tabToDo`.`allocated_to` = 'a3a09a@example.com' and `tabToDo`.`status` = 'Open' order by `tabToDo`.`modified` DESC limit 481
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '1133a8' AND `warehouse` = 'Stores - 1133a8' AND (`posting_date` < '2026-09-1' OR (`posting_date` = '2026-09-1' AND `posting_time` <= '11:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('55161772', '49b66195', 'd24a6eee', '7eba8622', '29047148', 'f0755611', 'b0a16099', '609414d1', '591fde2', '13628958', '31722360', '35af003d', 'f39e374', 'bc99cd7b', 'ce3a4724', '23fd4a19', '259a997a', '4fa5d8dd', '3a5d5dc1', '382254a1', 'ebe1f5c', '6fc6a3d8', '438ab37e', '1f3b59cd', 'bbc15e00', 'f8a09f8c', 'b85aeae1', 'e82e0724', 'e90b56cc')
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('ecd32642', '26085a76', '6f1cd87d', 'd6683862', '31641290', 'a34a2ef', 'bf803390', '7f329ea9', 'dbcdb237', 'baf84cca', '62c11c1b', '6c16e7c3', '17d9e65e', 'a12b48d8', 'df782bb7', 'b5794d65', 'c0e7b4af', '2df27ca3', '98d475d3', '20565eb5', 'fa0efcd7', '4d3bf097', '9c0af23', '1587fa0a', 'e5277cb') AND `disabled` = 0
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-06-01' and '2026-06-28' and `company` = '9bf85e' and `is_cancelled` = 0
+SELECT `name` FROM `tabItem` WHERE `item_group` IN ('6f388e37', '53466d11', '6411fee5', '68b55153', '40d920ca', '72374aaf', '3b8ea2bb', '7baac716', 'f9800059', '643a384', 'feb15417', 'ac5cc28b', 'b4b3fedd', 'e673289e', '2cd35c39', '2a6242b2', '2e0ddb44', 'e48fca7a', '26f95ca0', 'cb2fb763', '59dc2b82', 'a043a885', 'bcb78207', 'a7bd4828', 'f16649d', '720e4776', '87bc0060', '9f48dca8') AND `disabled` = 0
+select `parent`, sum(`amount`) from `tabSales Invoice Item` where `parent` in ('739b298c') and `qty` > -12.5 group by `parent` having sum(`amount`) >= 9846
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('cd53db', '2026-10-17 01:00:00', '2026-10-17 01:00:00', 'Sync Error', 'Traceback: cd53db')
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '2948d8' AND `warehouse` = 'Stores - 2948d8' AND (`posting_date` < '2026-09-4' OR (`posting_date` = '2026-09-4' AND `posting_time` <= '14:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+delete from `tabComment` where `reference_doctype` = 'Sales Order' and `reference_name` in ('3601685f', 'cace0ef8', 'aa06c354', 'c9c30bc4', '9d56e087', 'd23cda4b', '118a26f', 'fda3ecf1', '9473e3da', 'b0216267', '5388d75c', '517a5d20', 'a47a1869', 'c1ef1ec5', '8f525c79', '43256b89', 'cd12667d', '9c62e34c', '5639b941', '28907c27', '92d823e2', 'db905b05', '8bc853d7', '7d1e37e9', 'f3b9e79e', '466db73e', 'dbc3e763', 'ec42e89e', 'fd1fb212')
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('cf3cb6', '2026-10-17 08:00:00', '2026-10-17 08:00:00', 'Sync Error', 'Traceback: cf3cb6')
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '36e9a1' AND `warehouse` = 'Stores - 36e9a1' AND (`posting_date` < '2026-09-5' OR (`posting_date` = '2026-09-5' AND `posting_time` <= '15:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'b151eb' AND `warehouse` = 'Stores - b151eb' AND (`posting_date` < '2026-09-8' OR (`posting_date` = '2026-09-8' AND `posting_time` <= '18:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '9a1779' AND `warehouse` = 'Stores - 9a1779' AND (`posting_date` < '2026-09-3' OR (`posting_date` = '2026-09-3' AND `posting_time` <= '13:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = 'e04665' AND `warehouse` = 'Stores - e04665' AND (`posting_date` < '2026-09-5' OR (`posting_date` = '2026-09-5' AND `posting_time` <= '15:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+SELECT `tabStock Ledger Entry`.`name`, `tabStock Ledger Entry`.`qty_after_transaction` FROM `tabStock Ledger Entry` WHERE `item_code` = '389dac' AND `warehouse` = 'Stores - 389dac' AND (`posting_date` < '2026-09-2' OR (`posting_date` = '2026-09-2' AND `posting_time` <= '12:00:00')) ORDER BY `posting_date` DESC, `posting_time` DESC, `creation` DESC LIMIT 1 FOR UPDATE
+insert into `tabError Log` (`name`, `creation`, `modified`, `method`, `error`) values ('d2aac1', '2026-10-17 05:00:00', '2026-10-17 05:00:00', 'Sync Error', 'Traceback: d2aac1')
+select count(*) as `count` from `tabGL Entry` where `posting_date` between '2026-06-01' and '2026-06-28' and `company` = '8dd538' and `is_cancelled` = 0
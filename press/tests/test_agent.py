@@ -1,12 +1,17 @@
 # Copyright (c) 2024, Frappe and contributors
 # For license information, please see license.txt
 
+import time
+from unittest.mock import patch
+
 import frappe
 import requests
 import responses
 from frappe.tests.utils import FrappeTestCase
+from frappe.utils.password import update_password
 
 from press.agent import Agent, AgentRequestSkippedException
+from press.agent_transport import CONTEXT_TTL, get_pool_stats, get_request_context
 from press.press.doctype.agent_request_failure.agent_request_failure import (
 	remove_old_failures,
 )
@@ -160,3 +165,48 @@ class TestAgent(FrappeTestCase):
 
 		responses.assert_call_count(f"https://{server.name}:443/agent/ping", 1)
 		self.assertEqual(frappe.db.count("Agent Request Failure", {"server": server.name}), 0)
+
+	@responses.activate
+	def test_repeated_requests_to_same_server_reuse_pooled_session(self):
+		server = create_test_server()
+		responses.add(
+			responses.GET,
+			f"https://{server.name}:443/agent/ping",
+			status=200,
+			json={"message": "pong"},
+		)
+
+		before = get_pool_stats()
+		agent = Agent(server.name, server.doctype)
+		agent.request("GET", "ping")
+		agent.request("GET", "ping")
+		after = get_pool_stats()
+
+		self.assertEqual(after["pool_misses"] - before["pool_misses"], 1)
+		self.assertEqual(after["pool_hits"] - before["pool_hits"], 1)
+		self.assertEqual(after["context_hits"] - before["context_hits"], 1)
+
+	def test_server_password_change_invalidates_cached_request_context(self):
+		server = create_test_server()
+		self.assertEqual(
+			get_request_context(server.doctype, server.name)["password"],
+			server.get_password("agent_password"),
+		)
+
+		server.agent_password = "new-agent-password"
+		server.save()
+
+		self.assertEqual(get_request_context(server.doctype, server.name)["password"], "new-agent-password")
+
+	def test_request_context_expires_for_changes_that_skip_hooks(self):
+		server = create_test_server()
+		get_request_context(server.doctype, server.name)
+
+		update_password(server.doctype, server.name, "agent_password", "new-agent-password")
+		self.assertNotEqual(
+			get_request_context(server.doctype, server.name)["password"], "new-agent-password"
+		)
+
+		with patch("press.agent_transport.time.monotonic", return_value=time.monotonic() + CONTEXT_TTL + 1):
+			context = get_request_context(server.doctype, server.name)
+		self.assertEqual(context["password"], "new-agent-password")
@@ -0,0 +1,78 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from press.auth import get_user_type, hook, is_denied
+
+# Peak dashboard traffic is a few hundred requests per second per worker
+REQUESTS_PER_SECOND = 500
+
+
+class TestAuthHook(FrappeTestCase):
+	def tearDown(self):
+		frappe.local.press_auth_user_type = None
+
+	def test_api_path_outside_allow_lists_is_denied(self):
+		self.assertTrue(is_denied("/api/method/frappe.client.get_list"))
+		self.assertTrue(is_denied("/api/resource/User"))
+
+	def test_exact_and_wildcard_allowed_api_paths_are_not_denied(self):
+		self.assertFalse(is_denied("/api/method/login"))
+		self.assertFalse(is_denied("/api/method/press.api.site.get"))
+		self.assertFalse(is_denied("/api/method/press.saas.api.site.info"))
+
+	def test_denied_non_api_paths_and_other_pages_are_checked_exactly(self):
+		self.assertTrue(is_denied("/printview"))
+		self.assertFalse(is_denied("/printview-help"))
+		self.assertFalse(is_denied("/dashboard"))
+
+	def test_user_type_is_looked_up_once_per_user_in_a_request(self):
+		with patch("press.auth.frappe.get_cached_value", return_value="Website User") as get_cached_value:
+			get_user_type()
+			get_user_type()
+		self.assertEqual(get_cached_value.call_count, 1)
+
+	def test_hook_denies_website_users_only_on_denied_paths(self):
+		frappe.local.press_auth_user_type = (frappe.session.user, "Website User")
+
+		with (
+			patch("press.auth.frappe.form_dict", frappe._dict()),
+			patch("press.auth.frappe.request") as request,
+			patch("press.auth.log") as log,
+		):
+			request.method = "GET"
+			for path in ("/api/method/press.api.site.get", "/api/method/logout", "/dashboard/sites"):
+				request.path = path
+				hook()
+
+			request.path = "/api/method/frappe.client.get_list"
+			self.assertRaises(frappe.AuthenticationError, hook)
+		log.assert_called_once()
+
+	@unittest.skipUnless(
+		os.environ.get("PRESS_RUN_BENCHMARKS"), "set PRESS_RUN_BENCHMARKS=1 to run benchmarks"
+	)
+	def test_hook_cost_per_request(self):
+		frappe.local.press_auth_user_type = (frappe.session.user, "Website User")
+		paths = ["/api/method/press.api.site.get", "/api/method/logout", "/dashboard/sites"]
+		calls = REQUESTS_PER_SECOND * 10
+
+		with (
+			patch("press.auth.frappe.form_dict", frappe._dict()),
+			patch("press.auth.frappe.request") as request,
+		):
+			request.method = "GET"
+			start = time.perf_counter()
+			for i in range(calls):
+				request.path = paths[i % len(paths)]
+				hook()
+			per_request = (time.perf_counter() - start) / calls
+
+		print(f"press.auth.hook: {per_request * 1e6:.2f}µs per request over {calls} requests")
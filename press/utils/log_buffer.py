@@ -0,0 +1,106 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+"""Redis backed buffer for JSON log lines, drained to a gzip-rotated file in the logs directory."""
+
+from __future__ import annotations
+
+import gzip
+import os
+import shutil
+import time
+
+import frappe
+
+CHUNK_SIZE = 5000
+MAX_FILE_SIZE = 100 * 1024 * 1024
+ROTATED_FILES_TO_KEEP = 5
+
+
+class LogBuffer:
+	def __init__(self, key: str, file_name: str, max_entries: int = 1000000):
+		self.key = key
+		self.file_name = file_name
+		self.max_entries = max_entries
+
+	@property
+	def redis_key(self) -> str:
+		return frappe.cache.make_key(self.key)
+
+	@property
+	def stats_key(self) -> str:
+		return f"log-buffer-stats:{self.key}"
+
+	@property
+	def log_file(self) -> str:
+		return os.path.join(frappe.utils.get_bench_path(), "logs", self.file_name)
+
+	def push(self, serialized: str):
+		"""Appends one entry and caps the backlog in a single round trip."""
+		pipeline = frappe.cache.pipeline(transaction=False)
+		pipeline.rpush(self.redis_key, serialized)
+		pipeline.ltrim(self.redis_key, -self.max_entries, -1)
+		pipeline.execute()
+
+	def flush(self, max_chunks: int = 100):
+		"""Drains the backlog chunk by chunk. Each chunk is popped atomically, so it is written once."""
+		start, flushed = time.monotonic(), 0
+		for _ in range(max_chunks):
+			chunk = self.pop_chunk()
+			if not chunk:
+				break
+			self.write(chunk)
+			flushed += len(chunk)
+		self.record_stats(flushed, time.monotonic() - start)
+
+	def pop_chunk(self) -> list[str]:
+		pipeline = frappe.cache.pipeline(transaction=True)
+		pipeline.lrange(self.redis_key, 0, CHUNK_SIZE - 1)
+		pipeline.ltrim(self.redis_key, CHUNK_SIZE, -1)
+		chunk, _ = pipeline.execute()
+		return list(map(frappe.safe_decode, chunk))
+
+	def write(self, chunk: list[str]):
+		try:
+			self.rotate_if_needed()
+			with open(self.log_file, "a") as f:
+				f.write("\n".join(chunk))
+				f.write("\n")
+		except Exception:
+			# Put the chunk back at the head, so the next flush retries it
+			pipeline = frappe.cache.pipeline(transaction=False)
+			pipeline.lpush(self.redis_key, *reversed(chunk))
+			pipeline.execute()
+			raise
+
+	def rotate_if_needed(self):
+		if not os.path.exists(self.log_file) or os.path.getsize(self.log_file) < MAX_FILE_SIZE:
+			return
+
+		rotated = f"{self.log_file}.{int(time.time())}"
+		os.rename(self.log_file, rotated)
+		with open(rotated, "rb") as source, gzip.open(f"{rotated}.gz", "wb") as target:
+			shutil.copyfileobj(source, target)
+		os.remove(rotated)
+		self.remove_old_rotations()
+
+	def remove_old_rotations(self):
+		directory = os.path.dirname(self.log_file)
+		prefix = f"{self.file_name}."
+		rotations = sorted(f for f in os.listdir(directory) if f.startswith(prefix) and f.endswith(".gz"))
+		for file in rotations[:-ROTATED_FILES_TO_KEEP]:
+			os.remove(os.path.join(directory, file))
+
+	def record_stats(self, flushed: int, duration: float):
+		frappe.cache.set_value(
+			self.stats_key,
+			{
+				"flushed": flushed,
+				"duration": duration,
+				"throughput": flushed / duration if duration else 0,
+				"flushed_at": frappe.utils.now(),
+			},
+		)
+
+	def stats(self) -> dict:
+		stats = frappe.cache.get_value(self.stats_key) or {}
+		return {**stats, "backlog": frappe.cache.llen(self.key)}
@@ -0,0 +1,135 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+"""Pooled and cached client for the monitor server's Prometheus API."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any
+
+import frappe
+from frappe.utils.password import get_decrypted_password
+
+from press.agent_transport import get_session
+
+TIMEOUT = (5, 30)
+MAX_WORKERS = 4
+CLIENT_TTL = 5 * 60
+MIN_RESPONSE_TTL = 30
+MAX_RESPONSE_TTL = 15 * 60
+CACHE_KEY_PREFIX = "prometheus_response"
+
+_clients: dict[str, tuple[PrometheusClient, float]] = {}
+
+
+class PrometheusClient:
+	def __init__(self, monitor_server: str, password: str):
+		self.monitor_server = monitor_server
+		self.base_url = f"https://{monitor_server}/prometheus/api/v1"
+		self.auth = ("frappe", str(password))
+
+	def query(self, query: str) -> dict:
+		return self.query_many({"_": query})["_"]
+
+	def query_many(self, queries: dict[str, str], return_exceptions: bool = False) -> dict[str, Any]:
+		"""Runs instant queries concurrently. Instant queries read the latest scrape, so are not cached."""
+		requests = {key: ("query", {"query": query}, 0) for key, query in queries.items()}
+		return self.fetch_many(requests, return_exceptions)
+
+	def query_range(
+		self, query: str, start: datetime | float, end: datetime | float, step: int, align: bool = True
+	) -> dict:
+		return self.query_range_many({"_": (query, start, end, step)}, align)["_"]
+
+	def query_range_many(self, queries: dict[str, tuple], align: bool = True) -> dict[str, dict]:
+		"""Runs `{key: (query, start, end, step)}` range queries concurrently.
+
+		Start and end are floored to the step, so dashboards opened within the same step share
+		the cached response. Callers that align to local day boundaries pass `align=False`.
+		"""
+		requests = {}
+		for key, (query, start, end, step) in queries.items():
+			start, end = get_timestamp(start), get_timestamp(end)
+			if align:
+				start, end = start - start % step, end - end % step
+			params = {"query": query, "start": start, "end": end, "step": f"{step}s"}
+			requests[key] = ("query_range", params, get_response_ttl(step))
+		return self.fetch_many(requests)
+
+	def fetch_many(self, requests: dict[str, tuple[str, dict, int]], return_exceptions: bool = False):
+		"""Serves `{key: (endpoint, params, ttl)}` from cache and fetches the rest in parallel.
+
+		Only HTTP calls run in worker threads, cache reads and writes need the request's site context.
+		"""
+		results, missing = {}, {}
+		for key, (endpoint, params, ttl) in requests.items():
+			cached = frappe.cache.get_value(get_cache_key(endpoint, params)) if ttl else None
+			if cached:
+				results[key] = cached
+			else:
+				missing[key] = (endpoint, params, ttl)
+
+		if not missing:
+			return results
+
+		with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(missing))) as executor:
+			futures = {
+				key: executor.submit(self.fetch, endpoint, params)
+				for key, (endpoint, params, _) in missing.items()
+			}
+
+		for key, future in futures.items():
+			endpoint, params, ttl = missing[key]
+			try:
+				response = future.result()
+			except Exception as e:
+				if not return_exceptions:
+					raise
+				results[key] = e
+				continue
+
+			if ttl and response.get("status") == "success":
+				frappe.cache.set_value(get_cache_key(endpoint, params), response, expires_in_sec=ttl)
+			results[key] = response
+		return results
+
+	def fetch(self, endpoint: str, params: dict) -> dict:
+		session = get_session(self.monitor_server)
+		url = f"{self.base_url}/{endpoint}"
+		return session.get(url, params=params, auth=self.auth, timeout=TIMEOUT).json()
+
+
+def get_client() -> PrometheusClient | None:
+	"""Returns the client for the configured monitor server, None if there isn't one."""
+	site = frappe.local.site
+	client, expires_at = _clients.get(site, (None, 0))
+	if client and expires_at > time.monotonic():
+		return client
+
+	monitor_server = frappe.db.get_single_value("Press Settings", "monitor_server")
+	if not monitor_server:
+		_clients.pop(site, None)
+		return None
+
+	password = get_decrypted_password("Monitor Server", monitor_server, "grafana_password")
+	client = PrometheusClient(monitor_server, password)
+	_clients[site] = (client, time.monotonic() + CLIENT_TTL)
+	return client
+
+
+def get_timestamp(value: datetime | float) -> float:
+	return value.timestamp() if isinstance(value, datetime) else float(value)
+
+
+def get_response_ttl(step: int) -> int:
+	"""A response is fresh until the next sample lands, within bounds."""
+	return min(max(step, MIN_RESPONSE_TTL), MAX_RESPONSE_TTL)
+
+
+def get_cache_key(endpoint: str, params: dict) -> str:
+	digest = hashlib.sha1(json.dumps([endpoint, params], sort_keys=True).encode()).hexdigest()
+	return f"{CACHE_KEY_PREFIX}:{digest}"
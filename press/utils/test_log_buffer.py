@@ -0,0 +1,64 @@
+# Copyright (c) 2026, Frappe and Contributors
+# See license.txt
+from __future__ import annotations
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from press.utils import log_buffer
+from press.utils.log_buffer import LogBuffer
+
+
+class TestLogBuffer(FrappeTestCase):
+	def setUp(self):
+		self.bench_path = tempfile.mkdtemp()
+		os.mkdir(os.path.join(self.bench_path, "logs"))
+		patcher = patch("press.utils.log_buffer.frappe.utils.get_bench_path", return_value=self.bench_path)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		self.buffer = LogBuffer("test-log-buffer", "test.json.log", max_entries=10)
+
+	def tearDown(self):
+		frappe.cache.delete_value([self.buffer.key, self.buffer.stats_key])
+
+	def _written_lines(self) -> list[str]:
+		with open(self.buffer.log_file) as f:
+			return f.read().splitlines()
+
+	def test_flush_writes_every_entry_exactly_once_across_flushes(self):
+		for i in range(3):
+			self.buffer.push(f'{{"entry": {i}}}')
+		self.buffer.flush()
+		self.buffer.push('{"entry": 3}')
+		self.buffer.flush()
+
+		self.assertEqual(self._written_lines(), [f'{{"entry": {i}}}' for i in range(4)])
+		self.assertEqual(self.buffer.stats()["backlog"], 0)
+
+	def test_flush_drains_backlog_larger_than_one_chunk(self):
+		with patch.object(log_buffer, "CHUNK_SIZE", 2):
+			for i in range(5):
+				self.buffer.push(str(i))
+			self.buffer.flush()
+
+		self.assertEqual(self._written_lines(), ["0", "1", "2", "3", "4"])
+		self.assertEqual(self.buffer.stats()["flushed"], 5)
+
+	def test_push_caps_backlog_at_max_entries_keeping_newest(self):
+		for i in range(15):
+			self.buffer.push(str(i))
+
+		self.assertEqual(self.buffer.stats()["backlog"], 10)
+		self.buffer.flush()
+		self.assertEqual(self._written_lines()[0], "5")
+
+	def test_failed_write_puts_chunk_back_for_next_flush(self):
+		self.buffer.push("0")
+		with patch.object(LogBuffer, "rotate_if_needed", side_effect=OSError), self.assertRaises(OSError):
+			self.buffer.flush()
+
+		self.assertEqual(self.buffer.stats()["backlog"], 1)
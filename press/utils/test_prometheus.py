@@ -0,0 +1,63 @@
+# Copyright (c) 2026, Frappe and Contributors
+# See license.txt
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import frappe
+import requests
+from frappe.tests.utils import FrappeTestCase
+
+from press.utils.prometheus import PrometheusClient, get_response_ttl
+
+SUCCESS = {"status": "success", "data": {"resultType": "matrix", "result": []}}
+
+
+class TestPrometheusClient(FrappeTestCase):
+	def setUp(self):
+		self.client = PrometheusClient("monitor.example.com", "password")
+		frappe.cache.delete_keys("prometheus_response")
+
+	def test_range_queries_within_the_same_step_share_one_cached_response(self):
+		with patch.object(PrometheusClient, "fetch", return_value=SUCCESS) as fetch:
+			self.client.query_range("up", 1000, 3610, 60)
+			self.client.query_range("up", 1030, 3659, 60)
+
+		fetch.assert_called_once()
+		self.assertEqual(fetch.call_args.args[1]["start"], 960)
+		self.assertEqual(fetch.call_args.args[1]["end"], 3600)
+
+	def test_unaligned_range_query_keeps_its_boundaries(self):
+		with patch.object(PrometheusClient, "fetch", return_value=SUCCESS) as fetch:
+			self.client.query_range("up", 1000, 3610, 60, align=False)
+
+		self.assertEqual(fetch.call_args.args[1]["start"], 1000)
+
+	def test_error_responses_and_instant_queries_are_not_cached(self):
+		error = {"status": "error", "errorType": "bad_data"}
+		with patch.object(PrometheusClient, "fetch", return_value=error) as fetch:
+			self.client.query_range("up{", 0, 60, 60)
+			self.client.query_range("up{", 0, 60, 60)
+		self.assertEqual(fetch.call_count, 2)
+
+		with patch.object(PrometheusClient, "fetch", return_value=SUCCESS) as fetch:
+			self.client.query("up")
+			self.client.query("up")
+		self.assertEqual(fetch.call_count, 2)
+
+	def test_query_many_returns_exceptions_per_query_when_asked(self):
+		def fetch(endpoint, params):
+			if params["query"] == "down":
+				raise requests.exceptions.ConnectionError
+			return SUCCESS
+
+		with patch.object(self.client, "fetch", side_effect=fetch):
+			responses = self.client.query_many({"a": "up", "b": "down"}, return_exceptions=True)
+
+		self.assertEqual(responses["a"], SUCCESS)
+		self.assertIsInstance(responses["b"], requests.exceptions.ConnectionError)
+
+	def test_response_ttl_follows_timegrain_within_bounds(self):
+		self.assertEqual(get_response_ttl(10), 30)
+		self.assertEqual(get_response_ttl(300), 300)
+		self.assertEqual(get_response_ttl(86400), 15 * 60)
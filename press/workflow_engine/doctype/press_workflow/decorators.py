@@ -10,7 +10,7 @@ from typing import Any, Concatenate, Generic, ParamSpec, Protocol, TypeVar, over
 import frappe
 from frappe.model.document import Document
 
-from press.workflow_engine.doctype.press_workflow.workflow_builder import WorkflowBuilder
+from press.workflow_engine.doctype.press_workflow.workflow_builder import TaskCall, WorkflowBuilder
 from press.workflow_engine.utils import (
 	called_methods_in_order,
 	is_func_accept_task_id,
@@ -19,7 +19,7 @@ from press.workflow_engine.utils import (
 )
 
 if typing.TYPE_CHECKING:
-	from collections.abc import Callable
+	from collections.abc import Callable, Iterable
 	from inspect import Signature
 
 
@@ -76,6 +76,22 @@ class _BoundTask(Generic[_P, _R_co]):
 		bound._task_id = task_id
 		return bound  # type: ignore[return-value]
 
+	def prepare(self, *args: _P.args, **kwargs: _P.kwargs) -> TaskCall:
+		"""Binds the arguments without running the task, for `WorkflowBuilder.gather`."""
+		if self._task_id is not None:
+			kwargs = {**kwargs, "task_id": self._task_id}  # type: ignore[assignment]
+		return TaskCall(self._wrapped, args, kwargs, queue=self._queue, timeout=self._timeout)
+
+	def map(self, items: Iterable[Any]) -> list[_R_co]:
+		"""Runs the task once per item concurrently and returns the results in order.
+
+		Each call gets the task ID `<task_id or "map">_<index>`.
+		"""
+		prefix = self._task_id or "map"
+		return self._instance.gather(
+			*(self.with_task_id(f"{prefix}_{i}").prepare(item) for i, item in enumerate(items))  # type: ignore[arg-type]
+		)
+
 
 class _TaskDescriptor(Generic[_P, _R_co]):
 	def __init__(
@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import io
+import time
 from contextlib import redirect_stdout
+from functools import partial
 from typing import TYPE_CHECKING
 
 import frappe
@@ -57,6 +59,7 @@ class PressWorkflow(Document):
 		key_value_store: DF.Table[PressWorkflowKV]
 		kwargs: DF.Data | None
 		kwargs_type: DF.Literal["int", "float", "string", "tuple", "list", "dict", "object"]
+		last_replay_duration: DF.Float
 		linked_docname: DF.DynamicLink
 		linked_doctype: DF.Link
 		main_method_name: DF.Data
@@ -65,10 +68,12 @@ class PressWorkflow(Document):
 		no_of_callback_attempts: DF.Int
 		output: DF.Data | None
 		output_type: DF.Literal[None]
+		replay_count: DF.Int
 		start: DF.Datetime | None
 		status: DF.Literal["Queued", "Running", "Success", "Failure", "Fatal"]
 		stdout: DF.LongText | None
 		steps: DF.Table[PressWorkflowStep]
+		total_replay_duration: DF.Float
 		traceback: DF.LongText | None
 		workflow_traceback: DF.LongText | None
 	# end: auto-generated types
@@ -91,7 +96,19 @@ class PressWorkflow(Document):
 
 		frappe.db.set_value(self.doctype, self.name, "is_force_failure_requested", True)
 
-	def run(self):  # noqa: C901 - best to keep it in one place
+	def run(self):
+		"""Replays the flow, and again if a task finished while it was being replayed.
+
+		That task's enqueue_workflow is dropped by deduplication, this job still holds the job id.
+		"""
+		resume_key = get_resume_key(self.name)
+		while True:
+			frappe.cache.delete_value(resume_key)
+			self.replay()
+			if self.status != "Running" or not frappe.cache.get_value(resume_key):
+				return
+
+	def replay(self):  # noqa: C901 - best to keep it in one place
 		if not self.linked_doctype or not self.linked_docname:
 			frappe.throw("Cannot run flow without linked_doctype and linked_docname", frappe.ValidationError)
 			return
@@ -127,10 +144,12 @@ class PressWorkflow(Document):
 		if not frappe.flags.in_test:
 			frappe.db.commit()  # nosemgrep
 
+		replay_start = time.monotonic()
 		try:
 			if self.is_force_failure_requested:
 				raise Exception("Workflow was forcefully failed based on user request.")
 
+			reference_doc.preload_task_results()
 			with redirect_stdout(buffer):
 				result = getattr(reference_doc, self.main_method_name)(*args, **kwargs)
 
@@ -146,8 +165,13 @@ class PressWorkflow(Document):
 			status = "Failure"
 			workflow_exception_traceback = frappe.get_traceback()
 		finally:
+			replay_duration = time.monotonic() - replay_start
 			self.reload()
 
+			self.replay_count += 1
+			self.last_replay_duration = replay_duration
+			self.total_replay_duration += replay_duration
+
 			if not self.start:
 				self.start = start
 
@@ -295,13 +319,19 @@ class PressWorkflow(Document):
 		return None
 
 
-def enqueue_workflow(workflow_name: str) -> None:
+def enqueue_workflow(workflow_name: str, resume: bool = False) -> None:
+	"""`resume` when a task has finished, so a run already in progress replays once more."""
 	if frappe.flags.in_test:
 		from press.utils.test import foreground_enqueue_workflow
 
 		foreground_enqueue_workflow(workflow_name)
 		return
 
+	if resume:
+		frappe.db.after_commit.add(
+			partial(frappe.cache.set_value, get_resume_key(workflow_name), 1, expires_in_sec=3600)
+		)
+
 	frappe.enqueue_doc(
 		"Press Workflow",
 		workflow_name,
@@ -314,6 +344,10 @@ def enqueue_workflow(workflow_name: str) -> None:
 	)
 
 
+def get_resume_key(workflow_name: str) -> str:
+	return f"press_workflow||{workflow_name}||resume"
+
+
 def retry_workflows():
 	workflows = frappe.get_all(
 		"Press Workflow",
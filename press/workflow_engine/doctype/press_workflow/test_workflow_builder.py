@@ -8,6 +8,7 @@ from frappe.tests.utils import FrappeTestCase
 
 from press.utils.test import foreground_enqueue, foreground_enqueue_doc
 from press.workflow_engine.doctype.press_workflow.exceptions import PressWorkflowTaskEnqueued
+from press.workflow_engine.doctype.press_workflow.press_workflow import get_resume_key
 from press.workflow_engine.doctype.press_workflow.workflow_builder import (
 	ensure_to_resolve_context,
 )
@@ -190,6 +191,93 @@ class TestWorkflowBuilder(FrappeTestCase):
 		wf.reload()
 		self.assertEqual(wf.status, "Failure")
 
+	def _run_workflow(self, main_method_name: str, steps: list[str]):
+		return frappe.get_doc(
+			{
+				"doctype": "Press Workflow",
+				"linked_doctype": "Press Workflow Test",
+				"linked_docname": self.doc.name,
+				"main_method_name": main_method_name,
+				"main_method_title": main_method_name,
+				"steps": [{"step_title": s, "step_method": s, "status": "Pending"} for s in steps],
+			}
+		).insert(ignore_permissions=True)
+
+	def test_map_enqueues_all_tasks_before_suspending(self):
+		with patch(
+			"press.workflow_engine.doctype.press_workflow_task.press_workflow_task.enqueue_task"
+		) as enqueue_task:
+			wf = self._run_workflow("main_with_mapped_tasks", ["square"])
+
+		wf.reload()
+		self.assertEqual(wf.status, "Running")
+		self.assertEqual(enqueue_task.call_count, 3)
+		self.assertEqual(frappe.db.count("Press Workflow Task", {"workflow": wf.name, "status": "Queued"}), 3)
+
+		for task_name in frappe.get_all("Press Workflow Task", {"workflow": wf.name}, pluck="name"):
+			frappe.get_doc("Press Workflow Task", task_name).run()
+
+		wf.reload()
+		self.assertEqual(wf.status, "Success")
+		self.assertEqual(wf.get_result(), [9, 4, 9])
+		self.assertEqual(frappe.db.count("Press Workflow Task", {"workflow": wf.name}), 3)
+
+	def test_run_replays_again_when_tasks_finish_during_the_replay(self):
+		with patch("press.workflow_engine.doctype.press_workflow_task.press_workflow_task.enqueue_task"):
+			wf = self._run_workflow("main_with_mapped_tasks", ["square"])
+		wf.reload()
+		replays = wf.replay_count
+		replay = wf.replay
+		tasks = frappe.get_all("Press Workflow Task", {"workflow": wf.name}, pluck="name")
+
+		def replay_while_tasks_finish():
+			replay()
+			if not tasks:
+				return
+			# Their enqueue_workflow is dropped while this run's job still holds the job id
+			with patch(
+				"press.workflow_engine.doctype.press_workflow_task.press_workflow_task.enqueue_workflow"
+			) as enqueue_workflow:
+				while tasks:
+					frappe.get_doc("Press Workflow Task", tasks.pop()).run()
+			enqueue_workflow.assert_called_with(wf.name, resume=True)
+			frappe.cache.set_value(get_resume_key(wf.name), 1)
+
+		with patch.object(wf, "replay", side_effect=replay_while_tasks_finish):
+			wf.run()
+
+		self.assertEqual(wf.status, "Success")
+		self.assertEqual(wf.get_result(), [9, 4, 9])
+		self.assertEqual(wf.replay_count, replays + 2)
+
+	def test_gather_returns_results_of_different_tasks_in_order(self):
+		wf = self._run_workflow("main_with_gathered_tasks", ["add", "multiply"])
+		wf.reload()
+		self.assertEqual(wf.status, "Success")
+		self.assertEqual(wf.get_result(), [5, 6])
+
+	def test_gather_outside_workflow_runs_calls_directly(self):
+		self.assertEqual(self.doc.main_with_gathered_tasks(), [5, 6])
+		self.assertEqual(self.doc.square.map([1, 2]), [1, 4])
+		self.assertFalse(frappe.db.count("Press Workflow Task"))
+
+	def test_replay_serves_completed_tasks_from_preloaded_results(self):
+		wf = self._run_workflow("main_as_flow", ["sample_task", "sample_nested_task"])
+		wf.reload()
+		self.assertEqual(wf.status, "Success")
+		replays = wf.replay_count
+		self.assertGreater(replays, 0)
+
+		wf.db_set("status", "Running")
+		with patch.object(frappe.db, "exists", wraps=frappe.db.exists) as exists:
+			wf.run()
+
+		task_lookups = [c for c in exists.call_args_list if c.args[0] == "Press Workflow Task"]
+		self.assertEqual(task_lookups, [])
+		self.assertEqual(wf.status, "Success")
+		self.assertEqual(wf.replay_count, replays + 1)
+		self.assertGreaterEqual(wf.total_replay_duration, wf.last_replay_duration)
+
 	def test_workflow_builder_attributes(self):
 		self.assertIsNone(self.doc.workflow_name)
 		self.assertIsNone(self.doc.workflow_doc)
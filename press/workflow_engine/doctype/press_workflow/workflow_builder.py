@@ -1,9 +1,9 @@
 # Copyright (c) 2026, Frappe and contributors
 # For license information, please see license.txt
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeVar
 
 import frappe
 from frappe.model.document import Document
@@ -36,6 +36,16 @@ if TYPE_CHECKING:
 F1 = TypeVar("F1", bound=Callable[..., Any])
 
 
+class TaskCall(NamedTuple):
+	"""A task call prepared with `.prepare()`, to be run with `WorkflowBuilder.gather`."""
+
+	wrapped: Callable[..., object]
+	args: tuple
+	kwargs: dict
+	queue: str | None = None
+	timeout: int | None = None
+
+
 def ensure_to_resolve_context(fn: F1) -> F1:
 	@wraps(fn)
 	def wrapper(self: "WorkflowBuilder", *args, **kwargs):
@@ -51,6 +61,8 @@ class WorkflowBuilder(Document):
 	kv_store_type: Literal["in_memory", "workflow_store"] = "in_memory"
 	kv_store_reference: KVStoreInterface | None = None
 	current_task_signature: str | None = None
+	# Completed tasks of the workflow by signature, loaded once per replay
+	completed_tasks: "dict[str, frappe._dict] | None" = None
 
 	@property
 	def workflow_doc(self) -> "PressWorkflow | None":
@@ -63,7 +75,7 @@ class WorkflowBuilder(Document):
 		self._workflow_doc_cache = value
 
 	@ensure_to_resolve_context
-	def run_task(  # noqa: C901
+	def run_task(
 		self,
 		wrapped: Callable[..., object],
 		args: tuple,
@@ -75,61 +87,12 @@ class WorkflowBuilder(Document):
 
 		signature = generate_function_signature(wrapped, args, kwargs)
 		if self.current_task_signature and self.current_task_signature == signature:
-			new_kwargs = kwargs.copy()
-			if not is_func_accept_task_id(wrapped):
-				new_kwargs.pop("task_id", None)
-
-			return wrapped(self, *args, **new_kwargs)
+			return self._call_task_inline(wrapped, args, kwargs)
 
-		task_name: str | None = frappe.db.exists(
-			"Press Workflow Task",
-			{
-				"workflow": self.workflow_name,
-				"signature": signature,
-			},
-		)  # type: ignore
-
-		if not task_name:
-			task_doc: PressWorkflowTask = frappe.new_doc("Press Workflow Task")  # type: ignore
-			task_doc.workflow = self.workflow_name  # type: ignore
-			task_doc.method_name = wrapped.__name__  # type: ignore
-
-			task_doc.method_title = method_title(wrapped)  # type: ignore
-
-			task_doc.signature = signature  # type: ignore
-			args_type, args_value = serialize_and_store_value(args)
-			kwargs_type, kwargs_value = serialize_and_store_value(kwargs)
-			task_doc.args = args_value
-			task_doc.args_type = args_type
-			task_doc.kwargs = kwargs_value
-			task_doc.kwargs_type = kwargs_type
-			task_doc.status = "Queued"  # type: ignore
-			task_doc.queue = queue  # type: ignore
-			task_doc.timeout = timeout or 0  # type: ignore
-
-			# If we are currently inside a running task, record it as the parent
-			# so the new task can re-enqueue it when it completes.
-			task_doc.parent_task = getattr(self.flags, "current_press_workflow_task", None)  # type: ignore
-			task_doc.insert(ignore_permissions=True)
-
-			# If workflow want to monitor this step
-			# Store the reference of the task in workflow doctype
-			# If it's a nested task, ignore it
-			if not task_doc.parent_task and (
-				tracked_step := frappe.db.exists(
-					"Press Workflow Step",
-					{
-						"parenttype": "Press Workflow",
-						"parent": self.workflow_name,
-						"step_method": wrapped.__name__,
-						"task": ("is", "not set"),
-					},
-				)
-			):
-				frappe.db.set_value("Press Workflow Step", str(tracked_step), "task", task_doc.name)
+		if completed_task := self.get_completed_task(signature):
+			return self._get_task_result(completed_task)
 
-			task_name = task_doc.name
-			assert task_name, "Task must be saved successfully before it can be run"
+		task_name = self._get_or_create_task(wrapped, args, kwargs, signature, queue, timeout)
 
 		status = frappe.db.get_value("Press Workflow Task", task_name, "status")
 		if status in ["Queued", "Running"]:
@@ -139,7 +102,142 @@ class WorkflowBuilder(Document):
 				task_name,
 			)
 
-		task_doc: PressWorkflowTask = frappe.get_doc("Press Workflow Task", task_name)  # type: ignore
+		return self._get_task_result(frappe.get_doc("Press Workflow Task", task_name))
+
+	def gather(self, *calls: TaskCall) -> list:
+		"""Runs independent tasks concurrently and returns their results in order.
+
+		All tasks are enqueued before the flow is paused, so they run side by side and the flow
+		continues once every one of them has finished. If any task failed, the first failure in
+		call order is raised. Outside a workflow the calls run one after another.
+		"""
+		if not calls:
+			return []
+		if not self.flags.in_press_workflow_execution:
+			return [self._call_task_inline(call.wrapped, call.args, call.kwargs) for call in calls]
+		return self.run_tasks(calls)
+
+	@ensure_to_resolve_context
+	def run_tasks(self, calls: Sequence[TaskCall]) -> list:
+		assert self.workflow_name is not None, "Workflow name must be set to enqueue task"
+
+		tasks: list[str | frappe._dict] = []
+		for call in calls:
+			signature = generate_function_signature(call.wrapped, call.args, call.kwargs)
+			tasks.append(
+				self.get_completed_task(signature)
+				or self._get_or_create_task(
+					call.wrapped, call.args, call.kwargs, signature, call.queue, call.timeout
+				)
+			)
+
+		if task_names := [task for task in tasks if isinstance(task, str)]:
+			pending = frappe.get_all(
+				"Press Workflow Task",
+				filters={"name": ("in", task_names), "status": ("in", ["Queued", "Running"])},
+				pluck="name",
+			)
+			if pending:
+				raise PressWorkflowTaskEnqueued(
+					f"{len(pending)} of {len(tasks)} gathered tasks are pending",
+					self.workflow_name,
+					pending[0],
+				)
+
+		return [
+			self._get_task_result(
+				frappe.get_doc("Press Workflow Task", task) if isinstance(task, str) else task
+			)
+			for task in tasks
+		]
+
+	def preload_task_results(self) -> None:
+		"""Loads the results of all completed tasks of the workflow in one query.
+
+		Replaying a flow calls every earlier task again, these are then served from memory.
+		Only Success and Failure are final, pending tasks are still looked up every time.
+		"""
+		if not self.workflow_name:
+			return
+
+		tasks = frappe.get_all(
+			"Press Workflow Task",
+			filters={"workflow": self.workflow_name, "status": ("in", ["Success", "Failure"])},
+			fields=["name", "signature", "status", "method_title", "output", "output_type", "exception"],
+		)
+		self.completed_tasks = {task.signature: task for task in tasks}
+
+	def get_completed_task(self, signature: str) -> "frappe._dict | None":
+		if self.completed_tasks is None:
+			return None
+		return self.completed_tasks.get(signature)
+
+	def _call_task_inline(self, wrapped: Callable[..., object], args: tuple, kwargs: dict) -> Any:
+		if not is_func_accept_task_id(wrapped):
+			kwargs = {k: v for k, v in kwargs.items() if k != "task_id"}
+		return wrapped(self, *args, **kwargs)
+
+	def _get_or_create_task(
+		self,
+		wrapped: Callable[..., object],
+		args: tuple,
+		kwargs: dict,
+		signature: str,
+		queue: str | None = None,
+		timeout: int | None = None,
+	) -> str:
+		task_name: str | None = frappe.db.exists(
+			"Press Workflow Task",
+			{
+				"workflow": self.workflow_name,
+				"signature": signature,
+			},
+		)  # type: ignore
+		if task_name:
+			return task_name
+
+		task_doc: PressWorkflowTask = frappe.new_doc("Press Workflow Task")  # type: ignore
+		task_doc.workflow = self.workflow_name  # type: ignore
+		task_doc.method_name = wrapped.__name__  # type: ignore
+
+		task_doc.method_title = method_title(wrapped)  # type: ignore
+
+		task_doc.signature = signature  # type: ignore
+		args_type, args_value = serialize_and_store_value(args)
+		kwargs_type, kwargs_value = serialize_and_store_value(kwargs)
+		task_doc.args = args_value
+		task_doc.args_type = args_type
+		task_doc.kwargs = kwargs_value
+		task_doc.kwargs_type = kwargs_type
+		task_doc.status = "Queued"  # type: ignore
+		task_doc.queue = queue  # type: ignore
+		task_doc.timeout = timeout or 0  # type: ignore
+
+		# If we are currently inside a running task, record it as the parent
+		# so the new task can re-enqueue it when it completes.
+		task_doc.parent_task = getattr(self.flags, "current_press_workflow_task", None)  # type: ignore
+		task_doc.insert(ignore_permissions=True)
+
+		# If workflow want to monitor this step
+		# Store the reference of the task in workflow doctype
+		# If it's a nested task, ignore it
+		if not task_doc.parent_task and (
+			tracked_step := frappe.db.exists(
+				"Press Workflow Step",
+				{
+					"parenttype": "Press Workflow",
+					"parent": self.workflow_name,
+					"step_method": wrapped.__name__,
+					"task": ("is", "not set"),
+				},
+			)
+		):
+			frappe.db.set_value("Press Workflow Step", str(tracked_step), "task", task_doc.name)
+
+		assert task_doc.name, "Task must be saved successfully before it can be run"
+		return task_doc.name
+
+	def _get_task_result(self, task_doc: "PressWorkflowTask | frappe._dict") -> Any:
 		if task_doc.status == "Success":
 			return deserialize_value(task_doc.output_type, task_doc.output)
 
@@ -0,0 +1,151 @@
+# Copyright (c) 2026, Frappe and contributors
+# For license information, please see license.txt
+"""Storage tiers for the pickled payload of Press Workflow Objects."""
+
+from __future__ import annotations
+
+import abc
+import base64
+import contextlib
+import os
+import time
+import zlib
+
+import frappe
+from frappe.utils.synchronization import filelock
+
+# Pickles smaller than this rarely shrink enough to be worth compressing
+COMPRESSION_THRESHOLD = 1024
+COMPRESSION_LEVEL = 6
+# Payloads larger than this are kept out of the database, overridable from site config
+FILE_STORAGE_THRESHOLD = 256 * 1024
+# Files modified more recently than this may belong to an object whose transaction is still open
+FILE_GRACE_PERIOD = 60 * 60
+
+
+class ObjectStore(abc.ABC):
+	@abc.abstractmethod
+	def put(self, content_hash: str, payload: bytes) -> str | None:
+		"""Stores the payload, returns the value to keep in the object's `serialized` field."""
+
+	@abc.abstractmethod
+	def get(self, content_hash: str, serialized: str | None) -> bytes | None:
+		pass
+
+	@abc.abstractmethod
+	def delete(self, content_hash: str):
+		pass
+
+
+class DatabaseObjectStore(ObjectStore):
+	def put(self, content_hash: str, payload: bytes) -> str | None:
+		return base64.b64encode(payload).decode("ascii")
+
+	def get(self, content_hash: str, serialized: str | None) -> bytes | None:
+		if not serialized:
+			return None
+		return base64.b64decode(serialized.encode("ascii"))
+
+	def delete(self, content_hash: str):
+		# Payload goes away with the row
+		pass
+
+
+class FileObjectStore(ObjectStore):
+	"""Content addressed files in the site's private folder, objects with equal payloads share a file.
+
+	Unreferenced files are removed once they haven't been written for `FILE_GRACE_PERIOD`. `put`
+	refreshes the modification time of a file it reuses, so a file an open transaction has just
+	referenced is kept, as is one written by a transaction that may still commit.
+	"""
+
+	def put(self, content_hash: str, payload: bytes) -> str | None:
+		path = self.get_path(content_hash)
+		with self.lock(content_hash):
+			try:
+				os.utime(path)
+				return None
+			except FileNotFoundError:
+				pass
+
+			os.makedirs(os.path.dirname(path), exist_ok=True)
+			temporary_path = f"{path}.{os.getpid()}.tmp"
+			with open(temporary_path, "wb") as f:
+				f.write(payload)
+			os.replace(temporary_path, path)
+		return None
+
+	def get(self, content_hash: str, serialized: str | None) -> bytes | None:
+		try:
+			with open(self.get_path(content_hash), "rb") as f:
+				return f.read()
+		except FileNotFoundError:
+			return None
+
+	def delete(self, content_hash: str):
+		with self.lock(content_hash), contextlib.suppress(FileNotFoundError):
+			os.remove(self.get_path(content_hash))
+
+	def get_stale_hashes(self) -> list[str]:
+		"""Hashes of files not written for `FILE_GRACE_PERIOD`."""
+		root = frappe.get_site_path("private", "workflow_objects")
+		if not os.path.isdir(root):
+			return []
+
+		cutoff = time.time() - FILE_GRACE_PERIOD
+		hashes = []
+		for directory in os.scandir(root):
+			if not directory.is_dir():
+				continue
+			for entry in os.scandir(directory.path):
+				if not entry.name.endswith(".tmp") and entry.stat().st_mtime < cutoff:
+					hashes.append(entry.name)
+		return hashes
+
+	def delete_stale(self, content_hashes: set[str]):
+		"""Removes the files of `content_hashes` that are still stale."""
+		cutoff = time.time() - FILE_GRACE_PERIOD
+		for content_hash in content_hashes:
+			path = self.get_path(content_hash)
+			with self.lock(content_hash), contextlib.suppress(FileNotFoundError):
+				# A `put` may have reused the file since it was listed
+				if os.stat(path).st_mtime < cutoff:
+					os.remove(path)
+
+	def get_path(self, content_hash: str) -> str:
+		return frappe.get_site_path("private", "workflow_objects", content_hash[:2], content_hash)
+
+	def lock(self, content_hash: str):
+		return filelock(f"workflow_object_{content_hash}")
+
+
+STORES: dict[str, ObjectStore] = {
+	"Database": DatabaseObjectStore(),
+	"File": FileObjectStore(),
+}
+
+
+def get_store(storage: str | None) -> ObjectStore:
+	return STORES[storage or "Database"]
+
+
+def get_storage_for(payload_size: int) -> str:
+	threshold = frappe.conf.get("press_workflow_object_file_threshold") or FILE_STORAGE_THRESHOLD
+	return "File" if payload_size > threshold else "Database"
+
+
+def compress(data: bytes) -> tuple[bytes, str]:
+	"""Returns the payload to store and the compression used for it."""
+	if len(data) < COMPRESSION_THRESHOLD:
+		return data, ""
+
+	compressed = zlib.compress(data, COMPRESSION_LEVEL)
+	if len(compressed) >= len(data):
+		return data, ""
+	return compressed, "zlib"
+
+
+def decompress(payload: bytes, compression: str | None) -> bytes:
+	if compression == "zlib":
+		return zlib.decompress(payload)
+	return payload
@@ -2,13 +2,22 @@
 # For license information, please see license.txt
 from __future__ import annotations
 
-import base64
+import hashlib
 import pickle
 from typing import Any
 
 import frappe
 from frappe.model.document import Document
-from frappe.utils import strip_html_tags
+from frappe.query_builder.functions import Count, Sum
+from frappe.utils import add_to_date, create_batch, strip_html_tags
+
+from press.workflow_engine.doctype.press_workflow_object.object_store import (
+	FileObjectStore,
+	compress,
+	decompress,
+	get_storage_for,
+	get_store,
+)
 
 
 class ObjectSerializeError(frappe.ValidationError):
@@ -42,9 +51,14 @@ class PressWorkflowObject(Document):
 	if TYPE_CHECKING:
 		from frappe.types import DF
 
+		compression: DF.Literal["", "zlib"]
+		content_hash: DF.Data | None
 		deleted: DF.Check
 		serialization_failed: DF.Check
 		serialized: DF.LongText | None
+		size: DF.Int
+		storage: DF.Literal["Database", "File"]
+		stored_size: DF.Int
 		summary: DF.Data
 		type_qualname: DF.Data
 	# end: auto-generated types
@@ -94,7 +108,7 @@ class PressWorkflowObject(Document):
 		doc.summary = summary
 
 		try:
-			doc.serialized = base64.b64encode(pickle.dumps(obj)).decode("ascii")
+			pickled = pickle.dumps(obj)
 		except Exception as exc:
 			if throw_on_error:
 				raise ObjectSerializeError(
@@ -103,10 +117,20 @@ class PressWorkflowObject(Document):
 
 			doc.serialized = None
 			doc.serialization_failed = True
+		else:
+			doc.set_payload(pickled)
 
 		doc.insert(ignore_permissions=True)
 		return str(doc.name)
 
+	def set_payload(self, pickled: bytes):
+		payload, self.compression = compress(pickled)
+		self.size = len(pickled)
+		self.stored_size = len(payload)
+		self.content_hash = hashlib.sha256(pickled).hexdigest()
+		self.storage = get_storage_for(self.stored_size)
+		self.serialized = get_store(self.storage).put(self.content_hash, payload)
+
 	@staticmethod
 	def get_object(doc_name: str) -> Any:
 		"""
@@ -131,11 +155,12 @@ class PressWorkflowObject(Document):
 				summary=doc.summary,
 			)
 
-		if not doc.serialized:
+		payload = get_store(doc.storage).get(doc.content_hash, doc.serialized)
+		if payload is None:
 			raise ObjectDeserializeError(f"Object of type {doc.type_qualname!r} has no serialized data.")
 
 		try:
-			return pickle.loads(base64.b64decode(doc.serialized.encode("ascii")))
+			return pickle.loads(decompress(payload, doc.compression))
 		except Exception as exc:
 			raise ObjectDeserializeError(
 				f"Failed to deserialize object of type {doc.type_qualname!r}: {exc}"
@@ -169,3 +194,52 @@ class PressWorkflowObject(Document):
 
 def delete_trashed_objects():
 	frappe.db.delete("Press Workflow Object", {"deleted": 1})
+	delete_unreferenced_files()
+
+
+def delete_unreferenced_files():
+	"""Removes files no object refers to, objects with equal payloads share a file and objects
+	of rolled back transactions leave theirs behind."""
+	store = FileObjectStore()
+	stale = store.get_stale_hashes()
+	referenced = set()
+	for batch in create_batch(stale, 500):
+		referenced.update(
+			frappe.get_all(
+				"Press Workflow Object",
+				filters={"content_hash": ("in", batch), "storage": "File"},
+				pluck="content_hash",
+				distinct=True,
+			)
+		)
+	store.delete_stale(set(stale) - referenced)
+
+
+def get_object_size_stats(hours: int = 24) -> dict[str, dict[str, int]]:
+	"""Count and raw and stored bytes of objects passed to or returned by tasks, by task method."""
+	task = frappe.qb.DocType("Press Workflow Task")
+	obj = frappe.qb.DocType("Press Workflow Object")
+	since = add_to_date(None, hours=-hours)
+
+	stats: dict[str, dict[str, int]] = {}
+	for field, type_field in (("args", "args_type"), ("kwargs", "kwargs_type"), ("output", "output_type")):
+		rows = (
+			frappe.qb.from_(task)
+			.join(obj)
+			.on(obj.name == task[field])
+			.where(task.creation >= since)
+			.where(task[type_field] == "object")
+			.groupby(task.method_name)
+			.select(
+				task.method_name,
+				Count(obj.name).as_("count"),
+				Sum(obj.size).as_("size"),
+				Sum(obj.stored_size).as_("stored_size"),
+			)
+			.run(as_dict=True)
+		)
+		for row in rows:
+			method = stats.setdefault(row.method_name, {"count": 0, "size": 0, "stored_size": 0})
+			for key in method:
+				method[key] += int(row[key] or 0)
+	return stats
@@ -1,9 +1,18 @@
 # Copyright (c) 2026, Frappe and Contributors
 # See license.txt
 
+import hashlib
+import os
+import time
+from unittest.mock import patch
+
 import frappe
 from frappe.tests import IntegrationTestCase
 
+from press.workflow_engine.doctype.press_workflow_object.object_store import (
+	FILE_GRACE_PERIOD,
+	FileObjectStore,
+)
 from press.workflow_engine.doctype.press_workflow_object.press_workflow_object import (
 	ObjectPreviousSerializationFailedError,
 	ObjectSerializeError,
@@ -116,3 +125,67 @@ class IntegrationTestPressWorkflowObject(IntegrationTestCase):
 		delete_trashed_objects()
 
 		self.assertFalse(frappe.db.exists("Press Workflow Object", doc_name))
+
+	def test_large_object_is_compressed(self):
+		obj = {"sites": [f"site{i}.example.com" for i in range(1000)]}
+		doc_name = PressWorkflowObject.store(obj)
+
+		doc = frappe.get_doc("Press Workflow Object", doc_name)
+		self.assertEqual(doc.compression, "zlib")
+		self.assertLess(doc.stored_size, doc.size)
+		self.assertEqual(PressWorkflowObject.get_object(doc_name), obj)
+
+	@patch.dict(frappe.conf, {"press_workflow_object_file_threshold": 100})
+	def test_objects_above_threshold_share_a_file_until_all_are_deleted(self):
+		from press.workflow_engine.doctype.press_workflow_object.press_workflow_object import (
+			delete_trashed_objects,
+		)
+
+		obj = MyCustomClass(os.urandom(400).hex(), 42)
+		first, second = PressWorkflowObject.store(obj), PressWorkflowObject.store(obj)
+
+		doc = frappe.get_doc("Press Workflow Object", first)
+		path = FileObjectStore().get_path(doc.content_hash)
+		self.assertEqual(doc.storage, "File")
+		self.assertFalse(doc.serialized)
+		self.assertEqual(PressWorkflowObject.get_object(second), obj)
+
+		frappe.db.set_value("Press Workflow Object", first, "deleted", True)
+		make_stale(path)
+		delete_trashed_objects()
+		self.assertTrue(os.path.exists(path))
+
+		frappe.db.set_value("Press Workflow Object", second, "deleted", True)
+		delete_trashed_objects()
+		self.assertTrue(os.path.exists(path), "Recently written files are kept")
+
+		make_stale(path)
+		delete_trashed_objects()
+		self.assertFalse(os.path.exists(path))
+
+	def test_reused_file_is_not_deleted_while_its_object_may_be_uncommitted(self):
+		from press.workflow_engine.doctype.press_workflow_object.press_workflow_object import (
+			delete_unreferenced_files,
+		)
+
+		store = FileObjectStore()
+		payload = os.urandom(100)
+		content_hash = hashlib.sha256(payload).hexdigest()
+		path = store.get_path(content_hash)
+
+		# Left behind by a rolled back transaction
+		store.put(content_hash, payload)
+		make_stale(path)
+		# Reused by a transaction that hasn't committed yet
+		store.put(content_hash, payload)
+		delete_unreferenced_files()
+		self.assertTrue(os.path.exists(path))
+
+		make_stale(path)
+		delete_unreferenced_files()
+		self.assertFalse(os.path.exists(path))
+
+
+def make_stale(path: str):
+	modified = time.time() - FILE_GRACE_PERIOD - 1
+	os.utime(path, (modified, modified))
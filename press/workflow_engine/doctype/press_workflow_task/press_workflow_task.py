@@ -162,6 +162,7 @@ class PressWorkflowTask(Document):
 			if workflow_info.is_force_failure_requested:
 				raise Exception("Workflow was forcefully failed based on user request.")
 
+			reference_doc.preload_task_results()
 			with redirect_stdout(buffer):
 				result = getattr(reference_doc, self.method_name)(*args, **kwargs)
 
@@ -215,7 +216,7 @@ class PressWorkflowTask(Document):
 			enqueue_task(self.parent_task)
 		else:
 			# Top-level task -- resume the parent workflow.
-			enqueue_workflow(self.workflow)
+			enqueue_workflow(self.workflow, resume=True)
 
 
 def on_doctype_update():
@@ -80,6 +80,21 @@ class PressWorkflowTest(WorkflowBuilder):
 			result = self.multiply.with_task_id(f"mult_{i}")(result, base)
 		return result
 
+	@task
+	def square(self, n: int) -> int:
+		return n * n
+
+	@flow
+	def main_with_mapped_tasks(self):
+		return self.square.map([self.input_a, self.input_b, self.input_a])
+
+	@flow
+	def main_with_gathered_tasks(self):
+		return self.gather(
+			self.add.prepare(self.input_a, self.input_b),
+			self.multiply.prepare(self.input_a, self.input_b),
+		)
+
 	@flow
 	def main_with_task_id_loop(self):
 		return self.power(self.input_a, self.input_b)
@@ -30,6 +30,9 @@ class SelfCallVisitor(ast.NodeVisitor):
 
 	def visit_Call(self, node: ast.Call) -> None:
 		func = node.func
+		# `self.task.map(...)` and `self.task.prepare(...)` run `self.task`
+		if isinstance(func, ast.Attribute) and func.attr in ("map", "prepare"):
+			func = func.value
 		if (
 			isinstance(func, ast.Attribute)
 			and isinstance(func.value, ast.Name)